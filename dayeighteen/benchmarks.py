@@ -0,0 +1,262 @@
+"""
+Python Learning Journey - Day Eighteen
+Benchmarks for the Weather Application
+
+A local stub of the OpenWeatherMap endpoint stands in for the real API,
+so no API key or network access is needed.
+
+Run with: python benchmarks.py
+"""
+import contextlib
+import json
+from datetime import datetime, timedelta
+import os
+import random
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from weather_app import WeatherApp
+from weather_cache import WeatherCache
+from weather_history import WeatherHistory
+
+
+class StubWeatherHandler(BaseHTTPRequestHandler):
+    """Answers /data/2.5/weather?q=<city> like OpenWeatherMap, after a delay"""
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY a
+    # keep-alive client would wait on delayed ACKs for every response
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            count = server.requests
+        time.sleep(server.latency)
+
+        city = parse_qs(urlsplit(self.path).query).get("q", [""])[0]
+        if server.fail_every and count % server.fail_every == 0:
+            status, payload = 503, {"cod": 503, "message": "try again"}
+        elif city.startswith("Nowhere"):
+            status, payload = 404, {"cod": "404", "message": "city not found"}
+        else:
+            status, payload = 200, {
+                "name": city,
+                "sys": {"country": "NG"},
+                "main": {"temp": 27.5, "feels_like": 30.1, "humidity": 78, "pressure": 1011},
+                "weather": [{"description": "scattered clouds"}],
+                "wind": {"speed": 3.6},
+            }
+
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextlib.contextmanager
+def stub_server(latency=0.02, fail_every=0):
+    """Run the stub API on a free local port; yields its weather endpoint URL"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubWeatherHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.fail_every = fail_every
+    server.requests = 0
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server, f"http://127.0.0.1:{server.server_port}/data/2.5/weather"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _fetch_without_session(url, cities):
+    """Baseline: the original one-requests.get-per-city loop"""
+    for city in cities:
+        params = {"q": city, "appid": "test", "units": "metric"}
+        requests.get(url, params=params, timeout=10).json()
+
+
+def benchmark_fetch(cities=500, latency=0.02):
+    print("=" * 60)
+    print(f"WEATHER FETCH ({cities:,} cities, {latency * 1000:.0f} ms server latency)")
+    print("=" * 60)
+    names = [f"City{i}" for i in range(cities)]
+
+    with stub_server(latency) as (server, url):
+        start = time.perf_counter()
+        _fetch_without_session(url, names)
+        print(f"  requests.get per city:        {time.perf_counter() - start:8.3f} s")
+
+        with WeatherApp("test", base_url=url) as app:
+            start = time.perf_counter()
+            for city in names:
+                app.get_weather(city)
+            print(f"  get_weather (pooled session): {time.perf_counter() - start:8.3f} s")
+
+        for workers in (8, 32, 64):
+            with WeatherApp("test", base_url=url, max_workers=workers) as app:
+                start = time.perf_counter()
+                results = app.get_weather_many(names)
+                elapsed = time.perf_counter() - start
+            assert all(results.values())
+            print(f"  get_weather_many({workers:>2} workers): {elapsed:8.3f} s")
+
+    with stub_server(latency, fail_every=20) as (server, url):
+        with WeatherApp("test", base_url=url, max_workers=32, backoff=0.05) as app:
+            start = time.perf_counter()
+            errors = {}
+            results = app.get_weather_many(names + ["Nowhere1"], errors=errors)
+            elapsed = time.perf_counter() - start
+        ok = sum(data is not None for data in results.values())
+        print(f"  get_weather_many, 1 in 20 503s: {elapsed:6.3f} s"
+              f"  ({ok:,} ok, {server.requests - cities - 1:,} retries,"
+              f" errors: {list(errors.values())})")
+
+    rate = 200
+    with stub_server(latency) as (server, url):
+        with WeatherApp("test", base_url=url, max_workers=32,
+                        requests_per_second=rate) as app:
+            start = time.perf_counter()
+            app.get_weather_many(names)
+            elapsed = time.perf_counter() - start
+        # The first `rate` requests go out as a burst, the rest at `rate`/s
+        print(f"  get_weather_many, {rate}/s limit: {elapsed:6.3f} s"
+              f"  (expected >= {(cities - rate) / rate:.2f} s)")
+
+
+def _timed_lookups(app, lookups):
+    start = time.perf_counter()
+    for city in lookups:
+        app.get_weather(city)
+    return time.perf_counter() - start
+
+
+def benchmark_cache(cities=100, lookups=1000, latency=0.02):
+    """Repeated lookups (a few popular cities) with and without the cache"""
+    print("\n" + "=" * 60)
+    print(f"RESPONSE CACHE ({lookups:,} lookups over {cities} cities,"
+          f" {latency * 1000:.0f} ms server latency)")
+    print("=" * 60)
+    rng = random.Random(49)
+    names = [f"City{i}" for i in range(cities)]
+    # Skewed popularity, as with real users: a few cities get most requests
+    weights = [1 / (rank + 1) for rank in range(cities)]
+    sample = rng.choices(names, weights, k=lookups)
+
+    with stub_server(latency) as (server, url), tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "weather_cache.sqlite")
+        with WeatherApp("test", base_url=url) as app:
+            elapsed = _timed_lookups(app, sample)
+        print(f"  no cache:                    {elapsed:8.3f} s  ({server.requests:,} API calls)")
+
+        for label in ("cold cache:", "new process, shared sqlite:"):
+            server.requests = 0
+            with WeatherApp("test", base_url=url, cache=WeatherCache(path)) as app:
+                elapsed = _timed_lookups(app, sample)
+                metrics = app.cache.metrics()
+                app.cache.close()
+            print(f"  {label:<28} {elapsed:8.3f} s  ({server.requests:,} API calls,"
+                  f" hit ratio {metrics['hit_ratio']:.0%})")
+
+        cache = WeatherCache(path)
+        start = time.perf_counter()
+        for city in sample * 100:
+            cache.get(city)
+        elapsed = time.perf_counter() - start
+        cache.close()
+        print(f"  memory-tier lookup:          {elapsed / (lookups * 100) * 1e6:8.2f} us")
+
+
+def _legacy_save(weather_data, filename):
+    """Baseline: the original read-modify-write save_to_file"""
+    data_to_save = weather_data.copy()
+    data_to_save["retrieved_at"] = datetime.now().isoformat()
+    try:
+        with open(filename, "r", encoding="utf-8") as f:
+            existing_data = json.load(f)
+    except FileNotFoundError:
+        existing_data = []
+    existing_data.append(data_to_save)
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(existing_data, f, indent=2)
+
+
+def _legacy_latest(filename, city, limit):
+    with open(filename, "r", encoding="utf-8") as f:
+        history_data = json.load(f)
+    return [entry for entry in history_data if entry.get("name") == city][-limit:]
+
+
+def _reading(city):
+    return {
+        "name": city,
+        "sys": {"country": "NG"},
+        "main": {"temp": 27.5, "feels_like": 30.1, "humidity": 78, "pressure": 1011},
+        "weather": [{"description": "scattered clouds"}],
+        "wind": {"speed": 3.6},
+    }
+
+
+def benchmark_history(existing=50_000, saves=100, cities=200):
+    """Saving and querying with an existing history of `existing` readings"""
+    print("\n" + "=" * 60)
+    print(f"WEATHER HISTORY ({existing:,} existing readings, {saves} saves)")
+    print("=" * 60)
+    rng = random.Random(50)
+    start_time = datetime(2024, 1, 1)
+    names = [f"City{i}" for i in range(cities)]
+    entries = []
+    for i in range(existing):
+        entry = _reading(rng.choice(names))
+        entry["retrieved_at"] = (start_time + timedelta(minutes=15 * i)).isoformat()
+        entries.append(entry)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_file = os.path.join(tmp, "weather_history.json")
+        with open(legacy_file, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2)
+        with WeatherHistory(os.path.join(tmp, "history")) as history:
+            start = time.perf_counter()
+            history.import_json(legacy_file)
+            print(f"  import legacy file:       {time.perf_counter() - start:8.3f} s")
+
+            start = time.perf_counter()
+            for _ in range(saves):
+                _legacy_save(_reading("Lagos"), legacy_file)
+            legacy = (time.perf_counter() - start) / saves
+            start = time.perf_counter()
+            for _ in range(saves):
+                history.append(_reading("Lagos"))
+            store = (time.perf_counter() - start) / saves
+            print(f"  save, read-modify-write:  {legacy * 1000:8.2f} ms")
+            print(f"  save, append-only store:  {store * 1000:8.2f} ms")
+
+            start = time.perf_counter()
+            for city in names[:20]:
+                _legacy_latest(legacy_file, city, 5)
+            legacy = (time.perf_counter() - start) / 20
+            start = time.perf_counter()
+            for city in names[:20]:
+                history.latest(5, city)
+            store = (time.perf_counter() - start) / 20
+            print(f"  last 5 for a city, json:  {legacy * 1000:8.2f} ms")
+            print(f"  last 5 for a city, index: {store * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    benchmark_fetch()
+    benchmark_cache()
+    benchmark_history()
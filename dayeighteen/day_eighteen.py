@@ -10,16 +10,47 @@ import requests
 from datetime import datetime
 from dotenv import load_dotenv
 
+from weather_cache import WeatherCache
+
 # Load environment variables from .env file
 load_dotenv()
 
+BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
+
+# Shared response cache, opened on first use
+_weather_cache = None
+
+
+def _default_cache():
+    global _weather_cache
+    if _weather_cache is None:
+        _weather_cache = WeatherCache()
+    return _weather_cache
+
+
+def _fetch_weather(city, api_key):
+    """Request the current weather for a city and return the decoded JSON."""
+    params = {
+        "q": city,
+        "appid": api_key,
+        "units": "metric"  # Use Celsius
+    }
+    response = requests.get(BASE_URL, params=params, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
 
-def get_weather(city="Lagos"):
+def get_weather(city="Lagos", cache=None):
     """
     Fetch current weather data for a given city using OpenWeatherMap API.
 
+    Responses are cached (see weather_cache.py), so asking for the same city
+    again within the cache TTL does not call the API.
+
     Args:
         city (str): The name of the city to fetch weather for. Defaults to 'Lagos'.
+        cache (WeatherCache): Cache to use; defaults to a shared cache in
+            weather_cache.sqlite.
 
     Returns:
         dict | None: Weather data if successful, otherwise None.
@@ -31,18 +62,11 @@ def get_weather(city="Lagos"):
             "Error: Missing API key. Please add 'OPEN_WEATHER_API_KEY' to your .env file.")
         return None
 
-    base_url = "https://api.openweathermap.org/data/2.5/weather"
-    params = {
-        "q": city,
-        "appid": API_KEY,
-        "units": "metric"  # Use Celsius
-    }
+    cache = cache if cache is not None else _default_cache()
 
     try:
         print(f"\nFetching weather data for {city}...")
-        response = requests.get(base_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = cache.get_or_fetch(city, lambda name: _fetch_weather(name, API_KEY))
 
         # Extract weather details
         city_name = data.get("name", city)
@@ -77,9 +101,10 @@ def get_weather(city="Lagos"):
         return data
 
     except requests.exceptions.HTTPError as e:
-        if response.status_code == 401:
+        status_code = e.response.status_code if e.response is not None else None
+        if status_code == 401:
             print("Invalid API key. Please verify your OpenWeatherMap key.")
-        elif response.status_code == 404:
+        elif status_code == 404:
             print("City not found. Please check the spelling.")
         else:
             print(f" HTTP Error: {e}")
@@ -9,7 +9,10 @@ This Python script provides a complete command-line interface to:
 Features:
     • Reads API key from .env file (OPENWEATHER_API_KEY)
     • Handles errors gracefully (invalid city, network issues, etc.)
-    • Saves and loads data in JSON format
+    • Reuses pooled connections and fetches many cities concurrently,
+      with retries and optional rate limiting
+    • Caches responses in memory and in a shared sqlite file (weather_cache.py)
+    • Saves readings to an append-only, indexed history (weather_history.py)
     • Clean, professional console output
 
 Author: Cosmas Onyekwelu
@@ -17,31 +20,207 @@ Date: October 9, 2025
 """
 
 import requests
-import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 import os
 
+from weather_cache import WeatherCache
+from weather_history import history_directory, open_history
+
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+# Status codes worth retrying: rate limited or a transient server error
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter shared by the threads that call one host.
+
+    Each acquire() takes a token; when the bucket is empty the caller
+    reserves the next token and sleeps until it is due, so waiting threads
+    are served in order and the long-run rate never exceeds `rate`.
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        Args:
+            rate (float): Requests per second allowed on average.
+            burst (int): Requests allowed back to back (defaults to rate).
+        """
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
 class WeatherApp:
     """
     A class that interacts with the OpenWeatherMap API to retrieve,
     display, and store weather data.
+
+    All requests go through one requests.Session, so connections to the API
+    are kept alive and reused instead of being opened per request, and
+    get_weather_many() can fetch many cities concurrently.
     """
 
-    def __init__(self, api_key):
+    def __init__(self, api_key, base_url="http://api.openweathermap.org/data/2.5/weather",
+                 max_workers=16, max_retries=2, backoff=0.5, requests_per_second=None,
+                 timeout=10, cache=None, history=None, max_backoff=30.0):
         """
         Initialize the WeatherApp with the API key.
 
         Args:
             api_key (str): The OpenWeatherMap API key.
+            base_url (str): Weather endpoint (override to use a test server).
+            max_workers (int): Concurrent requests in get_weather_many; also
+                the size of the connection pool.
+            max_retries (int): Retries after timeouts, connection errors
+                (except SSL and proxy errors), 429 and 5xx responses.
+            backoff (float): Base delay in seconds for retries; attempt n
+                waits a random time up to backoff * 2**n ("full jitter").
+            requests_per_second (float): Per-host rate limit (None = no limit).
+            timeout (float): Seconds to wait for the server on each attempt.
+            cache (WeatherCache): Response cache consulted before the API
+                (None = always fetch).
+            history (WeatherHistory): Store used by save_to_file when no
+                filename is given (default: open_history() on first save).
+            max_backoff (float): Longest wait before a retry, also capping
+                the server's Retry-After.
         """
         self.api_key = api_key
-        self.base_url = "http://api.openweathermap.org/data/2.5/weather"
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.requests_per_second = requests_per_second
+        self.timeout = timeout
+        self.cache = cache
+        self.history = history
+        # Stores opened by save_to_file for explicit filenames
+        self._file_histories = {}
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers,
+                              pool_block=True)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._limiters = {}
+        self._limiters_lock = threading.Lock()
+
+    def close(self):
+        """Close the pooled connections and the history stores opened by name."""
+        self.session.close()
+        for history in self._file_histories.values():
+            history.close()
+        self._file_histories.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _limiter(self, url):
+        """The RateLimiter for url's host, or None without a rate limit."""
+        if not self.requests_per_second:
+            return None
+        host = urlsplit(url).netloc
+        with self._limiters_lock:
+            if host not in self._limiters:
+                self._limiters[host] = RateLimiter(self.requests_per_second)
+            return self._limiters[host]
+
+    def _retry_delay(self, attempt, response=None):
+        """Seconds to wait before retry number `attempt` (0-based)."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.max_backoff)
+        return random.uniform(0, min(self.backoff * 2 ** attempt, self.max_backoff))
+
+    def _request(self, city_name):
+        """
+        Fetch one city, retrying transient failures.
+
+        Returns:
+            dict: The decoded weather data.
+
+        Raises:
+            requests.exceptions.RequestException: When all attempts failed
+                (the HTTPError of the last response for error statuses).
+        """
+        params = {
+            "q": city_name,
+            "appid": self.api_key,
+            "units": "metric"
+        }
+        limiter = self._limiter(self.base_url)
+
+        for attempt in range(self.max_retries + 1):
+            if limiter is not None:
+                limiter.acquire()
+            response = None
+            try:
+                response = self.session.get(self.base_url, params=params,
+                                            timeout=self.timeout)
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response.json()
+                if attempt == self.max_retries:
+                    response.raise_for_status()
+            except (requests.exceptions.SSLError, requests.exceptions.ProxyError):
+                # Connection errors that retrying will not fix
+                raise
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+                if attempt == self.max_retries:
+                    raise
+            time.sleep(self._retry_delay(attempt, response))
+
+    def _fetch(self, city_name):
+        """Fetch one city through the cache, if there is one."""
+        if self.cache is None:
+            return self._request(city_name)
+        return self.cache.get_or_fetch(city_name, self._request)
+
+    @staticmethod
+    def _describe_error(err):
+        """User-facing message for a failed request."""
+        if isinstance(err, requests.exceptions.Timeout):
+            return "Error: Request timed out. Please try again later."
+        if isinstance(err, requests.exceptions.ConnectionError):
+            return "Error: Network connection issue. Check your internet connection."
+        if isinstance(err, requests.exceptions.HTTPError):
+            if err.response is not None and err.response.status_code == 401:
+                return "Error: Invalid API key. Please verify your key in the .env file."
+            if err.response is not None and err.response.status_code == 404:
+                return "Error: City not found. Please check the city name."
+            return f"HTTP error occurred: {err}"
+        return f"Unexpected error: {err}"
 
     def get_weather(self, city_name):
         """
@@ -53,33 +232,49 @@ class WeatherApp:
         Returns:
             dict | None: Weather data if successful, otherwise None.
         """
-        params = {
-            "q": city_name,
-            "appid": self.api_key,
-            "units": "metric"
-        }
-
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-
-        except requests.exceptions.Timeout:
-            print("Error: Request timed out. Please try again later.")
-        except requests.exceptions.ConnectionError:
-            print("Error: Network connection issue. Check your internet connection.")
-        except requests.exceptions.HTTPError as err:
-            if response.status_code == 401:
-                print("Error: Invalid API key. Please verify your key in the .env file.")
-            elif response.status_code == 404:
-                print("Error: City not found. Please check the city name.")
-            else:
-                print(f"HTTP error occurred: {err}")
+            return self._fetch(city_name)
         except Exception as err:
-            print(f"Unexpected error: {err}")
-
+            print(self._describe_error(err))
         return None
 
+    def get_weather_many(self, cities, errors=None):
+        """
+        Fetch weather data for many cities concurrently.
+
+        Requests run on a thread pool of max_workers threads sharing the
+        session's connection pool, subject to the per-host rate limit and
+        retry policy. Duplicate city names are fetched once.
+
+        Args:
+            cities (iterable): City names.
+            errors (dict): Optional dict that receives {city: error message}
+                for the cities that failed.
+
+        Returns:
+            dict: {city: weather data}, with None for cities that failed,
+            in the order the cities were given.
+        """
+        cities = list(dict.fromkeys(cities))
+        results = dict.fromkeys(cities)
+        if not cities:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(cities))) as pool:
+            futures = {pool.submit(self._fetch, city): city for city in cities}
+            for future in as_completed(futures):
+                city = futures[future]
+                try:
+                    results[city] = future.result()
+                except Exception as err:
+                    if errors is not None:
+                        errors[city] = self._describe_error(err)
+
+        failed = sum(data is None for data in results.values())
+        if failed:
+            print(f"Could not fetch weather for {failed} of {len(cities)} cities.")
+        return results
+
     def display_weather(self, weather_data):
         """
         Display weather information in a readable format.
@@ -116,61 +311,80 @@ class WeatherApp:
         except KeyError as err:
             print(f"Error: Missing expected data field ({err}).")
 
-    def save_to_file(self, weather_data, filename="weather_history.json"):
+    def save_to_file(self, weather_data, filename=None, history=None):
         """
-        Save fetched weather data to a JSON file.
+        Save fetched weather data to the weather history.
+
+        Each save appends one record to the append-only history store
+        (weather_history.py), so it costs the same however long the
+        history is.
 
         Args:
             weather_data (dict): The weather data dictionary.
-            filename (str): The filename to save to.
+            filename (str): History file name, e.g. "weather_history.json".
+                Readings are stored in the directory of the same name
+                without the extension, which imports an existing file of
+                that name on first use. Defaults to the app's store.
+            history (WeatherHistory): Store to save to (takes precedence
+                over filename).
         """
         try:
-            # Include a timestamp for tracking
-            data_to_save = weather_data.copy()
-            data_to_save["retrieved_at"] = datetime.now().isoformat()
+            if history is None:
+                history = self._history_store(filename)
 
-            try:
-                with open(filename, "r", encoding="utf-8") as f:
-                    existing_data = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                existing_data = []
+            # append() adds the retrieved_at timestamp
+            history.append(weather_data)
 
-            # Ensure list format
-            if not isinstance(existing_data, list):
-                existing_data = [existing_data]
-
-            existing_data.append(data_to_save)
-
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(existing_data, f, indent=2)
-
-            print(f"Weather data saved successfully to {filename}.")
+            print(f"Weather data saved successfully to {history.directory}/.")
 
         except Exception as err:
             print(f"Error saving to file: {err}")
 
-
-def display_weather_history(filename="weather_history.json"):
+    def _history_store(self, filename):
+        """The app's store (filename None) or the store for a history file."""
+        if filename is None:
+            if self.history is None:
+                self.history = open_history()
+            return self.history
+        history = self._file_histories.get(filename)
+        if history is None:
+            history = open_history(history_directory(filename), legacy_file=filename)
+            self._file_histories[filename] = history
+        return history
+
+
+def display_weather_history(filename="weather_history.json", city=None, limit=5,
+                            history=None):
     """
     Display previously saved weather history.
 
+    Only the requested readings are read, via the history index.
+
     Args:
-        filename (str): The history file to read from.
+        filename (str): History file name; its store is opened as in
+            WeatherApp.save_to_file.
+        city (str): Only show readings for this city.
+        limit (int): Number of most recent readings to show.
+        history (WeatherHistory): An open store to read instead of filename.
     """
+    opened = None
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            history_data = json.load(f)
+        if history is None:
+            history = opened = open_history(history_directory(filename),
+                                            legacy_file=filename)
+        history_data = history.latest(limit, city)
 
         if not history_data:
-            print("No weather history available.")
+            print(f"No weather history available{f' for {city}' if city else ''}.")
             return
 
         print("\n" + "=" * 50)
-        print("WEATHER HISTORY")
+        print("WEATHER HISTORY" + (f" — {city}" if city else ""))
         print("=" * 50)
 
-        for i, entry in enumerate(history_data[-5:], 1):
-            city = entry.get("name", "Unknown")
+        # latest() is newest first; list oldest first, as saved
+        for i, entry in enumerate(reversed(history_data), 1):
+            city_name = entry.get("name", "Unknown")
             country = entry.get("sys", {}).get("country", "Unknown")
             temp = entry.get("main", {}).get("temp", "Unknown")
             timestamp = entry.get("retrieved_at", "Unknown")
@@ -181,14 +395,15 @@ def display_weather_history(filename="weather_history.json"):
             except Exception:
                 formatted_time = "Unknown time"
 
-            print(f"{i}. {city}, {country} - {temp}°C (Saved at {formatted_time})")
+            print(f"{i}. {city_name}, {country} - {temp}°C (Saved at {formatted_time})")
 
         print("=" * 50)
 
-    except FileNotFoundError:
-        print("No weather history file found.")
     except Exception as err:
         print(f"Error reading history: {err}")
+    finally:
+        if opened is not None:
+            opened.close()
 
 
 def temperature_conversion():
@@ -229,7 +444,8 @@ def main():
         print("Error: Missing API key. Please add OPENWEATHER_API_KEY to your .env file.")
         return
 
-    weather_app = WeatherApp(api_key)
+    history = open_history()
+    weather_app = WeatherApp(api_key, cache=WeatherCache(), history=history)
 
     print("==========================================")
     print("        WEATHER APPLICATION (CLI)         ")
@@ -262,7 +478,8 @@ def main():
                     weather_app.save_to_file(weather_data)
 
         elif choice == "2":
-            display_weather_history()
+            city = input("Filter by city (press Enter for all): ").strip()
+            display_weather_history(city=city or None, history=history)
 
         elif choice == "3":
             temperature_conversion()
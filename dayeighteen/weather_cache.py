@@ -0,0 +1,265 @@
+"""
+Weather Response Cache
+----------------------
+Two-tier TTL cache for weather API responses, so a city fetched a moment
+ago is not fetched again.
+
+Tiers:
+    • Memory: an LRU of recently used cities, private to the process
+    • Disk: a sqlite database shared by every process using the same file
+
+An entry is fresh for `ttl` seconds. After that it stays usable for another
+`stale_ttl` seconds: it is returned immediately while a background thread
+fetches a new copy (stale-while-revalidate). Older entries are misses.
+
+Keys are normalized city names, so "Lagos", " lagos " and "LAGOS" share
+one entry. Concurrent misses on one city share a single fetch. Hit/miss
+counters are available from metrics().
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+def normalize_city(city_name):
+    """Cache key for a city: trimmed, single-spaced and case-folded."""
+    return " ".join(city_name.split()).casefold()
+
+
+class CacheMetrics:
+    """Counters describing how a WeatherCache has been used"""
+
+    def __init__(self):
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.evictions = 0
+
+    def to_dict(self):
+        lookups = self.memory_hits + self.disk_hits + self.stale_hits + self.misses
+        hits = lookups - self.misses
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'refreshes': self.refreshes,
+            'refresh_errors': self.refresh_errors,
+            'evictions': self.evictions,
+            'hit_ratio': hits / lookups if lookups else 0.0,
+        }
+
+
+class WeatherCache:
+    """
+    In-process LRU in front of a shared sqlite table, both with per-entry TTLs.
+
+    Cached values are returned as stored; callers should copy before
+    modifying them (WeatherApp.save_to_file already does).
+    """
+
+    def __init__(self, path="weather_cache.sqlite", ttl=600, stale_ttl=3600,
+                 max_entries=1024):
+        """
+        Args:
+            path (str): sqlite file for the shared tier (None = memory only).
+            ttl (float): Seconds an entry is fresh.
+            stale_ttl (float): Further seconds a stale entry may be served
+                while it is refreshed in the background (0 disables this).
+            max_entries (int): Size of the in-memory LRU.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.stats = CacheMetrics()
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._refresher = None
+        # Fetches in progress for misses, by key: later misses wait on these
+        self._inflight = {}
+
+        self._db = None
+        if path is not None:
+            # One connection shared by this process's threads (under _lock);
+            # WAL lets other processes read while one of them writes
+            self._db = sqlite3.connect(path, timeout=10, check_same_thread=False,
+                                       isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS weather_cache ("
+                "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, value TEXT NOT NULL)")
+            self._db.execute("DELETE FROM weather_cache WHERE stored_at < ?",
+                             (time.time() - self.ttl - self.stale_ttl,))
+
+    def close(self):
+        """Wait for background refreshes and close the database."""
+        if self._refresher is not None:
+            self._refresher.shutdown(wait=True)
+            self._refresher = None
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def metrics(self):
+        """Hit/miss counters and the overall hit ratio."""
+        with self._lock:
+            return self.stats.to_dict()
+
+    def _remember(self, key, stored_at, value):
+        """Put an entry in the memory tier (caller holds _lock)."""
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _lookup(self, key, now):
+        """
+        Return (value, age) from memory, then disk; (None, None) if absent.
+
+        A stale memory entry is only used if the disk tier has nothing
+        newer (another process may have refreshed it). Entries past
+        ttl + stale_ttl are treated as absent.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                return entry[1], now - entry[0]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT stored_at, value FROM weather_cache WHERE key = ?",
+                    (key,)).fetchone()
+                if row is not None and (entry is None or row[0] > entry[0]):
+                    entry = (row[0], json.loads(row[1]))
+                    if now - entry[0] < self.ttl + self.stale_ttl:
+                        self._remember(key, *entry)
+                    if now - entry[0] < self.ttl:
+                        self.stats.disk_hits += 1
+                        return entry[1], now - entry[0]
+
+            if entry is None or now - entry[0] >= self.ttl + self.stale_ttl:
+                return None, None
+            if key in self._memory:
+                self._memory.move_to_end(key)
+            return entry[1], now - entry[0]
+
+    def get(self, city_name):
+        """Fresh cached value for a city, or None (stale entries count as misses)."""
+        value, age = self._lookup(normalize_city(city_name), time.time())
+        if value is not None and age < self.ttl:
+            return value
+        with self._lock:
+            self.stats.misses += 1
+        return None
+
+    def put(self, city_name, value):
+        """Store a value in both tiers."""
+        self._store(normalize_city(city_name), value)
+
+    def _store(self, key, value):
+        stored_at = time.time()
+        with self._lock:
+            self._remember(key, stored_at, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO weather_cache (key, stored_at, value) "
+                    "VALUES (?, ?, ?)", (key, stored_at, json.dumps(value)))
+
+    def invalidate(self, city_name):
+        """Drop a city from both tiers."""
+        key = normalize_city(city_name)
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._db is not None:
+                self._db.execute("DELETE FROM weather_cache WHERE key = ?", (key,))
+
+    def get_or_fetch(self, city_name, fetch):
+        """
+        Return the cached value for a city, calling fetch(city_name) on a miss.
+
+        A stale entry is returned as is and refreshed on a background thread
+        (at most one refresh per city at a time). Concurrent misses on the
+        same city make one fetch() call and all get its result. fetch()
+        results that are None are not cached; exceptions from fetch()
+        propagate to every caller waiting on a miss and are counted in
+        refresh_errors during a background refresh.
+        """
+        key = normalize_city(city_name)
+        value, age = self._lookup(key, time.time())
+        if value is not None:
+            if age < self.ttl:
+                return value
+            with self._lock:
+                self.stats.stale_hits += 1
+                start_refresh = key not in self._refreshing
+                if start_refresh:
+                    self._refreshing.add(key)
+                    if self._refresher is None:
+                        self._refresher = ThreadPoolExecutor(
+                            max_workers=2, thread_name_prefix="weather-cache-refresh")
+            if start_refresh:
+                self._refresher.submit(self._refresh, key, city_name, fetch)
+            return value
+
+        with self._lock:
+            self.stats.misses += 1
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = self._inflight[key] = Future()
+                leader = True
+            else:
+                self.stats.coalesced += 1
+                leader = False
+        if not leader:
+            return pending.result()
+
+        try:
+            value = fetch(city_name)
+            if value is not None:
+                self._store(key, value)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(value)
+        finally:
+            with self._lock:
+                del self._inflight[key]
+        return value
+
+    def _refresh(self, key, city_name, fetch):
+        try:
+            value = fetch(city_name)
+        except Exception:
+            value = None
+        with self._lock:
+            self._refreshing.discard(key)
+            if value is None:
+                self.stats.refresh_errors += 1
+            else:
+                self.stats.refreshes += 1
+        if value is not None:
+            self._store(key, value)
@@ -0,0 +1,351 @@
+"""
+Weather History Store
+---------------------
+Append-only storage for saved weather readings.
+
+Layout (inside the history directory):
+    • 2025-10.jsonl, 2025-11.jsonl, ...  one JSON record per line, one file
+      per month (or per day), only ever appended to
+    • index.sqlite  city, timestamp and file position of every record
+
+Saving a reading appends one line and one index row, however long the
+history is. Queries such as "last 5 readings for Lagos" read the matching
+index rows and then only those lines from the files.
+
+The JSONL files are the source of truth: the index is rebuilt from them if
+it is deleted, and lines written by a process that crashed before updating
+the index are indexed the next time the store is opened. Several processes
+may append at once; appends are serialized by the index's write lock.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from weather_cache import normalize_city
+
+PARTITION_FORMATS = {"month": "%Y-%m", "day": "%Y-%m-%d"}
+
+
+class WeatherHistory:
+    """
+    Time-partitioned JSONL history of weather readings with a sqlite index.
+    """
+
+    def __init__(self, directory="weather_history", partition="month"):
+        """
+        Args:
+            directory (str): Folder holding the partition files and index.
+            partition (str): "month" or "day": how readings are split into files.
+        """
+        if partition not in PARTITION_FORMATS:
+            raise ValueError(f"partition must be one of {sorted(PARTITION_FORMATS)}")
+        self.directory = directory
+        self.partition_format = PARTITION_FORMATS[partition]
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._files = {}
+        self._db = sqlite3.connect(os.path.join(directory, "index.sqlite"), timeout=10,
+                                   check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS records ("
+            "  id INTEGER PRIMARY KEY, city TEXT NOT NULL, ts REAL NOT NULL,"
+            "  partition TEXT NOT NULL, offset INTEGER NOT NULL, length INTEGER NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS records_city_ts ON records (city, ts);"
+            "CREATE INDEX IF NOT EXISTS records_ts ON records (ts);"
+            "CREATE TABLE IF NOT EXISTS partitions ("
+            "  name TEXT PRIMARY KEY, indexed_bytes INTEGER NOT NULL);")
+        self._recover()
+
+    def close(self):
+        """Close the open partition files and the index."""
+        with self._lock:
+            for fd in self._files.values():
+                os.close(fd)
+            self._files.clear()
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def _path(self, partition):
+        return os.path.join(self.directory, partition + ".jsonl")
+
+    def _partition_fd(self, partition):
+        """Append-mode descriptor for a partition file (caller holds _lock)."""
+        fd = self._files.get(partition)
+        if fd is None:
+            fd = os.open(self._path(partition),
+                         os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0),
+                         0o666)
+            self._files[partition] = fd
+        return fd
+
+    # --- Writing ---
+    def append(self, weather_data, retrieved_at=None):
+        """
+        Append one reading.
+
+        Args:
+            weather_data (dict): API response to store.
+            retrieved_at (datetime): When it was fetched (default: now).
+
+        Returns:
+            dict: The stored record (weather_data plus "retrieved_at").
+        """
+        retrieved_at = retrieved_at or datetime.now()
+        record = dict(weather_data)
+        record["retrieved_at"] = retrieved_at.isoformat()
+        self._append_many([(record, retrieved_at)])
+        return record
+
+    def _append_many(self, items, only_if_empty=False):
+        """
+        Append (record, datetime) pairs in one index transaction.
+
+        With only_if_empty nothing is written if the store already has
+        readings; returns whether the items were appended.
+        """
+        with self._lock:
+            # BEGIN IMMEDIATE takes the index write lock, so no other process
+            # appends between reading a file's size (or checking that the
+            # store is empty) and writing the line
+            self._db.execute("BEGIN IMMEDIATE")
+            original = {}
+            try:
+                if only_if_empty and self._db.execute(
+                        "SELECT 1 FROM records LIMIT 1").fetchone():
+                    self._db.execute("ROLLBACK")
+                    return False
+                sizes = {}
+                for record, retrieved_at in items:
+                    partition = retrieved_at.strftime(self.partition_format)
+                    fd = self._partition_fd(partition)
+                    if partition not in sizes:
+                        sizes[partition] = original[partition] = os.fstat(fd).st_size
+                    data = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+                    os.write(fd, data)
+                    self._db.execute(
+                        "INSERT INTO records (city, ts, partition, offset, length) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (normalize_city(record.get("name") or ""), retrieved_at.timestamp(),
+                         partition, sizes[partition], len(data)))
+                    sizes[partition] += len(data)
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO partitions (name, indexed_bytes) VALUES (?, ?)",
+                    sizes.items())
+                self._db.execute("COMMIT")
+                return True
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                # Cut off the lines written in this transaction so none is
+                # left without its index row (if truncating fails, _recover
+                # indexes them the next time the store is opened)
+                for partition, size in original.items():
+                    try:
+                        os.ftruncate(self._files[partition], size)
+                    except OSError:
+                        pass
+                raise
+
+    def import_json(self, filename, only_if_empty=False):
+        """
+        Append the readings of a legacy weather_history.json (a JSON list).
+        Entries that are not JSON objects are skipped.
+
+        Args:
+            filename (str): The legacy file.
+            only_if_empty (bool): Import only into a store without readings,
+                checked under the same index lock as the import, so that
+                processes opening the store at once import the file once.
+
+        Returns:
+            tuple: (readings imported, entries skipped); (0, 0) if
+                only_if_empty and the store already had readings.
+        """
+        with open(filename, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        if not isinstance(entries, list):
+            entries = [entries]
+
+        items = []
+        skipped = 0
+        for entry in entries:
+            if not isinstance(entry, dict):
+                skipped += 1
+                continue
+            try:
+                retrieved_at = datetime.fromisoformat(entry["retrieved_at"])
+            except (KeyError, TypeError, ValueError):
+                retrieved_at = datetime.now()
+                entry = dict(entry, retrieved_at=retrieved_at.isoformat())
+            items.append((entry, retrieved_at))
+        if items and not self._append_many(items, only_if_empty):
+            return 0, 0
+        return len(items), skipped
+
+    # --- Index maintenance ---
+    def _recover(self):
+        """Index lines the index does not know about yet (crash or lost index)."""
+        # Under the index write lock no other process is appending meanwhile
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            indexed = dict(self._db.execute("SELECT name, indexed_bytes FROM partitions"))
+            for name in sorted(os.listdir(self.directory)):
+                if not name.endswith(".jsonl"):
+                    continue
+                partition = name[:-len(".jsonl")]
+                start = indexed.get(partition, 0)
+                if os.path.getsize(self._path(partition)) > start:
+                    self._index_tail(partition, start)
+            self._db.execute("COMMIT")
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+
+    def _index_tail(self, partition, start):
+        """Index a partition file from byte `start` to its end."""
+        path = self._path(partition)
+        rows = []
+        torn = False
+        with open(path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if not line.endswith(b"\n"):
+                    torn = True
+                    break
+                try:
+                    record = json.loads(line)
+                    ts = datetime.fromisoformat(record["retrieved_at"]).timestamp()
+                except (ValueError, KeyError, TypeError):
+                    offset += len(line)
+                    continue
+                rows.append((normalize_city(record.get("name") or ""), ts, partition,
+                             offset, len(line)))
+                offset += len(line)
+        if torn:
+            # A partial final line from an interrupted write: drop it so the
+            # next append starts on a fresh line
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+
+        self._db.executemany(
+            "INSERT INTO records (city, ts, partition, offset, length) VALUES (?, ?, ?, ?, ?)",
+            rows)
+        self._db.execute(
+            "INSERT OR REPLACE INTO partitions (name, indexed_bytes) VALUES (?, ?)",
+            (partition, offset))
+
+    def rebuild_index(self):
+        """Drop the index and rebuild it from the partition files."""
+        with self._lock:
+            self._db.execute("DELETE FROM records")
+            self._db.execute("DELETE FROM partitions")
+            self._recover()
+
+    # --- Reading ---
+    def _read(self, rows):
+        """Load the records at (partition, offset, length) rows, in row order."""
+        records, files = [], {}
+        try:
+            for partition, offset, length in rows:
+                f = files.get(partition)
+                if f is None:
+                    f = files[partition] = open(self._path(partition), "rb")
+                f.seek(offset)
+                records.append(json.loads(f.read(length)))
+        finally:
+            for f in files.values():
+                f.close()
+        return records
+
+    def query(self, city=None, since=None, until=None, limit=None, newest_first=True):
+        """
+        Readings filtered by city and time range.
+
+        Args:
+            city (str): City name (normalized like the cache keys).
+            since, until (datetime | float): Time range, inclusive; datetimes
+                or epoch seconds.
+            limit (int): Maximum number of readings.
+            newest_first (bool): Order by time descending (default) or ascending.
+
+        Returns:
+            list: Matching records.
+        """
+        conditions, params = [], []
+        if city is not None:
+            conditions.append("city = ?")
+            params.append(normalize_city(city))
+        if since is not None:
+            conditions.append("ts >= ?")
+            params.append(_epoch(since))
+        if until is not None:
+            conditions.append("ts <= ?")
+            params.append(_epoch(until))
+
+        sql = "SELECT partition, offset, length FROM records"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        order = "DESC" if newest_first else "ASC"
+        sql += f" ORDER BY ts {order}, id {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return self._read(rows)
+
+    def latest(self, limit=5, city=None):
+        """The most recent readings (optionally for one city), newest first."""
+        return self.query(city=city, limit=limit)
+
+    def cities(self):
+        """Number of readings per (normalized) city, most readings first."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT city, COUNT(*) AS n FROM records GROUP BY city "
+                "ORDER BY n DESC, city").fetchall()
+
+
+def _epoch(value):
+    return value.timestamp() if isinstance(value, datetime) else float(value)
+
+
+def history_directory(filename):
+    """Store directory for a legacy history file: weather_history.json -> weather_history"""
+    root = os.path.splitext(filename)[0]
+    return root if root != filename else filename + "_store"
+
+
+def open_history(directory="weather_history", legacy_file="weather_history.json",
+                 partition="month"):
+    """
+    Open the history store, importing a legacy weather_history.json the
+    first time (while the store is still empty).
+    """
+    history = WeatherHistory(directory, partition)
+    # len() is only a shortcut: import_json re-checks under the index lock
+    if not len(history) and legacy_file and os.path.exists(legacy_file):
+        try:
+            imported, skipped = history.import_json(legacy_file, only_if_empty=True)
+            if imported or skipped:
+                note = f" (skipped {skipped} invalid entries)" if skipped else ""
+                print(f"Imported {imported} readings from {legacy_file} "
+                      f"into {directory}/{note}.")
+        except (OSError, ValueError) as err:
+            print(f"Could not import {legacy_file}: {err}")
+    return history
@@ -4,11 +4,23 @@ Date: October 10 2025
 Author: Cosmas Onyekwelu
 Topic: Error Handling and Debugging Mastery
 """
+import atexit
 import logging
 import pdb
-from datetime import datetime
+import queue
+import re
 import sys
+import threading
+import time
 import traceback
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from datetime import datetime
+from functools import partial
+from operator import is_not
+from logging.handlers import QueueHandler, QueueListener
+
+from log_store import RotatingJsonLogHandler, count_errors, query_log
 
 
 class ValidationError(Exception):
@@ -25,35 +37,549 @@ class CalculationError(Exception):
     pass
 
 
+class _DeferredFlushMixin:
+    """Write records without flushing; the listener flushes once per batch"""
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that runs strftime once per second of record time instead of
+    once per record. Not thread-safe: meant for the listener thread.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._second = None
+        self._second_text = None
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._second:
+            self._second_text = time.strftime(
+                datefmt or self.default_time_format, self.converter(record.created))
+            self._second = second
+        if datefmt:
+            return self._second_text
+        return self.default_msec_format % (self._second_text, record.msecs)
+
+
+class BatchedFileHandler(_DeferredFlushMixin, logging.FileHandler):
+    """File handler that leaves flushing to BatchingQueueListener"""
+
+
+class BatchedStreamHandler(_DeferredFlushMixin, logging.StreamHandler):
+    """Stream handler that leaves flushing to BatchingQueueListener"""
+
+
+class RecordQueue:
+    """
+    Bounded queue for log records with a cheap put path.
+
+    put() checks the bound and appends under a lock only producers take; the
+    consumer pops without it and signals the consumer only when it is
+    waiting, so a busy producer does not contend with the consumer on every
+    record the way queue.Queue does. Producers waiting for space sleep on a
+    condition the consumer notifies. Meant for any number of producers and a
+    single consumer (the listener thread).
+    """
+
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self._items = deque()
+        self._ready = threading.Event()
+        self._mutex = threading.Lock()
+        self._not_full = threading.Condition(self._mutex)
+        self._full_waiters = 0
+
+    def qsize(self):
+        return len(self._items)
+
+    def _has_space(self):
+        return len(self._items) < self.maxsize
+
+    def put(self, item, block=True, timeout=None):
+        with self._mutex:
+            if self.maxsize > 0 and len(self._items) >= self.maxsize:
+                if not block:
+                    raise queue.Full
+                # Registered before the space check, so a get() that frees
+                # space after the check sees the waiter and notifies
+                self._full_waiters += 1
+                try:
+                    if not self._not_full.wait_for(self._has_space, timeout):
+                        raise queue.Full
+                finally:
+                    self._full_waiters -= 1
+            self._items.append(item)
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def get(self, block=True, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                item = self._items.popleft()
+            except IndexError:
+                pass
+            else:
+                if self._full_waiters:
+                    with self._mutex:
+                        self._not_full.notify()
+                return item
+            if not block:
+                raise queue.Empty
+            self._ready.clear()
+            # An item appended before clear() did not signal: look again
+            if self._items:
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if (remaining is not None and remaining <= 0) or not self._ready.wait(remaining):
+                raise queue.Empty
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue with a configurable overflow policy.
+
+    policy='block' waits (up to block_timeout seconds, None = forever) for
+    space in the queue; policy='drop' discards the record immediately.
+    Records that could not be queued are counted in `dropped`.
+    """
+
+    POLICIES = ('block', 'drop')
+
+    def __init__(self, log_queue, policy='block', block_timeout=None):
+        if policy not in self.POLICIES:
+            raise ValueError(
+                f"policy must be one of {self.POLICIES}, got {policy!r}")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+
+    def handle(self, record):
+        # queue.Queue is already thread-safe, so skip the handler lock
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def prepare(self, record):
+        """Hand the record over untouched so formatting happens in the writer thread"""
+        return record
+
+    def enqueue(self, record):
+        try:
+            if self.policy == 'block':
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers once per batch.
+
+    Records are written without flushing; the handlers are flushed when the
+    queue runs dry, after batch_size records, or once flush_interval seconds
+    have passed since the last flush. Only the public dequeue(), prepare()
+    and handle() hooks are overridden.
+
+    Producers may enqueue other items than LogRecords; record_factory turns
+    each into the records to write (possibly none) on the listener thread,
+    so the caller does not pay for building them.
+
+    tick, if given, is called on the listener thread every tick_interval
+    seconds, busy or idle; the items it returns are handled like queued
+    ones. They are not put on the queue, which may be full.
+    """
+
+    def __init__(self, log_queue, *handlers, batch_size=512, flush_interval=0.2,
+                 record_factory=None, tick=None, tick_interval=1.0):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.record_factory = record_factory
+        self.tick = tick
+        self.tick_interval = tick_interval
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        self._next_tick = self._last_flush + tick_interval
+
+    def enqueue_sentinel(self):
+        # Wait for space: a bounded queue may be full when stop() is called
+        self.queue.put(self._sentinel)
+
+    def dequeue(self, block):
+        while True:
+            self._run_tick()
+            try:
+                record = self.queue.get_nowait()
+                break
+            except queue.Empty:
+                if not block:
+                    raise
+            # The queue ran dry: close the batch before waiting
+            self.flush()
+            timeout = None
+            if self.tick is not None:
+                timeout = max(0.0, self._next_tick - time.monotonic())
+            try:
+                record = self.queue.get(timeout=timeout)
+                break
+            except queue.Empty:
+                continue
+        if record is self._sentinel:
+            self.flush()
+        return record
+
+    def _run_tick(self):
+        if self.tick is None:
+            return
+        now = time.monotonic()
+        if now < self._next_tick:
+            return
+        self._next_tick = now + self.tick_interval
+        for item in self.tick():
+            self.handle(item)
+
+    def handle(self, record):
+        if self.record_factory is not None and not isinstance(record, logging.LogRecord):
+            for built in self.record_factory(record):
+                self.handle(built)
+            return
+        super().handle(record)
+        self._unflushed += 1
+        if (self._unflushed >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Flush every handler (called on the listener thread)"""
+        for handler in self.handlers:
+            handler.flush()
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+
+
+class LogEntry(Mapping):
+    """
+    An error passed to ErrorLogger.log_error: returned to the caller and
+    queued for the writer thread.
+
+    A read-only mapping with the keys timestamp, error_type, message and
+    user_input; the ISO timestamp is only formatted when it is read.
+    repeated is the count of a "repeated N times" summary, else None.
+    """
+
+    __slots__ = ('created', 'error_type', 'message', 'user_input', 'repeated')
+    _KEYS = ('timestamp', 'error_type', 'message', 'user_input')
+
+    def __init__(self, created, error_type, message, user_input=None, repeated=None):
+        self.created = created
+        self.error_type = error_type
+        self.message = message
+        self.user_input = user_input
+        self.repeated = repeated
+
+    def __getitem__(self, key):
+        if key == 'timestamp':
+            return datetime.fromtimestamp(self.created).isoformat()
+        if key in self._KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
 class ErrorLogger:
-    def __init__(self, log_file='error_log.txt'):
+    """
+    Non-blocking error logger.
+
+    log_error only puts a LogEntry on a bounded queue; a background listener
+    thread deduplicates it, turns it into a LogRecord, formats it and writes
+    it to the log file (and optionally stdout) in batches.
+
+    With log_format='jsonl' (the default) the file is a structured JSON-lines
+    log rotated by size (max_bytes) and age (rotate_interval seconds), see
+    log_store. log_format='text' writes the plain one-line format instead.
+
+    Repeated errors are deduplicated on the writer thread: errors are
+    fingerprinted by type and message template, the first occurrence in each
+    dedup_interval window is written and the rest are only counted, then
+    summarised as "repeated N times" once the window has ended (checked about
+    once a second). error_metrics() exposes the per-fingerprint counters.
+    dedup_interval=0 disables suppression. At most max_fingerprints
+    fingerprints are tracked; the least recently seen one is evicted (its
+    pending summary written) beyond that, counted in evicted_count.
+    """
+
+    LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+    _NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+    def __init__(self, log_file='error_log.jsonl', console=True,
+                 queue_size=10000, overflow_policy='block', block_timeout=None,
+                 batch_size=512, flush_interval=0.2, log_format='jsonl',
+                 max_bytes=10 * 1024 * 1024, rotate_interval=24 * 3600,
+                 compress=True, backup_count=0, dedup_interval=10.0,
+                 max_fingerprints=10000):
+        if log_format not in ('jsonl', 'text'):
+            raise ValueError(
+                f"log_format must be 'jsonl' or 'text', got {log_format!r}")
         self.log_file = log_file
+        self.log_format = log_format
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.compress = compress
+        self.backup_count = backup_count
+        self.console = console
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dedup_interval = dedup_interval
+        self.max_fingerprints = max_fingerprints
+        self._error_stats = OrderedDict()
+        self._evicted = 0
+        self._stats_lock = threading.Lock()
+        self._listener = None
         self.setup_logging()
 
     def setup_logging(self):
-        """Configure logging settings"""
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
-        self.logger = logging.getLogger()
+        """Configure the queue handler and the background writer"""
+        formatter = CachedTimeFormatter(self.LOG_FORMAT)
+        if self.log_format == 'jsonl':
+            handlers = [RotatingJsonLogHandler(
+                self.log_file, max_bytes=self.max_bytes,
+                rotate_interval=self.rotate_interval,
+                compress=self.compress, backup_count=self.backup_count)]
+        else:
+            handlers = [BatchedFileHandler(self.log_file, encoding='utf-8')]
+            handlers[0].setFormatter(formatter)
+        if self.console:
+            console_handler = BatchedStreamHandler(sys.stdout)
+            console_handler.setFormatter(formatter)
+            handlers.append(console_handler)
+
+        self._queue = RecordQueue(maxsize=self.queue_size)
+        self._queue_handler = BoundedQueueHandler(
+            self._queue, self.overflow_policy, self.block_timeout)
+
+        # A standalone logger: no root configuration, no propagation
+        self.logger = logging.Logger('error_logger', logging.DEBUG)
+        self.logger.addHandler(self._queue_handler)
+        # Attributes shared by every record, see _make_record
+        self._record_template = vars(self.logger.makeRecord(
+            self.logger.name, logging.ERROR, __file__, 0, "%s: %s | Input: %s",
+            None, None))
+
+        self._listener = BatchingQueueListener(
+            self._queue, *handlers,
+            batch_size=self.batch_size, flush_interval=self.flush_interval,
+            record_factory=self._make_records,
+            tick=self._expired_summaries if self.dedup_interval else None,
+            tick_interval=min(1.0, self.dedup_interval or 1.0))
+        self._listener.start()
+        atexit.register(self.close)
+
+    @property
+    def dropped_count(self):
+        """Number of records discarded because the queue was full"""
+        return self._queue_handler.dropped
+
+    @property
+    def evicted_count(self):
+        """Number of fingerprints dropped from error_metrics() to stay under max_fingerprints"""
+        return self._evicted
+
+    def fingerprint(self, error_type, error_message, user_input=None):
+        """Identify an error by its type and message template"""
+        template = error_message
+        if user_input is not None:
+            text = str(user_input)
+            if text:
+                template = template.replace(text, '<input>')
+        return error_type, self._NUMBER_RE.sub('#', template)
 
     def log_error(self, error_type, error_message, user_input=None):
-        """Log errors with contextual information"""
-        log_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'error_type': error_type,
-            'message': error_message,
-            'user_input': user_input
-        }
-
-        self.logger.error(
-            f"{error_type}: {error_message} | Input: {user_input}")
-        return log_entry
+        """
+        Log errors with contextual information.
+
+        Returns the LogEntry (a mapping of timestamp, error_type, message
+        and user_input), also for occurrences that deduplication only counts.
+        """
+        entry = LogEntry(time.time(), error_type, error_message, user_input)
+        self._queue_handler.enqueue(entry)
+        return entry
+
+    def _make_records(self, item):
+        """
+        Records to write for a queued LogEntry (listener thread): none if
+        deduplication suppresses it, preceded by the previous window's
+        "repeated N times" summary if one is pending.
+        """
+        if isinstance(item, threading.Event):
+            # A _sync() marker: everything queued before it has been handled
+            item.set()
+            return ()
+        if item.repeated is not None:
+            return (self._make_record(item),)
+
+        key = self.fingerprint(item.error_type, item.message, item.user_input)
+        created = item.created
+        evicted = None
+        with self._stats_lock:
+            stats = self._error_stats.get(key)
+            if stats is None:
+                stats = self._error_stats[key] = {
+                    'count': 0, 'emitted': 0, 'suppressed': 0,
+                    'pending': 0, 'window_start': created,
+                    'first_seen': created, 'last_seen': None,
+                }
+                if len(self._error_stats) > self.max_fingerprints:
+                    evicted = self._error_stats.popitem(last=False)
+                    self._evicted += 1
+            else:
+                self._error_stats.move_to_end(key)
+                if self.dedup_interval and created - stats['window_start'] < self.dedup_interval:
+                    stats['count'] += 1
+                    stats['suppressed'] += 1
+                    stats['pending'] += 1
+                    stats['last_seen'] = created
+                    return ()
+            pending, stats['pending'] = stats['pending'], 0
+            stats['window_start'] = created
+            stats['count'] += 1
+            stats['emitted'] += 1
+            stats['last_seen'] = created
+
+        records = []
+        if evicted is not None and evicted[1]['pending']:
+            records.append(self._make_record(
+                self._repeated_entry(evicted[0], evicted[1]['pending'])))
+        if pending:
+            records.append(self._make_record(self._repeated_entry(key, pending)))
+        records.append(self._make_record(item))
+        return records
+
+    def _make_record(self, entry):
+        """
+        Build the LogRecord for a LogEntry (listener thread).
+
+        The record is filled from a template instead of running
+        LogRecord.__init__, whose process and thread lookups are most of the
+        writer's per-record cost; only the per-error attributes are set.
+        """
+        record = logging.LogRecord.__new__(logging.LogRecord)
+        fields = record.__dict__
+        fields.update(self._record_template)
+        created = entry.created
+        fields.update(
+            args=(entry.error_type, entry.message, entry.user_input),
+            created=created, msecs=(created - int(created)) * 1000,
+            relativeCreated=fields['relativeCreated'] + (created - fields['created']) * 1000,
+            error_type=entry.error_type, error_message=entry.message,
+            user_input=entry.user_input, repeated=entry.repeated)
+        return record
+
+    @staticmethod
+    def _repeated_entry(key, count):
+        """LogEntry for a "repeated N times" summary"""
+        error_type, template = key
+        return LogEntry(time.time(), error_type,
+                        f"{template} (repeated {count} times)", None, count)
+
+    def _expired_summaries(self):
+        """
+        Summaries for suppressed errors whose dedup window has ended
+        (listener tick), so they are written without waiting for the
+        next occurrence or close().
+        """
+        now = time.time()
+        expired = []
+        with self._stats_lock:
+            for key, stats in self._error_stats.items():
+                if stats['pending'] and now - stats['window_start'] >= self.dedup_interval:
+                    expired.append(self._repeated_entry(key, stats['pending']))
+                    stats['pending'] = 0
+        return expired
+
+    def _pending_summaries(self):
+        """Summaries for all suppressed errors, marking them written"""
+        with self._stats_lock:
+            pending = []
+            for key, stats in self._error_stats.items():
+                if stats['pending']:
+                    pending.append(self._repeated_entry(key, stats['pending']))
+                    stats['pending'] = 0
+        return pending
+
+    def _sync(self):
+        """Wait until the writer thread has handled everything queued so far"""
+        if self._listener is None:
+            return
+        marker = threading.Event()
+        self._queue.put(marker)
+        marker.wait()
+
+    def flush_suppressed(self):
+        """Write "repeated N times" summaries for all suppressed errors"""
+        self._sync()
+        for entry in self._pending_summaries():
+            self._queue_handler.enqueue(entry)
+
+    def error_metrics(self):
+        """
+        Per-fingerprint counters, including every error logged so far
+        (waits for the writer thread to catch up).
+
+        Returns a dict mapping (error_type, template) to a dict with
+        count, emitted, suppressed, first_seen and last_seen (epoch seconds).
+        """
+        self._sync()
+        with self._stats_lock:
+            return {key: {name: stats[name] for name in
+                          ('count', 'emitted', 'suppressed', 'first_seen', 'last_seen')}
+                    for key, stats in self._error_stats.items()}
+
+    def close(self):
+        """Flush pending records and stop the background writer"""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        # The queue is drained; write the last summaries on this thread
+        for entry in self._pending_summaries():
+            self._listener.handle(entry)
+        self._listener.flush()
+        for handler in self._listener.handlers:
+            handler.close()
+        self._listener = None
+        atexit.unregister(self.close)
 
 
 class InputValidator:
@@ -138,6 +664,247 @@ class InputValidator:
             )
             raise
 
+    def validate_batch(self, schema, records):
+        """Validate many records against a ValidationSchema, logging once per batch"""
+        return schema.validate_records(records, self.error_logger)
+
+
+class FieldRule:
+    """
+    Declarative validation rule for one field.
+
+    kind is 'integer', 'float' or 'string'. Numeric kinds accept min_value
+    and max_value; strings accept min_length and max_length and are
+    returned stripped, like InputValidator.validate_string.
+    """
+
+    KINDS = ('integer', 'float', 'string')
+    _INTEGER_RE = re.compile(r'\s*[+-]?\d+\s*')
+    _FLOAT_RE = re.compile(
+        r'\s*[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|inf(?:inity)?|nan)\s*',
+        re.IGNORECASE)
+
+    def __init__(self, kind, min_value=None, max_value=None,
+                 min_length=1, max_length=100):
+        if kind not in self.KINDS:
+            raise ValueError(f"kind must be one of {self.KINDS}, got {kind!r}")
+        self.kind = kind
+        self.min_value = min_value
+        self.max_value = max_value
+        self.min_length = min_length
+        self.max_length = max_length
+
+    def compile(self):
+        """
+        Return (convert_all, check) for this rule.
+
+        convert_all(column) is the bulk path: it returns (values, recheck),
+        where recheck lists the indices that still need check(), or None
+        when the column has to be checked value by value. check(value)
+        returns (True, converted) or (False, message) without raising.
+        """
+        if self.kind == 'string':
+            return self._compile_string()
+        convert = int if self.kind == 'integer' else float
+        pattern = self._INTEGER_RE if self.kind == 'integer' else self._FLOAT_RE
+        min_value, max_value = self.min_value, self.max_value
+        label = 'integer' if self.kind == 'integer' else 'number'
+
+        check_range = min_value is not None or max_value is not None
+
+        def in_range(lo, hi):
+            return ((min_value is None or lo >= min_value) and
+                    (max_value is None or hi <= max_value))
+
+        def convert_all(column):
+            # int() and float() accept what check() accepts, apart from
+            # digit-group underscores ("1_0"); join() also rejects chunks
+            # with non-string cells
+            try:
+                if '_' in ''.join(column):
+                    return None
+            except TypeError:
+                return None
+
+            # extend() keeps the values converted before a failing cell and
+            # map() resumes after it, so a bad cell costs one exception
+            values, recheck, cells = [], [], map(convert, column)
+            while True:
+                try:
+                    values.extend(cells)
+                    break
+                except ValueError:
+                    recheck.append(len(values))
+                    values.append(None)
+
+            if check_range:
+                numbers = list(filter(partial(is_not, None), values)) if recheck else values
+                if numbers and not in_range(min(numbers), max(numbers)):
+                    recheck.extend(i for i, value in enumerate(values)
+                                   if value is not None and not in_range(value, value))
+            return values, recheck
+
+        def check(value):
+            if not isinstance(value, str):
+                return False, "Input must be a string"
+            if not value.strip():
+                return False, "Input cannot be empty"
+            if not pattern.fullmatch(value):
+                return False, f"Not a valid {label}"
+            number = convert(value)
+            if min_value is not None and number < min_value:
+                return False, f"Input must be at least {min_value}"
+            if max_value is not None and number > max_value:
+                return False, f"Input cannot exceed {max_value}"
+            return True, number
+
+        return convert_all, check
+
+    def _compile_string(self):
+        min_length, max_length = self.min_length, self.max_length
+
+        def convert_all(column):
+            if set(map(type, column)) != {str}:
+                return None
+            values = [value.strip() for value in column]
+            lengths = list(map(len, values))
+            if lengths and (min(lengths) < min_length or max(lengths) > max_length):
+                return None
+            return values, []
+
+        def check(value):
+            if not isinstance(value, str):
+                return False, "Input must be a string"
+            cleaned = value.strip()
+            if len(cleaned) < min_length:
+                return False, f"Input must be at least {min_length} characters long"
+            if len(cleaned) > max_length:
+                return False, f"Input cannot exceed {max_length} characters"
+            return True, cleaned
+
+        return convert_all, check
+
+
+class ValidationReport:
+    """
+    Result of a batch validation.
+
+    values holds the converted values (None where invalid); errors holds
+    up to max_errors (index, field, message, value) tuples, while
+    error_counts counts every failure per message.
+    """
+
+    def __init__(self, total, max_errors=1000):
+        self.total = total
+        self.max_errors = max_errors
+        self.values = None
+        self.errors = []
+        self.error_counts = {}
+        self.error_count = 0
+
+    def add_error(self, index, field, message, value):
+        self.error_count += 1
+        self.error_counts[message] = self.error_counts.get(message, 0) + 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((index, field, message, value))
+
+    @property
+    def is_valid(self):
+        return self.error_count == 0
+
+    def log(self, error_logger, source="batch"):
+        """Log the whole batch as a single entry (nothing is logged if valid)"""
+        if self.is_valid:
+            return
+        summary = ", ".join(f"{message} x{count}"
+                            for message, count in self.error_counts.items())
+        sample = [value for _, _, _, value in self.errors[:5]]
+        error_logger.log_error(
+            "ValidationReport",
+            f"{self.error_count} invalid of {self.total} in {source}: {summary}",
+            sample
+        )
+
+
+class ValidationSchema:
+    """
+    Field rules compiled once and applied to whole columns or records.
+
+    Example:
+        schema = ValidationSchema({'age': FieldRule('integer', min_value=0),
+                                   'name': FieldRule('string', max_length=50)})
+        report = schema.validate_records(rows, error_logger)
+    """
+
+    def __init__(self, fields):
+        self.fields = dict(fields)
+        self._compiled = {name: rule.compile() for name, rule in self.fields.items()}
+
+    MIN_CHUNK = 32
+
+    def _validate_into(self, report, name, column):
+        convert_all, check = self._compiled[name]
+        converted = []
+
+        # Bisect chunks the bulk path rejects, so good stretches stay on the
+        # bulk path and only small chunks around bad cells are checked per value
+        pending = [(0, len(column))]
+        while pending:
+            start, stop = pending.pop()
+            chunk = column if stop - start == len(column) else column[start:stop]
+            result = convert_all(chunk)
+            if result is None and stop - start > self.MIN_CHUNK:
+                middle = (start + stop) // 2
+                pending.append((middle, stop))
+                pending.append((start, middle))
+                continue
+
+            if result is None:
+                values, recheck = [None] * len(chunk), range(len(chunk))
+            else:
+                values, recheck = result
+            for index in recheck:
+                ok, value = check(chunk[index])
+                if ok:
+                    values[index] = value
+                else:
+                    values[index] = None
+                    report.add_error(start + index, name, value, chunk[index])
+            if converted:
+                converted.extend(values)
+            else:
+                converted = values
+        return converted
+
+    def validate_column(self, name, column, error_logger=None, max_errors=1000):
+        """Validate every value of one field; returns a ValidationReport"""
+        column = list(column)
+        report = ValidationReport(len(column), max_errors)
+        report.values = self._validate_into(report, name, column)
+        if error_logger is not None:
+            report.log(error_logger, f"column '{name}'")
+        return report
+
+    def validate_records(self, records, error_logger=None, max_errors=1000):
+        """
+        Validate a sequence of dict records column by column.
+
+        report.values is a list of dicts with converted values (None for
+        invalid or missing fields).
+        """
+        records = list(records)
+        report = ValidationReport(len(records), max_errors)
+        columns = {}
+        for name in self.fields:
+            column = [record.get(name) for record in records]
+            columns[name] = self._validate_into(report, name, column)
+
+        names = list(columns)
+        report.values = [dict(zip(names, row)) for row in zip(*columns.values())]
+        if error_logger is not None:
+            report.log(error_logger, "records")
+        return report
+
 
 class Calculator:
     def __init__(self, error_logger):
@@ -159,7 +926,8 @@ class Calculator:
             result = numerator / denominator
 
             self.error_logger.logger.info(
-                f"Division operation: {numerator} / {denominator} = {result}"
+                "Division operation: %s / %s = %s",
+                numerator, denominator, result
             )
 
             return result
@@ -197,7 +965,7 @@ class Calculator:
             result = base ** exponent
 
             self.error_logger.logger.info(
-                f"Power operation: {base} ** {exponent} = {result}"
+                "Power operation: %s ** %s = %s", base, exponent, result
             )
 
             return result
@@ -282,20 +1050,29 @@ def interactive_debugging_demo():
         print("3. Use try-except to catch and analyze errors")
 
 
-def view_error_log():
-    """Display the contents of the error log"""
-    try:
-        with open('error_log.txt', 'r') as f:
-            content = f.read()
-            if content:
-                print("\n" + "="*50)
-                print("ERROR LOG CONTENTS")
-                print("="*50)
-                print(content)
-            else:
-                print("Error log is empty")
-    except FileNotFoundError:
-        print("No error log file found yet")
+def view_error_log(log_file='error_log.jsonl', error_type=None,
+                   last_minutes=None, limit=50):
+    """Display the most recent matching entries of the structured error log"""
+    since = time.time() - last_minutes * 60 if last_minutes else None
+    entries = deque(query_log(log_file, error_type, since), maxlen=limit)
+
+    if not entries:
+        print("No matching error log entries found")
+        return
+
+    print("\n" + "="*50)
+    print("ERROR LOG CONTENTS")
+    print("="*50)
+    for entry in entries:
+        kind = entry['error_type'] or entry['level']
+        line = f"{entry['time']} - {entry['level']} - {kind}: {entry['message']}"
+        if entry['user_input'] is not None:
+            line += f" | Input: {entry['user_input']}"
+        print(line)
+
+    print("\nCounts by type:")
+    for kind, count in sorted(count_errors(log_file, since).items()):
+        print(f"  {kind}: {count}")
 
 
 def main():
@@ -376,7 +1153,13 @@ def main():
                 interactive_debugging_demo()
 
             elif choice == '5':
-                view_error_log()
+                error_type = input(
+                    "Filter by error type (Enter for all): ").strip() or None
+                minutes = input(
+                    "Only the last N minutes (Enter for all): ").strip()
+                view_error_log(
+                    error_type=error_type,
+                    last_minutes=float(minutes) if minutes else None)
 
             elif choice == '6':
                 print("Thank you for using the Error Logger Tool!")
@@ -398,6 +1181,8 @@ def main():
             )
             print(f"An unexpected error occurred: {e}")
 
+    error_logger.close()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,393 @@
+"""
+Python Learning Journey - Day Nineteen
+Structured log storage for the Error Logger Tool
+
+Records are written as JSON lines to an active segment that is rotated by
+size and by age. Rotated segments can be gzip-compressed, and each one gets
+an entry in a small index file (time range and error-type counts), so that
+queries such as "ValueErrors in the last hour" only open the segments that
+can contain matching records.
+"""
+import gzip
+import json
+import logging
+import os
+import re
+import shutil
+from datetime import datetime
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format a LogRecord as a single JSON object per line"""
+
+    # json.dumps() builds a new encoder per call when given options
+    _encoder = json.JSONEncoder(default=str, ensure_ascii=False)
+
+    def format(self, record):
+        entry = {
+            'ts': record.created,
+            'time': datetime.fromtimestamp(record.created).isoformat(
+                timespec='milliseconds'),
+            'level': record.levelname,
+            'error_type': getattr(record, 'error_type', None),
+            'message': getattr(record, 'error_message', None) or record.getMessage(),
+            'user_input': getattr(record, 'user_input', None),
+        }
+        repeated = getattr(record, 'repeated', None)
+        if repeated:
+            entry['repeated'] = repeated
+        return self._encoder.encode(entry)
+
+
+def entry_kind(entry):
+    """Key used for the error-type counts: the error type, else the level"""
+    return entry.get('error_type') or entry.get('level')
+
+
+def entry_weight(entry):
+    """Occurrences an entry stands for ("repeated N times" summaries count N)"""
+    return entry.get('repeated') or 1
+
+
+class SegmentStats:
+    """Time range and per-kind counts for one log segment"""
+
+    def __init__(self):
+        self.start = None
+        self.end = None
+        self.count = 0
+        self.error_types = {}
+
+    def add(self, ts, kind, weight=1):
+        if self.start is None:
+            self.start = ts
+        self.end = ts
+        self.count += 1
+        self.error_types[kind] = self.error_types.get(kind, 0) + weight
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.start = data['start']
+        stats.end = data['end']
+        stats.count = data['count']
+        stats.error_types = dict(data['error_types'])
+        return stats
+
+    def to_dict(self, segment):
+        return {
+            'segment': segment,
+            'start': self.start,
+            'end': self.end,
+            'count': self.count,
+            'error_types': self.error_types,
+        }
+
+
+class RotatingJsonLogHandler(logging.Handler):
+    """
+    JSON-lines file handler with size/time rotation and a segment index.
+
+    Args:
+        filename (str): Active segment, e.g. 'error_log.jsonl'.
+        max_bytes (int): Rotate once the segment would exceed this size (0 = never).
+        rotate_interval (float): Rotate once the segment's first record is
+            this many seconds old (0 = never).
+        compress (bool): gzip rotated segments.
+        backup_count (int): Rotated segments to keep (0 = keep all).
+
+    Writes are not flushed per record; call flush() (the batching listener
+    does this once per batch). Rotated segments missing from the index (a
+    crash during rollover) are indexed, and compressed if compress is set,
+    when the handler is opened.
+
+    close() saves the active segment's stats next to it (stats_path), so
+    reopening only parses records written after that.
+    """
+
+    def __init__(self, filename, max_bytes=10 * 1024 * 1024,
+                 rotate_interval=24 * 3600, compress=True, backup_count=0,
+                 encoding='utf-8'):
+        super().__init__()
+        self.filename = os.path.abspath(filename)
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.compress = compress
+        self.backup_count = backup_count
+        self.encoding = encoding
+        self.index_file = index_path(self.filename)
+        self.stats_file = stats_path(self.filename)
+        self.setFormatter(JsonLinesFormatter())
+
+        self.stream = None
+        self.stats = SegmentStats()
+        self._size = 0
+        self._recover_index()
+        self._open_segment()
+
+    def _open_segment(self):
+        """Open the active segment, recovering the stats of existing content"""
+        self.stats, offset = self._load_stats()
+        if os.path.exists(self.filename):
+            for entry in _read_segment(self.filename, offset):
+                self.stats.add(entry['ts'], entry_kind(entry), entry_weight(entry))
+        self.stream = open(self.filename, 'a', encoding=self.encoding)
+        self._size = self.stream.tell()
+
+    def _load_stats(self):
+        """
+        Stats saved by close() and the segment size they cover, or empty
+        stats and 0 if there are none or the segment is now smaller.
+        """
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if os.path.getsize(self.filename) >= saved['size']:
+                return SegmentStats.from_dict(saved), saved['size']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return SegmentStats(), 0
+
+    def _save_stats(self):
+        saved = self.stats.to_dict(os.path.basename(self.filename))
+        saved['size'] = self._size
+        tmp = self.stats_file + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(saved, f)
+        os.replace(tmp, self.stats_file)
+
+    def _should_rollover(self, ts, size):
+        if not self.stats.count:
+            return False
+        if self.max_bytes and self._size + size > self.max_bytes:
+            return True
+        return bool(self.rotate_interval) and ts - self.stats.start >= self.rotate_interval
+
+    def emit(self, record):
+        try:
+            line = self.format(record) + '\n'
+            size = len(line.encode(self.encoding))
+            if self._should_rollover(record.created, size):
+                self.do_rollover()
+            self.stream.write(line)
+            self._size += size
+            self.stats.add(record.created,
+                           getattr(record, 'error_type', None) or record.levelname,
+                           getattr(record, 'repeated', None) or 1)
+        except Exception:
+            self.handleError(record)
+
+    def do_rollover(self):
+        """Close the active segment, archive it and record it in the index"""
+        self.stream.close()
+        self.stream = None
+
+        # The saved stats describe the segment being rotated away
+        try:
+            os.remove(self.stats_file)
+        except FileNotFoundError:
+            pass
+        if self.stats.count:
+            segment = self._rotated_name()
+            os.replace(self.filename, segment)
+            if self.compress:
+                segment = _compress(segment)
+
+            with open(self.index_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(self.stats.to_dict(os.path.basename(segment))) + '\n')
+            if self.backup_count:
+                self._prune()
+
+        self._open_segment()
+
+    def _recover_index(self):
+        """Index rotated segments that a crash left out of the index"""
+        directory = os.path.dirname(self.filename)
+        root, ext = os.path.splitext(os.path.basename(self.filename))
+        pattern = re.compile(re.escape(root) + r'\.\d{8}-\d{6}(?:-\d+)?'
+                             + re.escape(ext) + r'(?:\.gz)?$')
+        segments = read_index(self.filename)
+        indexed = {seg['segment'] for seg in segments}
+        names = set(os.listdir(directory))
+
+        recovered = []
+        for name in sorted(names):
+            if not pattern.match(name) or name in indexed:
+                continue
+            if name.endswith('.gz') and name[:-3] in names:
+                # Compression was interrupted: the plain segment is complete
+                # and is recovered (and recompressed) on its own
+                continue
+            path = os.path.join(directory, name)
+            stats = SegmentStats()
+            for entry in _read_segment(path):
+                stats.add(entry['ts'], entry_kind(entry), entry_weight(entry))
+            if not stats.count:
+                continue
+            if self.compress and not name.endswith('.gz'):
+                name = os.path.basename(_compress(path))
+            recovered.append(stats.to_dict(name))
+        if recovered:
+            segments = sorted(segments + recovered, key=lambda seg: seg['start'])
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                for seg in segments:
+                    f.write(json.dumps(seg) + '\n')
+
+    def _rotated_name(self):
+        root, ext = os.path.splitext(self.filename)
+        stamp = datetime.fromtimestamp(self.stats.start).strftime('%Y%m%d-%H%M%S')
+        candidate, n = f"{root}.{stamp}{ext}", 1
+        while os.path.exists(candidate) or os.path.exists(candidate + '.gz'):
+            candidate, n = f"{root}.{stamp}-{n}{ext}", n + 1
+        return candidate
+
+    def _prune(self):
+        """Delete the oldest rotated segments beyond backup_count"""
+        segments = read_index(self.filename)
+        excess = len(segments) - self.backup_count
+        if excess <= 0:
+            return
+        directory = os.path.dirname(self.filename)
+        for seg in segments[:excess]:
+            try:
+                os.remove(os.path.join(directory, seg['segment']))
+            except FileNotFoundError:
+                pass
+        with open(self.index_file, 'w', encoding='utf-8') as f:
+            for seg in segments[excess:]:
+                f.write(json.dumps(seg) + '\n')
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+                try:
+                    self._save_stats()
+                except OSError:
+                    pass  # only a cache: the next open rescans the segment
+        finally:
+            self.release()
+        super().close()
+
+
+def index_path(filename):
+    """Index file belonging to an active segment"""
+    root, _ = os.path.splitext(os.path.abspath(filename))
+    return root + '.index.jsonl'
+
+
+def stats_path(filename):
+    """File holding the saved stats of an active segment"""
+    root, _ = os.path.splitext(os.path.abspath(filename))
+    return root + '.active.json'
+
+
+def _compress(path):
+    """gzip a rotated segment, replacing any partial .gz; returns the new path"""
+    with open(path, 'rb') as src, gzip.open(path + '.gz', 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(path)
+    return path + '.gz'
+
+
+def read_index(filename):
+    """Return the index entries of all rotated segments, oldest first"""
+    try:
+        with open(index_path(filename), 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def _read_segment(path, offset=0):
+    """
+    Yield the entries of a (possibly gzipped) segment from byte offset on,
+    skipping bad lines.
+    """
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def _overlaps(seg, error_type, since, until):
+    if since is not None and seg['end'] < since:
+        return False
+    if until is not None and seg['start'] > until:
+        return False
+    return error_type is None or seg['error_types'].get(error_type, 0) > 0
+
+
+def _matches(entry, error_type, since, until):
+    if error_type is not None and entry_kind(entry) != error_type:
+        return False
+    if since is not None and entry['ts'] < since:
+        return False
+    return until is None or entry['ts'] <= until
+
+
+def query_log(filename, error_type=None, since=None, until=None):
+    """
+    Yield log entries, oldest first, filtered by error type and time range.
+
+    since/until are epoch seconds. Rotated segments whose index entry shows
+    no overlap with the filter are skipped without being opened.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    paths = [os.path.join(directory, seg['segment'])
+             for seg in read_index(filename)
+             if _overlaps(seg, error_type, since, until)]
+    if os.path.exists(filename):
+        paths.append(filename)
+
+    for path in paths:
+        try:
+            for entry in _read_segment(path):
+                if _matches(entry, error_type, since, until):
+                    yield entry
+        except FileNotFoundError:
+            continue
+
+
+def count_errors(filename, since=None):
+    """
+    Count occurrences per error type since the given epoch time.
+
+    Segments entirely inside the window are answered from the index; only
+    segments straddling the boundary and the active segment are scanned.
+    """
+    counts = {}
+    directory = os.path.dirname(os.path.abspath(filename))
+    paths = []
+    for seg in read_index(filename):
+        if since is None or seg['start'] >= since:
+            for kind, n in seg['error_types'].items():
+                counts[kind] = counts.get(kind, 0) + n
+        elif seg['end'] >= since:
+            paths.append(os.path.join(directory, seg['segment']))
+    if os.path.exists(filename):
+        paths.append(filename)
+
+    for path in paths:
+        try:
+            for entry in _read_segment(path):
+                if since is None or entry['ts'] >= since:
+                    kind = entry_kind(entry)
+                    counts[kind] = counts.get(kind, 0) + entry_weight(entry)
+        except FileNotFoundError:
+            continue
+    return counts
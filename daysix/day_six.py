@@ -8,7 +8,7 @@ Topic: Algorithms & File Handling.
 import csv
 import time
 import random
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 
 
 class AlgorithmMastery:
@@ -111,12 +111,30 @@ class FileHandling:
 
     def read_lines(self, filename: str) -> List[str]:
         """Read file line by line"""
+        return list(self.iter_lines(filename))
+
+    def iter_lines(self, filename: str, encoding: str = 'utf-8') -> Iterator[str]:
+        """Yield stripped lines lazily, without loading the whole file"""
         try:
-            with open(filename, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-            return [line.strip() for line in lines]
+            # newline=None turns Windows \r\n endings into \n while reading
+            with open(filename, 'r', encoding=encoding, newline=None) as file:
+                for line in file:
+                    yield line.strip()
         except FileNotFoundError:
-            return []
+            return
+
+    def iter_chunks(self, filename: str, chunk_size: int = 1 << 20,
+                    encoding: str = 'utf-8') -> Iterator[str]:
+        """Yield the file in chunks of at most chunk_size characters"""
+        try:
+            with open(filename, 'r', encoding=encoding) as file:
+                while True:
+                    chunk = file.read(chunk_size)
+                    if not chunk:
+                        return
+                    yield chunk
+        except FileNotFoundError:
+            return
 
     def write_to_file(self, filename: str, content: str, mode: str = 'w'):
         """Write content to file (write or append mode)"""
@@ -129,23 +147,17 @@ class FileHandling:
 
     def count_word_frequency(self, filename: str) -> Dict[str, int]:
         """Count word frequency in a text file"""
-        try:
-            with open(filename, 'r', encoding='utf-8') as file:
-                text = file.read().lower()
-
+        word_count = {}
+        # One line at a time: words never span lines, and memory stays flat
+        for line in self.iter_lines(filename):
             # Remove punctuation and split into words
-            words = text.split()
-            word_count = {}
-
-            for word in words:
+            for word in line.lower().split():
                 # Clean word from punctuation
                 clean_word = ''.join(char for char in word if char.isalnum())
                 if clean_word:
                     word_count[clean_word] = word_count.get(clean_word, 0) + 1
 
-            return word_count
-        except FileNotFoundError:
-            return {}
+        return word_count
 
     def read_csv_file(self, filename: str) -> List[Dict[str, str]]:
         """Read CSV file using csv.DictReader"""
@@ -4,6 +4,9 @@ Date: October 7 2025
 Author: Cosmas Onyekwelu
 Topic: Advanced OOP - Encapsulation and Properties: Protecting and Controlling Access to Data
 """
+import itertools
+import random
+from collections.abc import Sequence
 
 
 class EncapsulationFundamentals:
@@ -28,7 +31,6 @@ class EncapsulationFundamentals:
 
             def _generate_employee_id(self):
                 """Protected method - for internal class use"""
-                import random
                 return f"EMP{random.randint(1000, 9999)}"
 
             def get_salary_info(self):
@@ -79,7 +81,13 @@ class EncapsulationFundamentals:
         class Temperature:
             def __init__(self, celsius=0):
                 # Store temperature in one base unit
+                self._store(celsius)
+
+            def _store(self, celsius):
+                """Keep celsius and its derived scales in sync"""
                 self._celsius = celsius
+                self._fahrenheit = (celsius * 9/5) + 32
+                self._kelvin = celsius + 273.15
 
             @property
             def celsius(self):
@@ -90,20 +98,20 @@ class EncapsulationFundamentals:
             def celsius(self, value):
                 """Setter for celsius with validation"""
                 if value >= -273.15:  # Absolute zero
-                    self._celsius = value
+                    self._store(value)
                 else:
                     raise ValueError(
                         "Temperature cannot be below absolute zero (-273.15°C)")
 
             @property
             def fahrenheit(self):
-                """Computed property - read-only"""
-                return (self._celsius * 9/5) + 32
+                """Computed property - read-only, computed once per set"""
+                return self._fahrenheit
 
             @property
             def kelvin(self):
-                """Another computed property - read-only"""
-                return self._celsius + 273.15
+                """Another computed property - read-only, computed once per set"""
+                return self._kelvin
 
             @property
             def description(self):
@@ -241,13 +249,46 @@ class EncapsulationFundamentals:
         print("Comprehensive Validation with Properties")
         print("=" * 60)
 
+        class GradesView(Sequence):
+            """
+            Read-only view of a student's grades.
+
+            Compares equal to a list or tuple of the same grades and hashes
+            like the tuple, so the hash changes as grades are added.
+            """
+
+            def __init__(self, grades):
+                self._grades = grades
+
+            def __getitem__(self, index):
+                return self._grades[index]
+
+            def __len__(self):
+                return len(self._grades)
+
+            def __eq__(self, other):
+                # Compares equal to a list or tuple of the same grades
+                if isinstance(other, GradesView):
+                    other = other._grades
+                if isinstance(other, (list, tuple)):
+                    return self._grades == list(other)
+                return NotImplemented
+
+            def __hash__(self):
+                return hash(tuple(self._grades))
+
+            def __repr__(self):
+                return repr(self._grades)
+
         class Student:
             def __init__(self, name, age, email):
                 self._name = name
                 self._age = age
                 self._email = email
                 self._grades = []
+                self._grade_total = 0
                 self._gpa = 0.0
+                self._cohort = None
 
             @property
             def name(self):
@@ -287,7 +328,12 @@ class EncapsulationFundamentals:
 
             @property
             def grades(self):
-                return self._grades.copy()  # Return copy to prevent external modification
+                """
+                Read-only view of the grades, not a copy: it follows later
+                add_grade calls and cannot be modified (no append etc.);
+                use list(student.grades) for a mutable snapshot.
+                """
+                return GradesView(self._grades)
 
             def add_grade(self, grade):
                 if not isinstance(grade, (int, float)):
@@ -295,21 +341,21 @@ class EncapsulationFundamentals:
                 if grade < 0 or grade > 100:
                     raise ValueError("Grade must be between 0 and 100")
                 self._grades.append(grade)
-                self._update_gpa()
+                self._update_gpa(grade)
 
             @property
             def gpa(self):
                 """Read-only computed property"""
                 return self._gpa
 
-            def _update_gpa(self):
-                """Private method to update GPA"""
-                if self._grades:
-                    # Simple GPA calculation (scale 0-4)
-                    total = sum(self._grades)
-                    average = total / len(self._grades)
-                    # Convert 0-100 to 0-4 scale
-                    self._gpa = min(4.0, average / 25)
+            def _update_gpa(self, grade):
+                """Private method to update GPA from a running total (O(1))"""
+                self._grade_total += grade
+                average = self._grade_total / len(self._grades)
+                # Convert 0-100 to 0-4 scale
+                old_gpa, self._gpa = self._gpa, min(4.0, average / 25)
+                if self._cohort is not None and self._gpa != old_gpa:
+                    self._cohort._reposition(self)
 
             @property
             def academic_standing(self):
@@ -329,6 +375,161 @@ class EncapsulationFundamentals:
                         f"Academic Standing: {self.academic_standing}\n"
                         f"Grades: {self.grades}")
 
+        class RankedSkipList:
+            """Indexable skip list: O(log n) insert, remove, rank and select"""
+
+            MAX_LEVEL = 24
+
+            class _Node:
+                __slots__ = ('key', 'value', 'next', 'width')
+
+                def __init__(self, key, value, level):
+                    self.key = key
+                    self.value = value
+                    self.next = [None] * level
+                    self.width = [1] * level
+
+            def __init__(self):
+                self._random = random.Random()
+                self._tail = self._Node(None, None, 0)
+                self._head = self._Node(None, None, self.MAX_LEVEL)
+                self._head.next = [self._tail] * self.MAX_LEVEL
+                self._size = 0
+
+            def __len__(self):
+                return self._size
+
+            def _random_level(self):
+                level = 1
+                while level < self.MAX_LEVEL and self._random.random() < 0.5:
+                    level += 1
+                return level
+
+            def insert(self, key, value):
+                chain = [None] * self.MAX_LEVEL
+                steps_at_level = [0] * self.MAX_LEVEL
+                node = self._head
+                for i in reversed(range(self.MAX_LEVEL)):
+                    while node.next[i] is not self._tail and node.next[i].key < key:
+                        steps_at_level[i] += node.width[i]
+                        node = node.next[i]
+                    chain[i] = node
+
+                level = self._random_level()
+                new_node = self._Node(key, value, level)
+                steps = 0
+                for i in range(level):
+                    prev = chain[i]
+                    new_node.next[i] = prev.next[i]
+                    prev.next[i] = new_node
+                    new_node.width[i] = prev.width[i] - steps
+                    prev.width[i] = steps + 1
+                    steps += steps_at_level[i]
+                for i in range(level, self.MAX_LEVEL):
+                    chain[i].width[i] += 1
+                self._size += 1
+
+            def remove(self, key):
+                chain = [None] * self.MAX_LEVEL
+                node = self._head
+                for i in reversed(range(self.MAX_LEVEL)):
+                    while node.next[i] is not self._tail and node.next[i].key < key:
+                        node = node.next[i]
+                    chain[i] = node
+
+                target = chain[0].next[0]
+                if target is self._tail or target.key != key:
+                    raise KeyError(key)
+                for i in range(len(target.next)):
+                    chain[i].width[i] += target.width[i] - 1
+                    chain[i].next[i] = target.next[i]
+                for i in range(len(target.next), self.MAX_LEVEL):
+                    chain[i].width[i] -= 1
+                self._size -= 1
+
+            def rank(self, key):
+                """Number of entries with a key smaller than key"""
+                node, position = self._head, 0
+                for i in reversed(range(self.MAX_LEVEL)):
+                    while node.next[i] is not self._tail and node.next[i].key < key:
+                        position += node.width[i]
+                        node = node.next[i]
+                return position
+
+            def iter_from(self, index):
+                """Yield (key, value) pairs starting at position index"""
+                if index >= self._size:
+                    return
+                node, remaining = self._head, index + 1
+                for i in reversed(range(self.MAX_LEVEL)):
+                    while node.next[i] is not self._tail and node.width[i] <= remaining:
+                        remaining -= node.width[i]
+                        node = node.next[i]
+                while node is not self._tail:
+                    yield node.key, node.value
+                    node = node.next[0]
+
+        class StudentCohort:
+            """Students kept ordered by GPA (highest first) for ranked queries"""
+
+            STANDINGS = (("Excellent", 3.5), ("Good", 3.0),
+                         ("Satisfactory", 2.0), ("Needs Improvement", 0.0))
+
+            def __init__(self):
+                self._ranking = RankedSkipList()
+                self._keys = {}
+                self._ids = itertools.count()
+
+            def __len__(self):
+                return len(self._ranking)
+
+            def add(self, student):
+                # Keys sort by descending GPA; the id breaks ties stably
+                key = (-student.gpa, next(self._ids))
+                self._keys[student] = key
+                self._ranking.insert(key, student)
+                student._cohort = self
+
+            def remove(self, student):
+                self._ranking.remove(self._keys.pop(student))
+                student._cohort = None
+
+            def _reposition(self, student):
+                old_key = self._keys[student]
+                new_key = (-student.gpa, old_key[1])
+                self._ranking.remove(old_key)
+                self._ranking.insert(new_key, student)
+                self._keys[student] = new_key
+
+            def top(self, k):
+                """The k students with the highest GPA"""
+                return [student for _, student in
+                        itertools.islice(self._ranking.iter_from(0), k)]
+
+            def rank(self, student):
+                """1-based position of the student in the cohort"""
+                return self._ranking.rank(self._keys[student]) + 1
+
+            def count_at_least(self, gpa):
+                """Number of students with a GPA >= gpa"""
+                return self._ranking.rank((-gpa, float('inf')))
+
+            def percentile(self, student):
+                """Percentage of the cohort with a strictly lower GPA"""
+                if not len(self):
+                    return 0.0
+                below = len(self) - self.count_at_least(student.gpa)
+                return 100 * below / len(self)
+
+            def standing_counts(self):
+                """Students per academic_standing bucket"""
+                counts, above = {}, 0
+                for standing, threshold in self.STANDINGS:
+                    at_least = self.count_at_least(threshold)
+                    counts[standing] = at_least - above
+                    above = at_least
+                return counts
+
         # Demonstrate comprehensive validation
         student = Student("Alice Smith", 20, "alice@university.edu")
 
@@ -363,6 +564,22 @@ class EncapsulationFundamentals:
         student.email = "alice.johnson@university.edu"
         print(f"\nAfter valid updates:")
         print(student.get_student_info())
+        print(f"Grades view equals a plain list: {student.grades == [85, 92, 78]}")
+
+        # Ranked cohort: GPA order is maintained incrementally
+        cohort = StudentCohort()
+        cohort.add(student)
+        for i in range(1000):
+            classmate = Student(f"Student {i}", 20, f"student{i}@university.edu")
+            cohort.add(classmate)
+            for _ in range(3):
+                classmate.add_grade(random.randint(40, 100))
+
+        print(f"\nCohort of {len(cohort)} students:")
+        print("Top 3:", ", ".join(f"{s.name} ({s.gpa:.2f})" for s in cohort.top(3)))
+        print(f"{student.name} is ranked {cohort.rank(student)}, "
+              f"{cohort.percentile(student):.1f}th percentile")
+        print(f"Standing buckets: {cohort.standing_counts()}")
 
 
 class BankAccountProject:
@@ -398,7 +615,6 @@ class BankAccountProject:
 
             def _generate_account_number(self):
                 """Protected method for account number generation"""
-                import random
                 return f"ACC{random.randint(100000, 999999)}"
 
             def _get_current_date(self):
@@ -674,7 +890,13 @@ class PracticeExercises:
 
         class TemperatureConverter:
             def __init__(self, celsius=0):
+                self._store(celsius)
+
+            def _store(self, celsius):
+                # Derived scales are computed on write, not on every read
                 self._celsius = celsius
+                self._fahrenheit = (celsius * 9/5) + 32
+                self._kelvin = celsius + 273.15
 
             @property
             def celsius(self):
@@ -685,11 +907,11 @@ class PracticeExercises:
                 if value < -273.15:
                     raise ValueError(
                         "Temperature cannot be below absolute zero")
-                self._celsius = value
+                self._store(value)
 
             @property
             def fahrenheit(self):
-                return (self._celsius * 9/5) + 32
+                return self._fahrenheit
 
             @fahrenheit.setter
             def fahrenheit(self, value):
@@ -697,7 +919,7 @@ class PracticeExercises:
 
             @property
             def kelvin(self):
-                return self._celsius + 273.15
+                return self._kelvin
 
             @kelvin.setter
             def kelvin(self, value):
@@ -0,0 +1,819 @@
+"""
+Python Learning Journey - Day Twenty
+Benchmarks for the Utility Toolkit
+
+Run with: python benchmarks.py
+"""
+
+import array
+import contextlib
+import gzip
+import math
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from fractions import Fraction
+from itertools import islice
+
+import math_utils
+from bulk_file_ops import compress_many, copy_many, move_many
+from file_utils import (BufferedAppender, FileFingerprintCache, append_to_file,
+                        create_file, iter_chunks, iter_json, iter_lines,
+                        mmap_file, read_file, read_json_file, walk_files,
+                        write_json_file, write_json_stream)
+from math_parallel import parallel_map, parallel_stats
+from math_utils import (STATS_RTOL, RandomStream, RunningStats, binomial,
+                        calculate_average, calculate_median,
+                        calculate_standard_deviation, convert_temperature,
+                        convert_temperature_many, factorial, factorial_mod,
+                        fibonacci, fibonacci_generator, fibonacci_mod,
+                        fibonacci_sequence, get_converter, is_prime,
+                        is_prime_many, median, multinomial, np,
+                        primes_in_range, quantiles, set_stats_backend,
+                        solve_quadratic, solve_quadratic_many)
+
+
+def _time(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def _sorted_median(numbers):
+    """The previous calculate_median implementation: sort a full copy"""
+    sorted_nums = sorted(numbers)
+    n = len(sorted_nums)
+    mid = n // 2
+    return (sorted_nums[mid - 1] + sorted_nums[mid]) / 2 if n % 2 == 0 else sorted_nums[mid]
+
+
+def benchmark_median(sizes=(10**3, 10**4, 10**5, 10**6, 10**7, 10**8),
+                     python_limit=10**7):
+    """
+    Sort-based median versus selection, for lists and (if installed) NumPy.
+
+    Python lists above python_limit are skipped: 1e8 floats in a list need
+    several GB of memory. NumPy arrays are used for every size.
+    """
+    print("\n" + "=" * 60)
+    print("MEDIAN: SORT VS SELECTION")
+    print("=" * 60)
+    print(f"{'size':>12} {'sorted()':>10} {'select':>10} {'np.median':>10} {'partition':>10}")
+
+    for size in sizes:
+        row = [f"{size:>12,}"]
+        if size <= python_limit:
+            numbers = [random.random() for _ in range(size)]
+            sort_time, expected = _time(_sorted_median, numbers)
+            select_time, result = _time(median, numbers)
+            assert result == expected
+            row += [f"{sort_time:>9.3f}s", f"{select_time:>9.3f}s"]
+            del numbers
+        else:
+            row += [f"{'-':>10}", f"{'-':>10}"]
+
+        if np is not None:
+            values = np.random.default_rng(size).random(size)
+            np_time, expected = _time(np.median, values)
+            partition_time, result = _time(median, values, overwrite_input=True)
+            assert result == expected
+            row += [f"{np_time:>9.3f}s", f"{partition_time:>9.3f}s"]
+            del values
+        print(" ".join(row))
+
+    if np is None:
+        print("NumPy not installed: array backend not benchmarked.")
+
+
+def benchmark_backends(size=10**7):
+    """Pure-Python list path versus array.array/NumPy input on the NumPy backend"""
+    print("\n" + "=" * 60)
+    print(f"STATISTICS BACKENDS ({size:,} values)")
+    print("=" * 60)
+    numbers = array.array('d', (random.random() for _ in range(size)))
+    as_list = numbers.tolist()
+
+    for func in (calculate_average, calculate_median, calculate_standard_deviation):
+        list_time, expected = _time(func, as_list)
+        line = f"  {func.__name__:<30} list {list_time:>8.3f}s"
+        if np is not None:
+            array_time, result = _time(func, numbers)
+            assert math.isclose(result, expected, rel_tol=STATS_RTOL)
+            line += f"   array.array via NumPy {array_time:>8.3f}s"
+        print(line)
+
+    if np is None:
+        print("NumPy not installed: only the pure-Python backend was measured.")
+        return
+    shapes = check_2d_parity()
+    print(f"  2-D input parity (NumPy vs Python backend): ok for {', '.join(shapes)}")
+
+
+def check_2d_parity(rows=301, cols=299, seed=33):
+    """
+    Both backends must give the same statistics for 2-D input: C-order,
+    transposed (non-contiguous) and Fortran-order arrays and a 2-D buffer
+    are all treated as their flattened values. Returns the checked layouts.
+    """
+    rng = random.Random(seed)
+    flat = [rng.uniform(-100, 100) for _ in range(rows * cols)]
+    matrix = np.array(flat).reshape(rows, cols)
+    layouts = {
+        "C-order": matrix,
+        "transposed": matrix.T,
+        "Fortran-order": np.asfortranarray(matrix),
+        "2-D memoryview": memoryview(matrix),
+    }
+    qs = [0, 0.1, 0.5, 0.9, 1]
+    stats = (calculate_average, calculate_median, calculate_standard_deviation,
+             lambda data: quantiles(data, qs))
+
+    for name, data in layouts.items():
+        try:
+            set_stats_backend("python")
+            expected = [func(data) for func in stats]
+        finally:
+            set_stats_backend("auto")
+        results = [func(data) for func in stats]
+        # Same multiset of values: the order-free statistics match the list's
+        assert results[1] == median(flat) and results[3] == quantiles(flat, qs), name
+        for result, reference in zip(results, expected):
+            for a, b in zip(result if isinstance(result, list) else [result],
+                            reference if isinstance(reference, list) else [reference]):
+                assert math.isclose(a, b, rel_tol=STATS_RTOL), (name, a, b)
+    return list(layouts)
+
+
+def _trial_division(n):
+    """The previous is_prime implementation"""
+    if n < 2:
+        return False
+    if n in (2, 3):
+        return True
+    if n % 2 == 0:
+        return False
+    for i in range(3, int(math.sqrt(n)) + 1, 2):
+        if n % i == 0:
+            return False
+    return True
+
+
+def benchmark_primes(count=10**7, sample=10**5):
+    """Trial division versus the sieve, Miller–Rabin and batch APIs"""
+    print("\n" + "=" * 60)
+    print("PRIMALITY")
+    print("=" * 60)
+
+    candidates = range(count)
+    trial_time, _ = _time(lambda: [_trial_division(n) for n in candidates[:sample]])
+    print(f"  trial division, first {sample:,} only: {trial_time:>8.3f}s")
+
+    math_utils._prime_flags = bytearray()  # measure a cold cache
+    batch_time, flags = _time(is_prime_many, candidates)
+    print(f"  is_prime_many, all {count:,}:  {batch_time:>8.3f}s"
+          f"  ({sum(flags):,} primes)")
+
+    big = [10**12 + n for n in range(sample)]
+    trial_time, expected = _time(lambda: [_trial_division(n) for n in big[:1000]])
+    mr_time, result = _time(lambda: [is_prime(n) for n in big[:1000]])
+    assert result == expected
+    print(f"  1,000 values near 1e12: trial {trial_time:.3f}s, Miller–Rabin {mr_time:.3f}s")
+
+    range_time, found = _time(lambda: sum(1 for _ in primes_in_range(10**10, 10**10 + count)))
+    print(f"  primes_in_range(1e10, 1e10 + {count:,}): {range_time:>8.3f}s ({found:,} primes)")
+
+
+def benchmark_fibonacci(list_n=20_000, big_n=10**7):
+    """
+    List builder versus the generator and fast doubling.
+
+    fibonacci_sequence keeps every term, so it is only run up to list_n:
+    the first 1e7 terms would need tens of GB of big integers.
+    """
+    print("\n" + "=" * 60)
+    print("FIBONACCI")
+    print("=" * 60)
+
+    list_time, seq = _time(fibonacci_sequence, list_n + 1)
+    expected = seq[-1]
+    del seq
+    gen_time, result = _time(lambda: next(islice(fibonacci_generator(), list_n, None)))
+    assert result == expected
+    fibonacci.cache_clear()
+    fast_time, result = _time(fibonacci, list_n)
+    assert result == expected
+    print(f"  F({list_n:,}): list {list_time:.3f}s, generator {gen_time:.3f}s,"
+          f" fast doubling {fast_time:.4f}s")
+
+    fibonacci.cache_clear()
+    fast_time, result = _time(fibonacci, big_n)
+    print(f"  fibonacci({big_n:,}):      {fast_time:>8.3f}s"
+          f"  ({result.bit_length():,} bits)")
+    cached_time, _ = _time(fibonacci, big_n)
+    print(f"  fibonacci({big_n:,}) again: {cached_time:>8.6f}s (memoised)")
+    mod_time, _ = _time(fibonacci_mod, 10**18, 10**9 + 7)
+    print(f"  fibonacci_mod(1e18, 1e9+7): {mod_time:>8.6f}s")
+
+
+def benchmark_factorials(sizes=(10**4, 10**5, 3 * 10**5, 10**6), prod_limit=10**5):
+    """
+    Left-to-right product versus math.factorial and the prime-swing factorial.
+
+    The old math.prod(range(1, n + 1)) is only timed up to prod_limit;
+    at 3e5 it already takes close to a minute.
+    """
+    print("\n" + "=" * 60)
+    print("FACTORIALS AND BINOMIALS")
+    print("=" * 60)
+    print(f"{'n':>12} {'math.prod':>10} {'math.factorial':>15} {'factorial':>10}")
+    for n in sizes:
+        row = [f"{n:>12,}"]
+        if n <= prod_limit:
+            prod_time, _ = _time(math.prod, range(1, n + 1))
+            row.append(f"{prod_time:>9.3f}s")
+        else:
+            row.append(f"{'-':>10}")
+        math_time, expected = _time(math.factorial, n)
+        factorial.cache_clear()
+        swing_time, result = _time(factorial, n)
+        assert result == expected
+        del expected, result
+        row += [f"{math_time:>14.3f}s", f"{swing_time:>9.3f}s"]
+        print(" ".join(row))
+
+    print(f"\n{'binomial':>20} {'math.comb':>10} {'binomial':>10}")
+    for n, k in ((10**5, 5 * 10**4), (3 * 10**5, 10**5), (10**6, 5 * 10**5)):
+        comb_time, expected = _time(math.comb, n, k)
+        swing_time, result = _time(binomial, n, k)
+        assert result == expected
+        print(f"{f'C({n:,}, {k:,})':>20} {comb_time:>9.3f}s {swing_time:>9.3f}s")
+
+    counts = [10**5, 10**5, 10**5]
+    multi_time, _ = _time(multinomial, counts)
+    print(f"  multinomial({counts}): {multi_time:.3f}s")
+    mod_time, _ = _time(factorial_mod, 10**6 - 10, 10**6 + 3)
+    print(f"  factorial_mod(1e6 - 10, 1e6 + 3) via Wilson: {mod_time:.6f}s")
+
+
+def _legacy_convert_temperature(value, from_unit, to_unit):
+    """The previous convert_temperature implementation"""
+    valid_units = {"C", "F", "K"}
+    if from_unit not in valid_units or to_unit not in valid_units:
+        return None
+    kelvin = (
+        value + 273.15 if from_unit == "C"
+        else (value - 32) * 5 / 9 + 273.15 if from_unit == "F"
+        else value
+    )
+    if to_unit == "C":
+        return kelvin - 273.15
+    elif to_unit == "F":
+        return (kelvin - 273.15) * 9 / 5 + 32
+    return kelvin
+
+
+def benchmark_temperature(size=10**7):
+    """Per-reading conversion versus a cached converter and bulk conversion"""
+    print("\n" + "=" * 60)
+    print(f"TEMPERATURE CONVERSION ({size:,} readings, C -> F)")
+    print("=" * 60)
+    readings = array.array('d', (random.uniform(-40, 50) for _ in range(size)))
+    as_list = readings.tolist()
+
+    legacy_time, expected = _time(
+        lambda: [_legacy_convert_temperature(v, "C", "F") for v in as_list])
+    print(f"  previous convert_temperature per reading: {legacy_time:>8.3f}s")
+    call_time, _ = _time(lambda: [convert_temperature(v, "C", "F") for v in as_list])
+    print(f"  convert_temperature per reading:          {call_time:>8.3f}s")
+    to_f = get_converter("C", "F")
+    converter_time, _ = _time(lambda: [to_f(v) for v in as_list])
+    print(f"  get_converter('C', 'F') per reading:      {converter_time:>8.3f}s")
+    list_time, result = _time(convert_temperature_many, as_list, "C", "F")
+    assert all(math.isclose(a, b, abs_tol=1e-9) for a, b in zip(result, expected))
+    print(f"  convert_temperature_many(list):           {list_time:>8.3f}s")
+    if np is not None:
+        buffer_time, _ = _time(convert_temperature_many, readings, "C", "F")
+        print(f"  convert_temperature_many(array.array):    {buffer_time:>8.3f}s")
+    else:
+        print("  NumPy not installed: buffers use the list path.")
+
+
+def _textbook_roots(a, b, c):
+    """The previous solve_quadratic formula for two distinct real roots"""
+    sqrt_d = math.sqrt(b ** 2 - 4 * a * c)
+    return (-b + sqrt_d) / (2 * a), (-b - sqrt_d) / (2 * a)
+
+
+def _exact_roots(a, b, c, bits=200):
+    """
+    Reference roots from exact rational arithmetic.
+
+    The discriminant is exact as a Fraction; its square root is taken with
+    integer isqrt to `bits` fractional bits, far below float resolution.
+    """
+    a, b, c = Fraction(a), Fraction(b), Fraction(c)
+    disc = b * b - 4 * a * c
+    scale = 1 << bits
+    sqrt_d = Fraction(math.isqrt(disc.numerator * disc.denominator * scale * scale),
+                      disc.denominator * scale)
+    return float((-b + sqrt_d) / (2 * a)), float((-b - sqrt_d) / (2 * a))
+
+
+def _relative_error(value, reference):
+    return abs(value - reference) / abs(reference) if reference else abs(value)
+
+
+def check_quadratic_accuracy(samples=2000, seed=20):
+    """
+    Worst relative root error of the textbook and stable formulas against
+    the exact reference, on equations with b² ≫ 4ac where the textbook
+    formula cancels catastrophically.
+    """
+    rng = random.Random(seed)
+    worst = {"textbook": 0.0, "solve_quadratic": 0.0, "solve_quadratic_many": 0.0}
+    cases = [(rng.uniform(0.1, 10), rng.choice((-1, 1)) * 10 ** rng.uniform(3, 9),
+              rng.uniform(-10, 10)) for _ in range(samples)]
+    batch = solve_quadratic_many(*zip(*cases))
+    for i, (a, b, c) in enumerate(cases):
+        reference = _exact_roots(a, b, c)
+        for name, roots in (("textbook", _textbook_roots(a, b, c)),
+                            ("solve_quadratic", solve_quadratic(a, b, c)),
+                            ("solve_quadratic_many", (batch.root1[i], batch.root2[i]))):
+            error = max(_relative_error(r, ref) for r, ref in zip(roots, reference))
+            worst[name] = max(worst[name], error)
+    assert worst["solve_quadratic"] < 1e-14 and worst["solve_quadratic_many"] < 1e-14
+    return worst
+
+
+def benchmark_quadratic(size=10**6):
+    """Per-equation solve_quadratic versus the batch solver, plus accuracy"""
+    print("\n" + "=" * 60)
+    print(f"QUADRATIC EQUATIONS ({size:,} equations)")
+    print("=" * 60)
+    rng = random.Random(size)
+    a = [rng.uniform(-10, 10) for _ in range(size)]
+    b = [rng.uniform(-10, 10) for _ in range(size)]
+    c = [rng.uniform(-10, 10) for _ in range(size)]
+
+    loop_time, _ = _time(lambda: [solve_quadratic(*abc) for abc in zip(a, b, c)])
+    print(f"  solve_quadratic per equation: {loop_time:>8.3f}s"
+          f"  ({size / loop_time:,.0f}/s)")
+    batch_time, roots = _time(solve_quadratic_many, a, b, c)
+    print(f"  solve_quadratic_many(lists):  {batch_time:>8.3f}s"
+          f"  ({size / batch_time:,.0f}/s, {sum(roots.complex):,} complex)")
+    if np is not None:
+        arrays = [np.asarray(x) for x in (a, b, c)]
+        array_time, _ = _time(solve_quadratic_many, *arrays)
+        print(f"  solve_quadratic_many(arrays): {array_time:>8.3f}s"
+              f"  ({size / array_time:,.0f}/s)")
+
+    print("\n  Worst relative error, b² ≫ 4ac (exact Fraction reference):")
+    for name, error in check_quadratic_accuracy().items():
+        print(f"    {name:<22} {error:.3e}")
+
+
+def _legacy_random_stats(sample_size):
+    """The original generate_random_stats: per-element draws, then separate passes"""
+    numbers = [random.uniform(1, 100) for _ in range(sample_size)]
+    return {
+        "average": calculate_average(numbers),
+        "median": calculate_median(numbers),
+        "standard_deviation": calculate_standard_deviation(numbers),
+        "min": min(numbers),
+        "max": max(numbers),
+    }
+
+
+def benchmark_random(size=10**7, large=10**8, workers=4):
+    """Per-element sampling plus separate passes versus RandomStream"""
+    print("\n" + "=" * 60)
+    print(f"RANDOM SAMPLES AND STATISTICS ({size:,} samples)")
+    print("=" * 60)
+    legacy_time, _ = _time(_legacy_random_stats, size)
+    print(f"  random.uniform list + separate passes:  {legacy_time:>8.3f}s")
+    stream_time, _ = _time(lambda: RandomStream(1).sample_stats(size, 1, 100))
+    print(f"  RandomStream.sample_stats (chunked):    {stream_time:>8.3f}s"
+          f"  [{RandomStream(1).backend} backend]")
+
+    def split_run(seed):
+        streams = RandomStream(seed).spawn(workers)
+        total = streams[0].sample_stats(large // workers, 1, 100)
+        for stream in streams[1:]:
+            total.merge(stream.sample_stats(large // workers, 1, 100))
+        return total
+
+    split_time, first = _time(split_run, 7)
+    second = split_run(7)
+    assert (first.mean, first.min, first.max) == (second.mean, second.min, second.max)
+    print(f"  {large:,} samples over {workers} spawned streams: {split_time:>8.3f}s"
+          f" (mean {first.mean:.4f}, reproducible)")
+
+
+def benchmark_parallel(size=10**7, workers=None):
+    """Single-process calls versus math_parallel on a process pool"""
+    workers = workers or os.cpu_count() or 1
+    print("\n" + "=" * 60)
+    print(f"PARALLEL MAP/REDUCE ({workers} workers, {os.cpu_count()} CPUs)")
+    print("=" * 60)
+
+    candidates = range(10**12, 10**12 + size // 50)
+    serial_time, expected = _time(lambda: [is_prime(n) for n in candidates])
+    parallel_time, result = _time(parallel_map, is_prime, candidates, workers)
+    assert result == expected
+    print(f"  is_prime over {len(candidates):,} values near 1e12:"
+          f" serial {serial_time:.3f}s, parallel {parallel_time:.3f}s")
+
+    values = (np.random.default_rng(size).random(size) if np is not None
+              else array.array('d', (random.random() for _ in range(size))))
+    serial_stats = RunningStats()
+    serial_time, _ = _time(serial_stats.update_chunk, values)
+    parallel_time, stats = _time(parallel_stats, values, workers)
+    assert math.isclose(stats.mean, serial_stats.mean, rel_tol=STATS_RTOL)
+    print(f"  stats over {size:,} values (shared memory):"
+          f" serial {serial_time:.3f}s, parallel {parallel_time:.3f}s")
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB (None without resource)"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _measured(func, args, results):
+    """Run func(*args) and report (seconds, peak RSS growth in MB, result)"""
+    before = _peak_rss_mb()
+    elapsed, result = _time(func, *args)
+    after = _peak_rss_mb()
+    results.put((elapsed, after - before if after is not None else None, result))
+
+
+def _in_fresh_process(func, *args):
+    """
+    Run a module-level func in a new process so its peak RSS is measured
+    on its own; the figure is peak growth over the process's start-up peak.
+    """
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    worker = context.Process(target=_measured, args=(func, args, results))
+    worker.start()
+    outcome = results.get()
+    worker.join()
+    return outcome
+
+
+def _format_rss(growth):
+    return f"{growth:>13.1f} MB" if growth is not None else f"{'n/a':>16}"
+
+
+def _count_lines(path, mode):
+    """Count lines with one read mode"""
+    if mode == "read_file":
+        return read_file(path).count("\n")
+    if mode == "iter_lines":
+        return sum(1 for _ in iter_lines(path))
+    if mode == "iter_chunks":
+        return sum(chunk.count("\n") for chunk in iter_chunks(path))
+    step = 1 << 20
+    with mmap_file(path) as view:
+        return sum(view[i:i + step].tobytes().count(b"\n")
+                   for i in range(0, len(view), step))
+
+
+def benchmark_file_reads(size_mb=256):
+    """
+    Whole-file read versus the streaming and memory-mapped readers.
+
+    Each mode runs in a fresh process so its peak RSS can be measured on
+    its own. Pages of a memory-mapped file count towards RSS once touched,
+    but they are clean file-backed pages the OS can drop at any time.
+    """
+    print("\n" + "=" * 60)
+    print(f"FILE READS ({size_mb} MB of CRLF lines)")
+    print("=" * 60)
+    line = "2025-10-19 12:00:00 ERROR something went wrong in module x\r\n"
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "big.log")
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            block = line * 10_000
+            for _ in range(size_mb * 1024 * 1024 // len(block)):
+                file.write(block)
+
+        print(f"  {'mode':<12} {'time':>8} {'peak RSS growth':>16} {'lines':>12}")
+        for mode in ("read_file", "iter_lines", "iter_chunks", "mmap_file"):
+            elapsed, growth, lines = _in_fresh_process(_count_lines, path, mode)
+            print(f"  {mode:<12} {elapsed:>7.3f}s {_format_rss(growth)} {lines:>12,}")
+
+
+def benchmark_appends(lines=100_000):
+    """append_to_file per line versus BufferedAppender (with and without fsync)"""
+    print("\n" + "=" * 60)
+    print(f"APPENDS ({lines:,} lines)")
+    print("=" * 60)
+    line = "2025-10-19 12:00:00 INFO request served in 12 ms"
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        path = os.path.join(tmp, "per_call.log")
+        with contextlib.redirect_stdout(devnull):
+            call_time, _ = _time(lambda: [append_to_file(path, line) for _ in range(lines)])
+        print(f"  append_to_file per line:               {call_time:>8.3f}s"
+              f"  ({lines / call_time:>12,.0f} lines/s)")
+
+        for label, options in (("BufferedAppender:", {}),
+                               ("BufferedAppender, fsync every 0.1s:", {"fsync_interval": 0.1})):
+            path = os.path.join(tmp, f"buffered_{len(options)}.log")
+
+            def run():
+                with BufferedAppender(path, **options) as appender:
+                    for _ in range(lines):
+                        appender.append(line)
+
+            buffered_time, _ = _time(run)
+            with open(path, encoding="utf-8") as file:
+                assert sum(1 for _ in file) == lines
+            print(f"  {label:<38} {buffered_time:>8.3f}s"
+                  f"  ({lines / buffered_time:>12,.0f} lines/s)")
+
+
+def benchmark_writes(sizes=(1024, 64 * 1024, 1024 * 1024, 16 * 1024 * 1024), repeats=20):
+    """In-place create_file versus the atomic (temp file + fsync + rename) path"""
+    print("\n" + "=" * 60)
+    print(f"IN-PLACE VERSUS ATOMIC WRITES (mean of {repeats} writes)")
+    print("=" * 60)
+    print(f"  {'size':>10} {'in place':>10} {'atomic':>10} {'overhead':>10}")
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        path = os.path.join(tmp, "target.txt")
+        for size in sizes:
+            content = "x" * (size - 1) + "\n"
+            timings = []
+            for atomic in (False, True):
+                with contextlib.redirect_stdout(devnull):
+                    elapsed, _ = _time(lambda: [create_file(path, content, atomic=atomic)
+                                                for _ in range(repeats)])
+                timings.append(elapsed / repeats)
+            in_place, atomic = timings
+            print(f"  {size:>10,} {in_place * 1000:>8.2f}ms {atomic * 1000:>8.2f}ms"
+                  f" {(atomic - in_place) * 1000:>+8.2f}ms")
+
+
+def _json_records(count):
+    for i in range(count):
+        yield {"id": i, "city": "Lagos", "temperature": 20 + i % 15 * 0.5,
+               "tags": ["sensor", "hourly"], "ok": i % 7 != 0}
+
+
+def _parse_json(path, mode):
+    """Count the top-level elements with one parse mode"""
+    if mode == "read_json_file":
+        return len(read_json_file(path))
+    return sum(1 for _ in iter_json(path))
+
+
+def benchmark_json(records=1_000_000):
+    """Whole-document json versus the streaming reader and writers"""
+    print("\n" + "=" * 60)
+    print(f"JSON ({records:,} records)")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        paths = {}
+        print(f"  {'writer':<32} {'time':>8} {'size':>10} {'MB/s':>8}")
+        data = list(_json_records(records))
+        writers = (
+            ("write_json_file(indent=2)", "pretty.json",
+             lambda path: write_json_file(path, data, indent=2)),
+            ("write_json_file (compact)", "compact.json",
+             lambda path: write_json_file(path, data)),
+            ("write_json_stream (array)", "stream.json",
+             lambda path: write_json_stream(path, _json_records(records))),
+            ("write_json_stream (jsonl)", "stream.jsonl",
+             lambda path: write_json_stream(path, _json_records(records), jsonl=True)),
+        )
+        for label, name, write in writers:
+            paths[name] = path = os.path.join(tmp, name)
+            with contextlib.redirect_stdout(devnull):
+                elapsed, _ = _time(write, path)
+            size = os.path.getsize(path) / (1024 * 1024)
+            print(f"  {label:<32} {elapsed:>7.3f}s {size:>7.1f} MB {size / elapsed:>8.1f}")
+        del data
+
+        print(f"\n  {'reader':<32} {'time':>8} {'peak RSS growth':>16} {'MB/s':>8}")
+        for label, name, mode in (("read_json_file (json.load)", "compact.json", "read_json_file"),
+                                  ("iter_json (array)", "stream.json", "iter_json"),
+                                  ("iter_json (jsonl)", "stream.jsonl", "iter_json")):
+            elapsed, growth, count = _in_fresh_process(_parse_json, paths[name], mode)
+            assert count == records
+            size = os.path.getsize(paths[name]) / (1024 * 1024)
+            print(f"  {label:<32} {elapsed:>7.3f}s {_format_rss(growth)} {size / elapsed:>8.1f}")
+
+
+def _make_tree(root, files, per_directory=1000, fanout=10):
+    """files empty files, per_directory per leaf, leaves fanout-wide per level"""
+    leaves = math.ceil(files / per_directory)
+    depth = max(1, math.ceil(math.log(leaves, fanout))) if leaves > 1 else 1
+    created = 0
+    for leaf in range(leaves):
+        digits, parts = leaf, []
+        for _ in range(depth):
+            digits, part = divmod(digits, fanout)
+            parts.append(f"d{part}")
+        directory = os.path.join(root, *parts)
+        os.makedirs(directory, exist_ok=True)
+        for i in range(min(per_directory, files - created)):
+            suffix = ".log" if i % 10 == 0 else ".txt"
+            open(os.path.join(directory, f"f{i}{suffix}"), "wb").close()
+        created += per_directory
+
+
+def _legacy_walk_sizes(directory):
+    """The old list_directory_contents recursed: listdir + isfile/isdir/getsize"""
+    total = count = 0
+    for item in os.listdir(directory):
+        path = os.path.join(directory, item)
+        if os.path.isfile(path):
+            total += os.path.getsize(path)
+            count += 1
+        elif os.path.isdir(path):
+            sub_total, sub_count = _legacy_walk_sizes(path)
+            total += sub_total
+            count += sub_count
+    return total, count
+
+
+def _os_walk_sizes(root):
+    total = count = 0
+    for directory, _, names in os.walk(root):
+        for name in names:
+            total += os.path.getsize(os.path.join(directory, name))
+            count += 1
+    return total, count
+
+
+def _walk_files_sizes(root, **options):
+    total = count = 0
+    for entry in walk_files(root, **options):
+        total += entry.stat().st_size
+        count += 1
+    return total, count
+
+
+def benchmark_walk(files=1_000_000):
+    """Recursive directory listing with sizes over a generated tree"""
+    print("\n" + "=" * 60)
+    print(f"DIRECTORY WALK ({files:,} files)")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        elapsed, _ = _time(_make_tree, tmp, files)
+        print(f"  (tree built in {elapsed:.1f}s)")
+        walkers = (
+            ("listdir + isfile/isdir/getsize", _legacy_walk_sizes, {}),
+            ("os.walk + getsize", _os_walk_sizes, {}),
+            ("walk_files + entry.stat()", _walk_files_sizes, {}),
+            ("walk_files(workers=8)", _walk_files_sizes, {"workers": 8}),
+            ("walk_files(include='*.log')", _walk_files_sizes, {"include": "*.log"}),
+        )
+        print(f"  {'walker':<32} {'time':>8} {'files/s':>12}")
+        for label, walker, options in walkers:
+            elapsed, (_, count) = _time(walker, tmp, **options)
+            expected = files // 10 if "include" in options else files
+            assert count == expected, (label, count)
+            print(f"  {label:<32} {elapsed:>7.3f}s {count / elapsed:>12,.0f}")
+
+
+def benchmark_fingerprints(files=10_000, size_kb=32, changed=100):
+    """Full-content hashing versus stat-only change detection"""
+    print("\n" + "=" * 60)
+    print(f"FINGERPRINTS ({files:,} files of {size_kb} KB)")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        tree = os.path.join(tmp, "tree")
+        manifest = os.path.join(tmp, "manifest.json")
+        payload = os.urandom(size_kb * 1024)
+        # Old mtimes, so no entry falls inside the recent-modification window
+        old = time.time() - 3600
+        paths = []
+        for i in range(files):
+            directory = os.path.join(tree, f"d{i // 1000}")
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"f{i}.bin")
+            with open(path, "wb") as file:
+                file.write(payload)
+            os.utime(path, (old, old))
+            paths.append(path)
+
+        print(f"  {'run':<36} {'time':>8} {'hashed':>8}")
+        for workers in (1, 4):
+            if os.path.exists(manifest):
+                os.remove(manifest)
+            cache = FileFingerprintCache(manifest, workers=workers)
+            elapsed, _ = _time(cache.scan, tree)
+            cache.save()
+            print(f"  {f'cold scan (workers={workers})':<36} {elapsed:>7.3f}s {cache.hashed_count:>8,}")
+
+        cache = FileFingerprintCache(manifest)
+        elapsed, changes = _time(cache.scan, tree)
+        assert not (changes.added or changes.modified or changes.removed)
+        print(f"  {'warm scan (nothing changed)':<36} {elapsed:>7.3f}s {cache.hashed_count:>8,}")
+
+        for path in paths[::files // changed]:
+            with open(path, "r+b") as file:
+                file.write(b"changed")
+            os.utime(path, (old + 1, old + 1))
+        cache = FileFingerprintCache(manifest)
+        elapsed, changes = _time(cache.scan, tree)
+        assert len(changes.modified) == changed
+        print(f"  {f'warm scan ({changed} modified)':<36} {elapsed:>7.3f}s {cache.hashed_count:>8,}")
+
+
+def _sequential_gzip(sources, destination):
+    for source in sources:
+        target = os.path.join(destination, os.path.basename(source) + ".gz")
+        with open(source, "rb") as src, gzip.open(target, "wb", compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst)
+
+
+def benchmark_bulk(files=500, size_kb=256):
+    """Sequential shutil/gzip loops versus the bulk_file_ops batches"""
+    print("\n" + "=" * 60)
+    print(f"BULK FILE OPERATIONS ({files:,} files of {size_kb} KB,"
+          f" {os.cpu_count()} CPU(s))")
+    print("=" * 60)
+    rng = random.Random(47)
+    # Log-like text, so gzip has something to do; files are windows into it
+    words = [f"word{i}" for i in range(500)]
+    size = size_kb * 1024
+    corpus = " ".join(rng.choices(words, k=size // 4)).encode()
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = os.path.join(tmp, "src")
+        os.makedirs(source_dir)
+        sources = []
+        for i in range(files):
+            path = os.path.join(source_dir, f"artifact{i}.log")
+            offset = rng.randrange(len(corpus) - size)
+            with open(path, "wb") as file:
+                file.write(corpus[offset:offset + size])
+            sources.append(path)
+        total_mb = files * size_kb / 1024
+
+        def target(name):
+            return os.path.join(tmp, name)
+
+        def copy_loop(destination):
+            os.makedirs(destination)
+            for source in sources:
+                shutil.copy2(source, destination)
+
+        def gzip_loop(destination):
+            os.makedirs(destination)
+            _sequential_gzip(sources, destination)
+
+        def move_loop(destination):
+            os.makedirs(destination)
+            for source in sources:
+                shutil.move(source, destination)
+
+        runs = (
+            ("shutil.copy2 loop", lambda: copy_loop(target("copy_loop"))),
+            ("copy_many(workers=1)", lambda: copy_many(sources, target("copy1"), workers=1)),
+            ("copy_many(workers=8)", lambda: copy_many(sources, target("copy8"))),
+            ("gzip loop", lambda: gzip_loop(target("gz_loop"))),
+            ("compress_many(level=6)", lambda: compress_many(sources, target("gz_many"))),
+            ("compress_many(level=1)", lambda: compress_many(sources, target("gz_fast"), level=1)),
+        )
+        print(f"  {'operation':<28} {'time':>8} {'MB/s':>8}")
+        for label, run in runs:
+            elapsed, report = _time(run)
+            if report is not None:
+                assert report.ok, report.failed[:1]
+            print(f"  {label:<28} {elapsed:>7.3f}s {total_mb / elapsed:>8.1f}")
+
+        copies = [os.path.join(target("copy1"), os.path.basename(path)) for path in sources]
+        elapsed, _ = _time(move_loop, target("move_loop"))
+        print(f"  {'shutil.move loop':<28} {elapsed:>7.3f}s")
+        elapsed, report = _time(move_many, copies, target("move_many"))
+        assert report.ok and len(report.results) == files
+        print(f"  {'move_many':<28} {elapsed:>7.3f}s")
+
+
+if __name__ == "__main__":
+    benchmark_median()
+    benchmark_backends()
+    benchmark_primes()
+    benchmark_fibonacci()
+    benchmark_factorials()
+    benchmark_temperature()
+    benchmark_quadratic()
+    benchmark_random()
+    benchmark_parallel()
+    benchmark_file_reads()
+    benchmark_appends()
+    benchmark_writes()
+    benchmark_json()
+    benchmark_walk()
+    benchmark_fingerprints()
+    benchmark_bulk()
@@ -0,0 +1,447 @@
+"""
+Bulk File Operations Module
+===========================
+
+Copy, compress and move many files at once on top of file_utils.
+
+Includes:
+- copy_many: parallel copies on a bounded thread pool, using os.sendfile
+  (kernel-side copy) where available and large-buffer copyfileobj otherwise
+- compress_many: gzip compression on a process pool, since compression is
+  CPU-bound and holds the GIL for most of its work
+- move_many: renames within a filesystem, copy + delete across filesystems
+- Progress callbacks and per-file results: a failing file is recorded in
+  the report and the rest of the batch carries on
+
+Files are given either as a mapping {source: destination} or as a list of
+sources plus a destination directory (optionally keeping paths relative
+to a root directory, e.g. the walk_files root).
+
+Example:
+    from file_utils import walk_files
+    from bulk_file_ops import compress_many, copy_many
+
+    sources = [entry.path for entry in walk_files("dist", include="*.whl")]
+    report = copy_many(sources, "/srv/artifacts", root="dist")
+    report = compress_many(sources, "/srv/archive", root="dist", workers=4)
+    report.failed                   # [FileResult(..., error="...")]
+"""
+
+import errno
+import gzip
+import os
+import shutil
+import time
+import uuid
+from concurrent.futures import (Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed)
+from contextlib import contextmanager
+from typing import (Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional,
+                    Tuple, Union)
+
+# Copy buffer for the copyfileobj fallback and chunk size for os.sendfile
+BUFFER_SIZE = 1 << 20
+# Thread pool size for copies and moves: enough to overlap I/O waits
+# without flooding the disk queue
+DEFAULT_IO_WORKERS = 8
+# Below this many files compression runs in-process (pool start-up costs more)
+MIN_PARALLEL_FILES = 4
+
+
+class FileResult(NamedTuple):
+    """Outcome of one file in a batch; error is None on success."""
+    source: str
+    destination: str
+    bytes_read: int = 0
+    bytes_written: int = 0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BatchReport(NamedTuple):
+    """Per-file results of a batch, in input order, and its wall time."""
+    results: List[FileResult]
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results)
+
+    @property
+    def succeeded(self) -> List[FileResult]:
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[FileResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def bytes_read(self) -> int:
+        return sum(result.bytes_read for result in self.results)
+
+    @property
+    def bytes_written(self) -> int:
+        return sum(result.bytes_written for result in self.results)
+
+
+ProgressCallback = Callable[[int, int, FileResult], None]
+Jobs = Union[Mapping[str, str], Iterable[str]]
+
+
+def plan_destinations(sources: Jobs, destination: Optional[str] = None,
+                      root: Optional[str] = None, suffix: str = "") -> List[Tuple[str, str]]:
+    """
+    Turn the accepted job formats into (source, destination) pairs.
+
+    Args:
+        sources: A mapping {source: destination} (destination and root are
+            then ignored) or an iterable of source paths.
+        destination (str): Target directory for an iterable of sources.
+        root (str): Keep each source's path relative to root under
+            destination; by default only the file name is kept.
+        suffix (str): Appended to every destination, e.g. ".gz".
+
+    Raises:
+        ValueError: If two sources would get the same destination (e.g. equal
+            file names from different directories without root); otherwise
+            one would silently overwrite the other.
+    """
+    if isinstance(sources, Mapping):
+        pairs = [(source, target + suffix) for source, target in sources.items()]
+    elif destination is None:
+        raise ValueError("A destination directory is required when sources is not a mapping.")
+    else:
+        pairs = []
+        for source in sources:
+            name = os.path.relpath(source, root) if root is not None else os.path.basename(source)
+            pairs.append((source, os.path.join(destination, name) + suffix))
+
+    claimed: Dict[str, str] = {}
+    for source, target in pairs:
+        key = os.path.normcase(os.path.abspath(target))
+        if key in claimed:
+            raise ValueError(f"Sources '{claimed[key]}' and '{source}' have the same "
+                             f"destination: {target}")
+        claimed[key] = source
+    return pairs
+
+
+def _prepare_destination(destination: str) -> None:
+    directory = os.path.dirname(destination)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+def _check_not_same_file(source: str, destination: str) -> None:
+    """Raise shutil.SameFileError if destination is source (or a link to it)."""
+    try:
+        same = os.path.samefile(source, destination)
+    except OSError:
+        # Typically the destination does not exist yet
+        return
+    if same:
+        raise shutil.SameFileError(f"'{source}' and '{destination}' are the same file")
+
+
+@contextmanager
+def _open_destination(destination: str, overwrite: bool) -> Iterator:
+    """
+    Binary write handle for destination; the partial file is removed if
+    the block fails.
+
+    With overwrite=False the file is created exclusively ('xb' raises
+    FileExistsError if it exists). With overwrite=True the data goes to a
+    temporary file next to the (symlink-resolved) destination, which
+    replaces it only once complete, so a failed copy leaves an existing
+    destination untouched.
+    """
+    if overwrite:
+        target = os.path.realpath(destination)
+        path = os.path.join(os.path.dirname(target),
+                            f".{os.path.basename(target)}.{uuid.uuid4().hex[:12]}.tmp")
+    else:
+        target = path = destination
+    handle = open(path, 'xb')
+    try:
+        with handle:
+            yield handle
+        if path != target:
+            os.replace(path, target)
+    except BaseException:
+        _remove_partial(path)
+        raise
+
+
+def _remove_partial(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+# link() errors that mean "no hard link possible here", not "destination exists"
+_NO_HARDLINK_ERRNOS = frozenset(
+    code for code in (errno.EXDEV, errno.EPERM, errno.EMLINK,
+                      getattr(errno, 'ENOTSUP', None), getattr(errno, 'EOPNOTSUPP', None))
+    if code is not None)
+_LINK_NOFOLLOW = {'follow_symlinks': False} if os.link in os.supports_follow_symlinks else {}
+
+
+def copy_file(source: str, destination: str, buffer_size: int = BUFFER_SIZE,
+              overwrite: bool = True, preserve_metadata: bool = True) -> int:
+    """
+    Copy one file and return the number of bytes copied.
+
+    Uses os.sendfile where the platform supports file-to-file sendfile
+    (Linux), so the data never passes through Python; otherwise
+    shutil.copyfileobj with a large buffer. With overwrite=True the copy
+    goes to a temporary file that replaces destination once complete;
+    if the copy fails, only the partial file is removed and an existing
+    destination is left as it was.
+
+    Raises:
+        shutil.SameFileError: If destination is the source file itself.
+        FileExistsError: If overwrite is False and destination exists.
+    """
+    _prepare_destination(destination)
+    _check_not_same_file(source, destination)
+    with open(source, 'rb') as src:
+        size = os.fstat(src.fileno()).st_size
+        with _open_destination(destination, overwrite) as dst:
+            copied = _sendfile(src, dst, size, buffer_size)
+            if copied is None:
+                shutil.copyfileobj(src, dst, buffer_size)
+                copied = dst.tell()
+    if preserve_metadata:
+        shutil.copystat(source, destination)
+    return copied
+
+
+def _sendfile(src, dst, size: int, chunk_size: int) -> Optional[int]:
+    """Kernel copy with os.sendfile; None if unsupported for these files."""
+    if not hasattr(os, 'sendfile') or not size:
+        return None
+    in_fd, out_fd = src.fileno(), dst.fileno()
+    offset = 0
+    while offset < size:
+        try:
+            sent = os.sendfile(out_fd, in_fd, offset, min(chunk_size, size - offset))
+        except OSError:
+            if offset == 0:
+                # e.g. ENOTSOCK/EINVAL on platforms limited to sockets
+                return None
+            raise
+        if sent == 0:
+            break
+        offset += sent
+    return offset
+
+
+def compress_file(source: str, destination: str, level: int = 6,
+                  buffer_size: int = BUFFER_SIZE, overwrite: bool = True) -> Tuple[int, int]:
+    """
+    gzip one file; returns (bytes read, bytes written).
+
+    The original file name and modification time are stored in the gzip
+    header, as the gzip tool does. Raises like copy_file.
+    """
+    _prepare_destination(destination)
+    _check_not_same_file(source, destination)
+    mtime = os.stat(source).st_mtime
+    with open(source, 'rb') as src:
+        with _open_destination(destination, overwrite) as raw:
+            with gzip.GzipFile(os.path.basename(source), 'wb', level, raw, mtime) as dst:
+                shutil.copyfileobj(src, dst, buffer_size)
+            written = raw.tell()
+        return src.tell(), written
+
+
+def move_file(source: str, destination: str, buffer_size: int = BUFFER_SIZE,
+              overwrite: bool = True) -> int:
+    """
+    Move one file and return its size.
+
+    A rename (os.replace) when source and destination are on the same
+    filesystem; otherwise the file is copied with copy_file and the source
+    removed once the copy has succeeded. With overwrite=False the rename
+    is a hard link plus unlink of the source instead, so an existing
+    destination makes it fail (FileExistsError) without a check-then-rename
+    race; where no hard link is possible the copy creates the destination
+    exclusively.
+    """
+    _prepare_destination(destination)
+    _check_not_same_file(source, destination)
+    size = os.stat(source).st_size
+    try:
+        if overwrite:
+            os.replace(source, destination)
+        else:
+            # Link the entry itself, as a rename would, where supported
+            os.link(source, destination, **_LINK_NOFOLLOW)
+    except FileExistsError:
+        raise
+    except OSError as e:
+        if e.errno != errno.EXDEV and (overwrite or e.errno not in _NO_HARDLINK_ERRNOS):
+            raise
+    else:
+        if not overwrite:
+            os.unlink(source)
+        return size
+    copy_file(source, destination, buffer_size, overwrite=overwrite)
+    os.remove(source)
+    return size
+
+
+# --- Batch Workers ---
+def _copy_job(source: str, destination: str, buffer_size: int,
+              overwrite: bool, preserve_metadata: bool) -> FileResult:
+    copied = copy_file(source, destination, buffer_size, overwrite, preserve_metadata)
+    return FileResult(source, destination, copied, copied)
+
+
+def _compress_job(source: str, destination: str, level: int, buffer_size: int,
+                  overwrite: bool) -> FileResult:
+    read, written = compress_file(source, destination, level, buffer_size, overwrite)
+    return FileResult(source, destination, read, written)
+
+
+def _move_job(source: str, destination: str, buffer_size: int, overwrite: bool) -> FileResult:
+    size = move_file(source, destination, buffer_size, overwrite)
+    return FileResult(source, destination, size, size)
+
+
+def _error_result(source: str, destination: str, error: BaseException) -> FileResult:
+    return FileResult(source, destination, error=f"{type(error).__name__}: {error}")
+
+
+@contextmanager
+def _executor(executor: Optional[Executor], factory: Callable[[int], Executor],
+              workers: int) -> Iterator[Executor]:
+    if executor is not None:
+        yield executor
+    else:
+        with factory(workers) as pool:
+            yield pool
+
+
+def _run_batch(job: Callable[..., FileResult], pairs: List[Tuple[str, str]], args: tuple,
+               workers: int, factory: Callable[[int], Executor],
+               executor: Optional[Executor], progress: Optional[ProgressCallback],
+               min_parallel: int = 2) -> BatchReport:
+    """
+    Run job(source, destination, *args) for every pair and collect the results.
+
+    Errors are caught per file. progress(done, total, result) is called
+    from the calling thread after each file, in completion order.
+    """
+    start = time.perf_counter()
+    total = len(pairs)
+    results: List[Optional[FileResult]] = [None] * total
+    done = 0
+
+    def finish(index: int, result: FileResult) -> None:
+        nonlocal done
+        results[index] = result
+        done += 1
+        if progress is not None:
+            progress(done, total, result)
+
+    if executor is None and (workers <= 1 or total < min_parallel):
+        for index, (source, destination) in enumerate(pairs):
+            try:
+                result = job(source, destination, *args)
+            except Exception as e:
+                result = _error_result(source, destination, e)
+            finish(index, result)
+    else:
+        with _executor(executor, factory, workers) as pool:
+            futures: Dict[Future, int] = {
+                pool.submit(job, source, destination, *args): index
+                for index, (source, destination) in enumerate(pairs)}
+            for future in as_completed(futures):
+                index = futures[future]
+                source, destination = pairs[index]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = _error_result(source, destination, e)
+                finish(index, result)
+
+    return BatchReport(results, time.perf_counter() - start)
+
+
+def _thread_pool(workers: int) -> Executor:
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def _process_pool(workers: int) -> Executor:
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def copy_many(sources: Jobs, destination: Optional[str] = None, root: Optional[str] = None,
+              workers: int = DEFAULT_IO_WORKERS, buffer_size: int = BUFFER_SIZE,
+              overwrite: bool = True, preserve_metadata: bool = True,
+              progress: Optional[ProgressCallback] = None,
+              executor: Optional[Executor] = None) -> BatchReport:
+    """
+    Copy many files on a bounded thread pool (see copy_file).
+
+    Args:
+        sources, destination, root: See plan_destinations.
+        workers (int): Concurrent copies; 1 copies sequentially.
+        overwrite (bool): False makes existing destinations per-file errors.
+        preserve_metadata (bool): Copy permission bits and timestamps.
+        progress (callable): progress(done, total, result) after each file.
+        executor (Executor): Reuse an existing pool instead of starting one.
+
+    Returns:
+        BatchReport: One FileResult per file, in input order.
+    """
+    pairs = plan_destinations(sources, destination, root)
+    return _run_batch(_copy_job, pairs, (buffer_size, overwrite, preserve_metadata),
+                      workers, _thread_pool, executor, progress)
+
+
+def compress_many(sources: Jobs, destination: Optional[str] = None,
+                  root: Optional[str] = None, workers: Optional[int] = None, level: int = 6,
+                  buffer_size: int = BUFFER_SIZE, overwrite: bool = True,
+                  progress: Optional[ProgressCallback] = None,
+                  executor: Optional[Executor] = None) -> BatchReport:
+    """
+    gzip many files on a process pool (see compress_file).
+
+    Destinations get a ".gz" suffix when given as a directory; mapping
+    destinations are used as they are. Small batches (under
+    MIN_PARALLEL_FILES) run in-process.
+
+    Args:
+        workers (int): Worker processes (default: CPU count).
+        level (int): gzip compression level, 1 (fastest) to 9 (smallest).
+        Others: As for copy_many.
+    """
+    suffix = "" if isinstance(sources, Mapping) else ".gz"
+    pairs = plan_destinations(sources, destination, root, suffix)
+    workers = workers or os.cpu_count() or 1
+    return _run_batch(_compress_job, pairs, (level, buffer_size, overwrite), workers,
+                      _process_pool, executor, progress, min_parallel=MIN_PARALLEL_FILES)
+
+
+def move_many(sources: Jobs, destination: Optional[str] = None, root: Optional[str] = None,
+              workers: int = DEFAULT_IO_WORKERS, buffer_size: int = BUFFER_SIZE,
+              overwrite: bool = True, progress: Optional[ProgressCallback] = None,
+              executor: Optional[Executor] = None) -> BatchReport:
+    """
+    Move many files on a bounded thread pool (see move_file).
+
+    Same-filesystem moves are plain renames and finish almost instantly;
+    cross-filesystem moves are copies, which is where the pool helps.
+
+    Args:
+        As for copy_many.
+    """
+    pairs = plan_destinations(sources, destination, root)
+    return _run_batch(_move_job, pairs, (buffer_size, overwrite), workers,
+                      _thread_pool, executor, progress)
@@ -2,22 +2,112 @@
 File Utilities Module
 
 A collection of reusable file operations for common tasks.
-Includes file creation, reading, writing, and management functions.
+Includes file creation, reading, writing, and management functions,
+plus streaming and memory-mapped reads for files too large for memory,
+a buffered appender for high-rate appends, crash-safe atomic writes,
+a scandir-based tree walker and a content-fingerprint cache for change
+detection.
 """
 
 import os
+import re
 import json
+import mmap
+import stat
+import uuid
+import atexit
+import fnmatch
+import hashlib
 import datetime
-from typing import List, Dict, Any, Union
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import (List, Dict, Any, Callable, Deque, Iterable, Iterator, NamedTuple,
+                    Optional, Tuple, Union)
 
 
-def create_file(filename: str, content: str = "") -> bool:
+def _fsync_directory(directory: str) -> None:
+    """Persist a rename in directory (POSIX only; Windows cannot open directories)."""
+    if os.name == 'nt':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_write(filename: str, mode: str = 'w', encoding: str = 'utf-8') -> Iterator[Any]:
+    """
+    Open a temporary file next to filename for writing; on success it is
+    fsync'ed and renamed over filename with os.replace, then the directory
+    is fsync'ed so the rename itself survives a crash.
+
+    Readers see either the old file or the complete new one, never a
+    partial write. If the block raises, the temporary file is removed and
+    filename is left untouched. If filename is a symlink, the file it
+    points to is replaced and the link kept. An existing file's
+    permissions are kept, and its owner where the process may set it;
+    other hard links to it keep pointing at the old contents.
+
+    Args:
+        filename (str): Target file.
+        mode (str): 'w' for text or 'wb' for bytes.
+        encoding (str): Text encoding (ignored in binary mode).
+
+    Yields:
+        file: The open temporary file.
+    """
+    target = os.path.realpath(filename)
+    directory = os.path.dirname(target)
+    temp_path = os.path.join(
+        directory, f".{os.path.basename(target)}.{uuid.uuid4().hex[:12]}.tmp")
+    try:
+        existing = os.stat(target)
+    except FileNotFoundError:
+        existing = None
+    # 0o666 lets the umask decide permissions, as open(filename, 'w') would
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0),
+                 0o666)
+    try:
+        if existing is not None:
+            _copy_ownership(temp_path, existing)
+        with open(fd, mode, encoding=None if 'b' in mode else encoding) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, target)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_directory(directory)
+
+
+def _copy_ownership(path: str, st: os.stat_result) -> None:
+    """Give path the permission bits and (if allowed) the owner and group of st."""
+    os.chmod(path, stat.S_IMODE(st.st_mode))
+    if hasattr(os, 'chown'):
+        try:
+            os.chown(path, st.st_uid, st.st_gid)
+        except PermissionError:
+            pass
+
+
+def create_file(filename: str, content: str = "", atomic: bool = True) -> bool:
     """
     Create a new file with optional content.
 
     Args:
         filename (str): Name or path of the file to create.
         content (str): Optional content to write to the file.
+        atomic (bool): Write through atomic_write so a crash never leaves a
+            truncated file; False writes in place (faster, not crash-safe).
 
     Returns:
         bool: True if successful, False otherwise.
@@ -27,7 +117,8 @@ def create_file(filename: str, content: str = "") -> bool:
         if directory and not os.path.exists(directory):
             os.makedirs(directory)
 
-        with open(filename, 'w', encoding='utf-8') as file:
+        opener = atomic_write(filename) if atomic else open(filename, 'w', encoding='utf-8')
+        with opener as file:
             file.write(content)
 
         print(f"File created: {filename}")
@@ -42,6 +133,9 @@ def read_file(filename: str) -> Union[str, None]:
     """
     Read the entire content of a file.
 
+    For files that may not fit in memory use iter_lines, iter_chunks or
+    mmap_file instead.
+
     Args:
         filename (str): Name or path of the file to read.
 
@@ -59,10 +153,311 @@ def read_file(filename: str) -> Union[str, None]:
         return None
 
 
+def iter_lines(filename: str, chunk_size: int = 1 << 16, encoding: str = 'utf-8',
+               keepends: bool = False) -> Iterator[str]:
+    """
+    Yield the lines of a text file one at a time.
+
+    Only about chunk_size bytes are buffered, so memory use does not grow
+    with the file. Windows (CRLF) and old Mac (CR) line endings are
+    recognised; with keepends=False they are stripped, with keepends=True
+    each line keeps its original ending.
+
+    Args:
+        filename (str): Name or path of the file to read.
+        chunk_size (int): Read buffer size in bytes.
+        encoding (str): Text encoding of the file.
+        keepends (bool): Keep the line endings.
+
+    Yields:
+        str: One line at a time (nothing if the file cannot be opened).
+
+    Raises:
+        OSError, UnicodeDecodeError: If reading fails once iteration has
+            started; a partial result is never passed off as the whole file.
+    """
+    try:
+        file = open(filename, 'r', encoding=encoding, buffering=chunk_size,
+                    newline='' if keepends else None)
+    except FileNotFoundError:
+        print(f"File not found: {filename}")
+        return
+    except Exception as e:
+        print(f"Error reading file '{filename}': {e}")
+        return
+    with file:
+        if keepends:
+            yield from file
+        else:
+            for line in file:
+                yield line[:-1] if line.endswith('\n') else line
+
+
+def iter_chunks(filename: str, chunk_size: int = 1 << 20, binary: bool = False,
+                encoding: str = 'utf-8') -> Iterator[Union[str, bytes]]:
+    """
+    Yield a file in pieces of at most chunk_size characters (or bytes).
+
+    In text mode multi-byte characters are never split between chunks and
+    line endings are translated to LF; in binary mode the raw bytes are
+    returned unchanged.
+
+    Args:
+        filename (str): Name or path of the file to read.
+        chunk_size (int): Characters (text) or bytes (binary) per chunk.
+        binary (bool): Yield bytes instead of str.
+        encoding (str): Text encoding (ignored in binary mode).
+
+    Yields:
+        str or bytes: Consecutive chunks (nothing if the file cannot be opened).
+
+    Raises:
+        OSError, UnicodeDecodeError: If reading fails once iteration has started.
+    """
+    try:
+        if binary:
+            file = open(filename, 'rb', buffering=0)
+        else:
+            file = open(filename, 'r', encoding=encoding)
+    except FileNotFoundError:
+        print(f"File not found: {filename}")
+        return
+    except Exception as e:
+        print(f"Error reading file '{filename}': {e}")
+        return
+    with file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+@contextmanager
+def mmap_file(filename: str) -> Iterator[memoryview]:
+    """
+    Memory-map a file read-only and provide a zero-copy memoryview of it.
+
+    Pages are loaded by the OS on access, so slicing the view reads only the
+    parts that are used. The view holds raw bytes; decode slices with the
+    file's encoding (bytes(view[a:b]).decode(...)). The view is released
+    and the mapping closed when the block exits, so do not keep references
+    to it (or its slices) afterwards.
+
+    Args:
+        filename (str): Name or path of the file to map.
+
+    Yields:
+        memoryview: Read-only view of the whole file (empty for an empty file).
+
+    Raises:
+        OSError: If the file cannot be opened or mapped.
+    """
+    with open(filename, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            yield memoryview(b'')
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+
+
+# Appenders not closed yet; any still open at interpreter exit are flushed
+# and closed there
+_open_appenders = set()
+
+
+@atexit.register
+def _close_open_appenders() -> None:
+    for appender in list(_open_appenders):
+        appender.close()
+
+
+class BufferedAppender:
+    """
+    Append lines to a file through one open handle with batched writes.
+
+    Lines are collected in memory and written in one call once
+    max_buffer_bytes have accumulated or flush_interval seconds after the
+    first unwritten line, whichever comes first (timed flushes run on one
+    background thread per appender, started on first use). With
+    fsync_interval set, flushed data is also fsync'ed to disk at most once
+    per interval (group commit; 0 = on every flush). Pending lines are flushed on close(), when
+    leaving a with block, and at interpreter exit.
+
+    A failed flush drops the lines it was writing (part of them may have
+    reached the file) rather than writing them again later. append(),
+    flush() and close() report their own failures by returning False;
+    every failure, including those of timed flushes on the background
+    thread, is kept in the errors deque (most recent last).
+
+    Args:
+        filename (str): Name or path of the file to append to.
+        max_buffer_bytes (int): Flush once this many bytes (in the file's
+            encoding) are buffered (0 = write every line immediately).
+        flush_interval (float): Longest time in seconds a line may wait in
+            the buffer (0 = no timed flush).
+        fsync_interval (float): Seconds between fsyncs, None to never fsync.
+        quiet (bool): Skip the per-call "Content appended" message.
+        encoding (str): Text encoding of the file.
+        create_dirs (bool): Create missing parent directories.
+
+    Example:
+        with BufferedAppender("events.log") as appender:
+            for event in events:
+                appender.append(event)
+    """
+
+    MAX_ERRORS = 100  # flush failures kept in errors
+
+    def __init__(self, filename: str, max_buffer_bytes: int = 64 * 1024,
+                 flush_interval: float = 1.0, fsync_interval: Union[float, None] = None,
+                 quiet: bool = True, encoding: str = 'utf-8', create_dirs: bool = True):
+        self.filename = filename
+        self.max_buffer_bytes = max_buffer_bytes
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.quiet = quiet
+        self.encoding = encoding
+        self.errors: Deque[Exception] = deque(maxlen=self.MAX_ERRORS)
+
+        directory = os.path.dirname(filename)
+        if create_dirs and directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._file = open(filename, 'a', encoding=encoding)
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._lock = threading.Lock()
+        # Timed flushes: the flusher thread sleeps until _deadline (monotonic
+        # time by which the buffered lines must be written), None if idle
+        self._wakeup = threading.Condition(self._lock)
+        self._deadline: Union[float, None] = None
+        self._flusher: Union[threading.Thread, None] = None
+        self._last_fsync = time.monotonic()
+        self._unsynced = False
+        _open_appenders.add(self)
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    def append(self, content: str) -> bool:
+        """
+        Buffer one line (a newline is added).
+
+        Returns:
+            bool: True if successful, False if a triggered flush failed.
+        """
+        with self._lock:
+            if self._file is None:
+                raise ValueError(f"BufferedAppender for '{self.filename}' is closed")
+            line = content + '\n'
+            self._buffer.append(line)
+            self._buffered += len(line.encode(self.encoding))
+            if self._buffered >= self.max_buffer_bytes:
+                ok = self._flush_locked()
+            else:
+                ok = True
+                if self.flush_interval and self._deadline is None:
+                    self._deadline = time.monotonic() + self.flush_interval
+                    if self._flusher is None:
+                        self._flusher = threading.Thread(
+                            target=self._run_flusher, daemon=True,
+                            name=f"BufferedAppender({self.filename})")
+                        self._flusher.start()
+                    else:
+                        self._wakeup.notify()
+        if ok and not self.quiet:
+            print(f"Content appended to: {self.filename}")
+        return ok
+
+    def _run_flusher(self) -> None:
+        """Write buffered lines when their flush_interval is up, until closed."""
+        with self._lock:
+            while self._file is not None:
+                if self._deadline is None:
+                    self._wakeup.wait()
+                    continue
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._wakeup.wait(remaining)
+                else:
+                    # Nobody to return False to: the failure lands in errors
+                    self._flush_locked(report=False)
+
+    def flush(self) -> bool:
+        """
+        Write buffered lines to the file (and fsync if one is due).
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_locked(self, force_fsync: bool = False, report: bool = True) -> bool:
+        self._deadline = None
+        if self._file is None:
+            return True
+        try:
+            if self._buffer:
+                # Taken out of the buffer first, so a write that fails
+                # partway is not repeated (duplicating lines) by the next flush
+                data = ''.join(self._buffer)
+                self._buffer.clear()
+                self._buffered = 0
+                self._file.write(data)
+                self._file.flush()
+                self._unsynced = True
+            if self.fsync_interval is not None and self._unsynced:
+                now = time.monotonic()
+                if force_fsync or now - self._last_fsync >= self.fsync_interval:
+                    os.fsync(self._file.fileno())
+                    self._last_fsync = now
+                    self._unsynced = False
+            return True
+        except Exception as e:
+            self.errors.append(e)
+            if report:
+                print(f"Error appending to file '{self.filename}': {e}")
+            return False
+
+    def close(self) -> bool:
+        """
+        Flush pending lines (fsync'ing them when fsync_interval is set) and
+        close the file. Safe to call more than once.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        with self._lock:
+            if self._file is None:
+                return True
+            ok = self._flush_locked(force_fsync=True)
+            self._file.close()
+            self._file = None
+            self._wakeup.notify_all()
+        _open_appenders.discard(self)
+        return ok
+
+    def __enter__(self) -> "BufferedAppender":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
 def append_to_file(filename: str, content: str) -> bool:
     """
     Append content to an existing file.
 
+    Opens, writes and closes the file on every call; for many appends use
+    a BufferedAppender instead.
+
     Args:
         filename (str): Name or path of the file.
         content (str): Content to append.
@@ -105,13 +500,21 @@ def read_json_file(filename: str) -> Union[Dict[Any, Any], List[Any], None]:
         return None
 
 
-def write_json_file(filename: str, data: Union[Dict[Any, Any], List[Any]]) -> bool:
+def write_json_file(filename: str, data: Union[Dict[Any, Any], List[Any]],
+                    atomic: bool = True, indent: Optional[int] = None) -> bool:
     """
-    Write data to a JSON file with proper formatting.
+    Write data to a JSON file.
+
+    The default is compact output (no indentation, no spaces after
+    separators), which is smaller and faster to write; pass indent=2 for
+    human-readable formatting.
 
     Args:
         filename (str): Name or path of the JSON file.
         data (dict or list): Data to write as JSON.
+        atomic (bool): Write through atomic_write so readers never see
+            partial JSON; False writes in place (faster, not crash-safe).
+        indent (int): Indentation for pretty-printing (None = compact).
 
     Returns:
         bool: True if successful, False otherwise.
@@ -121,8 +524,13 @@ def write_json_file(filename: str, data: Union[Dict[Any, Any], List[Any]]) -> bo
         if directory and not os.path.exists(directory):
             os.makedirs(directory)
 
-        with open(filename, 'w', encoding='utf-8') as file:
-            json.dump(data, file, indent=2, ensure_ascii=False)
+        separators = _COMPACT_SEPARATORS if indent is None else None
+        # One dumps() call runs entirely in the C encoder (when compact);
+        # json.dump() would write many small chunks from Python
+        text = json.dumps(data, indent=indent, separators=separators, ensure_ascii=False)
+        opener = atomic_write(filename) if atomic else open(filename, 'w', encoding='utf-8')
+        with opener as file:
+            file.write(text)
 
         print(f"JSON data written to: {filename}")
         return True
@@ -132,10 +540,201 @@ def write_json_file(filename: str, data: Union[Dict[Any, Any], List[Any]]) -> bo
         return False
 
 
+# --- Streaming JSON ---
+_COMPACT_SEPARATORS = (',', ':')
+_WHITESPACE = re.compile(r'\s*')
+
+
+def iter_json(filename: str, chunk_size: int = 1 << 16,
+              encoding: str = 'utf-8') -> Iterator[Any]:
+    """
+    Yield the top-level elements of a large JSON document one at a time.
+
+    A file starting with '[' is read as a JSON array and its elements are
+    parsed incrementally from chunk_size reads; anything else is read as
+    JSON Lines (one value per line, blank lines skipped). Memory use is
+    bounded by the largest single element, not the file.
+
+    Args:
+        filename (str): Name or path of the JSON or JSONL file.
+        chunk_size (int): Characters read per chunk.
+        encoding (str): Text encoding of the file.
+
+    Yields:
+        Any: One parsed element at a time (nothing if the file cannot be
+        opened).
+
+    Raises:
+        json.JSONDecodeError: On invalid JSON, including a truncated array
+            ("[1, 2,"), after yielding the elements before the error.
+        OSError, UnicodeDecodeError: If reading fails once iteration has started.
+    """
+    try:
+        file = open(filename, 'r', encoding=encoding)
+    except FileNotFoundError:
+        print(f"JSON file not found: {filename}")
+        return
+    except Exception as e:
+        print(f"Error reading JSON file '{filename}': {e}")
+        return
+    with file:
+        buffer = file.read(chunk_size)
+        position = _WHITESPACE.match(buffer).end()
+        while position == len(buffer):
+            more = file.read(chunk_size)
+            if not more:
+                return
+            buffer, position = more, _WHITESPACE.match(more).end()
+
+        if buffer[position] == '[':
+            yield from _iter_json_array(file, buffer, position + 1, chunk_size)
+        else:
+            file.seek(0)
+            for number, line in enumerate(file, 1):
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise json.JSONDecodeError(
+                            f"line {number}: {e.msg}", e.doc, e.pos) from None
+
+
+def _iter_json_array(file: Any, buffer: str, position: int, chunk_size: int) -> Iterator[Any]:
+    """Parse array elements from buffer[position:] onwards, reading more as needed."""
+    decode = json.JSONDecoder().raw_decode
+    eof = False
+    expect_value, seen_value = True, False
+
+    while True:
+        position = _WHITESPACE.match(buffer, position).end()
+        if position < len(buffer):
+            char = buffer[position]
+            if char == ']' and (seen_value != expect_value):
+                return
+            if not expect_value:
+                if char != ',':
+                    raise json.JSONDecodeError("Expecting ',' or ']'", buffer, position)
+                expect_value, position = True, position + 1
+                continue
+            try:
+                value, end = decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+            if end is not None:
+                # Only trust a value once the next delimiter is in the buffer:
+                # a number at the edge ("-1." of "-1.5") may be cut short
+                end = _WHITESPACE.match(buffer, end).end()
+                if eof or (end < len(buffer) and buffer[end] in ',]'):
+                    yield value
+                    expect_value, seen_value, position = False, True, end
+                    continue
+        elif eof:
+            raise json.JSONDecodeError("Unterminated JSON array", buffer, position)
+
+        # Keep the unparsed tail; read at least as much again so an element
+        # larger than chunk_size is re-parsed only O(log n) times
+        pending = len(buffer) - position
+        more = file.read(max(chunk_size, pending))
+        eof = not more
+        buffer, position = buffer[position:] + more, 0
+
+
+class JsonStreamWriter:
+    """
+    Write a JSON array (or JSON Lines) one element at a time.
+
+    Elements are serialized as they are produced instead of building the
+    whole document first. Output is compact by default; arrays get one
+    element per line so they stay greppable. With atomic=True (default)
+    the document goes through atomic_write and only replaces filename if
+    the with block completes.
+
+    Example:
+        with JsonStreamWriter("records.json") as writer:
+            for record in produce_records():
+                writer.write(record)
+    """
+
+    def __init__(self, filename: str, jsonl: bool = False, indent: Optional[int] = None,
+                 atomic: bool = True, encoding: str = 'utf-8', buffer_size: int = 1 << 20):
+        self.filename = filename
+        self.jsonl = jsonl
+        self.count = 0
+        self._encode = json.JSONEncoder(
+            indent=indent, ensure_ascii=False,
+            separators=_COMPACT_SEPARATORS if indent is None else None).encode
+        self._atomic = atomic_write(filename, encoding=encoding) if atomic else None
+        if self._atomic is not None:
+            self._file = self._atomic.__enter__()
+        else:
+            self._file = open(filename, 'w', encoding=encoding, buffering=buffer_size)
+        if not jsonl:
+            self._file.write('[')
+
+    def write(self, item: Any) -> None:
+        """Serialize and write one element."""
+        if self.jsonl:
+            self._file.write(self._encode(item) + '\n')
+        else:
+            self._file.write(('\n' if not self.count else ',\n') + self._encode(item))
+        self.count += 1
+
+    def write_many(self, items: Iterable[Any]) -> None:
+        """Serialize and write every element of an iterable."""
+        for item in items:
+            self.write(item)
+
+    def close(self, exc_info: Any = (None, None, None)) -> None:
+        """Finish the document; an exception in exc_info discards an atomic write."""
+        if self._file is None:
+            return
+        file, self._file = self._file, None
+        try:
+            if exc_info[0] is None and not self.jsonl:
+                file.write('\n]\n' if self.count else ']\n')
+        except BaseException as e:
+            exc_info = (type(e), e, e.__traceback__)
+            raise
+        finally:
+            if self._atomic is not None:
+                self._atomic.__exit__(*exc_info)
+            else:
+                file.close()
+
+    def __enter__(self) -> "JsonStreamWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close(exc_info)
+
+
+def write_json_stream(filename: str, items: Iterable[Any], jsonl: bool = False,
+                      atomic: bool = True) -> bool:
+    """
+    Write an iterable of elements as a compact JSON array (or JSON Lines)
+    without materializing the list.
+
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    try:
+        with JsonStreamWriter(filename, jsonl=jsonl, atomic=atomic) as writer:
+            writer.write_many(items)
+        print(f"JSON data written to: {filename} ({writer.count:,} elements)")
+        return True
+    except Exception as e:
+        print(f"Error writing JSON file '{filename}': {e}")
+        return False
+
+
 def get_file_info(filename: str) -> Dict[str, Any]:
     """
     Get detailed information about a file.
 
+    Everything comes from a single os.stat call.
+
     Args:
         filename (str): Name or path of the file.
 
@@ -143,30 +742,32 @@ def get_file_info(filename: str) -> Dict[str, Any]:
         dict: File information including size, modification time, etc.
     """
     try:
-        if not os.path.exists(filename):
-            return {"error": "File does not exist"}
-
         stat_info = os.stat(filename)
-        return {
-            "filename": filename,
-            "size_bytes": stat_info.st_size,
-            "size_kb": round(stat_info.st_size / 1024, 2),
-            "size_mb": round(stat_info.st_size / (1024 * 1024), 4),
-            "created": datetime.datetime.fromtimestamp(stat_info.st_ctime).isoformat(),
-            "modified": datetime.datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
-            "is_file": os.path.isfile(filename),
-            "is_directory": os.path.isdir(filename),
-            "absolute_path": os.path.abspath(filename)
-        }
-
+    except FileNotFoundError:
+        return {"error": "File does not exist"}
     except Exception as e:
         return {"error": f"Could not get file info for '{filename}': {e}"}
 
+    return {
+        "filename": filename,
+        "size_bytes": stat_info.st_size,
+        "size_kb": round(stat_info.st_size / 1024, 2),
+        "size_mb": round(stat_info.st_size / (1024 * 1024), 4),
+        "created": datetime.datetime.fromtimestamp(stat_info.st_ctime).isoformat(),
+        "modified": datetime.datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
+        "is_file": stat.S_ISREG(stat_info.st_mode),
+        "is_directory": stat.S_ISDIR(stat_info.st_mode),
+        "absolute_path": os.path.abspath(filename)
+    }
+
 
 def list_directory_contents(directory: str = ".") -> List[Dict[str, Any]]:
     """
     List all files and directories in a given directory.
 
+    Uses os.scandir, so file types come from the directory listing itself
+    and only files need a stat call (for their size).
+
     Args:
         directory (str): Directory path (defaults to current directory).
 
@@ -174,30 +775,335 @@ def list_directory_contents(directory: str = ".") -> List[Dict[str, Any]]:
         list: List of dictionaries with file or directory info.
     """
     try:
-        if not os.path.exists(directory):
-            return [{"error": f"Directory '{directory}' does not exist"}]
-
         contents = []
-        for item in os.listdir(directory):
-            item_path = os.path.join(directory, item)
-            item_info = {
-                "name": item,
-                "is_file": os.path.isfile(item_path),
-                "is_directory": os.path.isdir(item_path),
-                "path": item_path
-            }
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                item_info = {
+                    "name": entry.name,
+                    "is_file": entry.is_file(),
+                    "is_directory": entry.is_dir(),
+                    "path": entry.path
+                }
 
-            if item_info["is_file"]:
-                item_info["size_bytes"] = os.path.getsize(item_path)
+                if item_info["is_file"]:
+                    item_info["size_bytes"] = entry.stat().st_size
 
-            contents.append(item_info)
+                contents.append(item_info)
 
         return contents
 
+    except FileNotFoundError:
+        return [{"error": f"Directory '{directory}' does not exist"}]
     except Exception as e:
         return [{"error": f"Could not list directory '{directory}': {e}"}]
 
 
+# --- Directory Walking ---
+def _matches_any(name: str, relative: str, patterns: List[str]) -> bool:
+    """Patterns containing '/' match the relative path, others the name."""
+    return any(fnmatch.fnmatchcase(relative if '/' in pattern else name, pattern)
+               for pattern in patterns)
+
+
+def _scan_directory(path: str, relative: str, depth: int, include: List[str],
+                    exclude: List[str], max_depth: Optional[int], follow_symlinks: bool,
+                    onerror: Optional[Callable[[OSError], Any]]
+                    ) -> Tuple[List[os.DirEntry], List[Tuple[str, str, int]]]:
+    """One directory: matching file entries and the subdirectories to descend into."""
+    files, subdirs = [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                entry_relative = f"{relative}/{entry.name}" if relative else entry.name
+                if exclude and _matches_any(entry.name, entry_relative, exclude):
+                    continue
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+                    # Symlinks (when not followed), broken links, sockets and
+                    # FIFOs are neither
+                    is_file = not is_dir and entry.is_file(follow_symlinks=follow_symlinks)
+                except OSError:
+                    continue
+                if is_dir:
+                    if max_depth is None or depth < max_depth:
+                        subdirs.append((entry.path, entry_relative, depth + 1))
+                elif is_file and (not include or _matches_any(entry.name, entry_relative, include)):
+                    files.append(entry)
+    except OSError as e:
+        if onerror is not None:
+            onerror(e)
+    return files, subdirs
+
+
+def walk_files(root: str = ".", include: Union[str, List[str], None] = None,
+               exclude: Union[str, List[str], None] = None, max_depth: Optional[int] = None,
+               follow_symlinks: bool = False, workers: int = 1,
+               onerror: Optional[Callable[[OSError], Any]] = None) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield the files under root as os.DirEntry objects.
+
+    Built on os.scandir: file types come from the directory listing, and
+    entry.stat() is cached on the entry (and free on Windows), so callers
+    pay at most one stat per file. Results are produced lazily, one
+    directory at a time.
+
+    Args:
+        root (str): Directory to walk.
+        include (str or list): Glob(s) a file must match, e.g. "*.py".
+        exclude (str or list): Glob(s) for files and directories to skip;
+            excluded directories are not descended into. Patterns with a
+            '/' match the path relative to root, e.g. "build/*".
+        max_depth (int): 0 lists only root itself; None means unlimited.
+        follow_symlinks (bool): Descend into symlinked directories and yield
+            symlinked files; when False, symlinks are skipped altogether.
+        workers (int): With more than 1, directories are scanned by a
+            thread pool (useful on slow network filesystems); files are
+            then yielded in no particular order.
+        onerror (callable): Called with the OSError for unreadable
+            directories, which are otherwise skipped silently.
+
+    Yields:
+        os.DirEntry: One entry per matching file.
+    """
+    include = [include] if isinstance(include, str) else list(include or [])
+    exclude = [exclude] if isinstance(exclude, str) else list(exclude or [])
+    options = (include, exclude, max_depth, follow_symlinks, onerror)
+
+    if workers <= 1:
+        stack = [(root, "", 0)]
+        while stack:
+            path, relative, depth = stack.pop()
+            files, subdirs = _scan_directory(path, relative, depth, *options)
+            yield from files
+            stack.extend(reversed(subdirs))
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scan_directory, root, "", 0, *options)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                for path, relative, depth in subdirs:
+                    pending.add(pool.submit(_scan_directory, path, relative, depth, *options))
+                yield from files
+
+
+# --- Content Fingerprints ---
+# mtime resolution is coarse on some filesystems (e.g. 2 s on FAT), so a
+# file modified this close to being hashed could change again without its
+# stat changing; such entries are stored with mtime -1 and always rehashed
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class FileChanges(NamedTuple):
+    """Result of FileFingerprintCache.scan: paths grouped by what happened."""
+    added: List[str]
+    modified: List[str]
+    removed: List[str]
+    unchanged: List[str]
+
+
+def hash_file(filename: str, chunk_size: int = 1 << 20, digest_size: int = 32) -> str:
+    """
+    Return the blake2b hex digest of a file's contents, read in chunks.
+
+    The file is read into one reusable buffer, so memory use is chunk_size
+    regardless of the file size; hashlib releases the GIL while hashing,
+    so several files can be hashed in parallel threads.
+    """
+    digest = hashlib.blake2b(digest_size=digest_size)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(filename, 'rb', buffering=0) as file:
+        while True:
+            count = file.readinto(buffer)
+            if not count:
+                break
+            digest.update(view[:count])
+    return digest.hexdigest()
+
+
+class FileFingerprintCache:
+    """
+    Content digests of files, recomputed only when a file's stat changes.
+
+    A manifest maps each absolute path to (size, mtime_ns, inode, digest)
+    and is persisted as JSON, so a later run can tell what changed by
+    comparing stat results alone and hashing only new or modified files.
+    Hashing runs on a thread pool.
+
+    Example:
+        cache = FileFingerprintCache(".fingerprints.json")
+        changes = cache.scan("build", include="*.whl")
+        changes.added, changes.modified, changes.removed
+        cache.save()
+
+    The cache itself is not thread-safe; share one instance per thread.
+
+    Args:
+        manifest_path (str): JSON file the manifest is loaded from and saved to.
+        workers (int): Threads used to hash files.
+        chunk_size (int): Read size used while hashing.
+        digest_size (int): blake2b digest size in bytes; a manifest written
+            with a different size is discarded.
+    """
+
+    VERSION = 1
+
+    def __init__(self, manifest_path: str, workers: int = 4, chunk_size: int = 1 << 20,
+                 digest_size: int = 32):
+        self.manifest_path = manifest_path
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.algorithm = f"blake2b-{digest_size * 8}"
+        self._digest_size = digest_size
+        self._entries: Dict[str, List[Any]] = {}
+        self._dirty = False
+        self.hashed_count = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as file:
+                manifest = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return
+        if (isinstance(manifest, dict) and manifest.get("version") == self.VERSION
+                and manifest.get("algorithm") == self.algorithm):
+            self._entries = manifest.get("files", {})
+
+    def save(self) -> bool:
+        """Write the manifest atomically if it changed; returns True if written."""
+        if not self._dirty:
+            return False
+        manifest = {"version": self.VERSION, "algorithm": self.algorithm,
+                    "files": self._entries}
+        with atomic_write(self.manifest_path) as file:
+            file.write(json.dumps(manifest, separators=_COMPACT_SEPARATORS,
+                                  ensure_ascii=False))
+        self._dirty = False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: str) -> bool:
+        return os.path.abspath(path) in self._entries
+
+    @staticmethod
+    def _is_current(entry: Optional[List[Any]], stat_info: os.stat_result) -> bool:
+        return entry is not None and entry[:3] == [stat_info.st_size, stat_info.st_mtime_ns,
+                                                   stat_info.st_ino]
+
+    def _hash(self, path: str) -> str:
+        return hash_file(path, self.chunk_size, self._digest_size)
+
+    def _refresh(self, stats: Dict[str, os.stat_result]) -> Dict[str, str]:
+        """Hash the given paths (in parallel) and record them; unreadable files are dropped."""
+        paths = list(stats)
+        racy_after = time.time_ns() - _RACY_WINDOW_NS
+        if self.workers > 1 and len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(self._hash, path) for path in paths]
+                outcomes = [(path, future.exception() or future.result())
+                            for path, future in zip(paths, futures)]
+        else:
+            outcomes = []
+            for path in paths:
+                try:
+                    outcomes.append((path, self._hash(path)))
+                except OSError as e:
+                    outcomes.append((path, e))
+
+        digests = {}
+        for path, digest in outcomes:
+            if isinstance(digest, BaseException):
+                if not isinstance(digest, OSError):
+                    raise digest
+                self._entries.pop(path, None)
+                continue
+            # The stat taken *before* hashing is stored: if the file changes
+            # while it is read, the next check sees a newer stat and rehashes
+            stat_info = stats[path]
+            mtime_ns = stat_info.st_mtime_ns if stat_info.st_mtime_ns < racy_after else -1
+            self._entries[path] = [stat_info.st_size, mtime_ns, stat_info.st_ino, digest]
+            digests[path] = digest
+        self.hashed_count += len(digests)
+        self._dirty = self._dirty or bool(outcomes)
+        return digests
+
+    def digest(self, filename: str) -> Optional[str]:
+        """Digest of one file (cached while its stat is unchanged), or None if unreadable."""
+        return self.digest_many([filename]).get(os.path.abspath(filename))
+
+    def digest_many(self, filenames: Iterable[str]) -> Dict[str, str]:
+        """Digests of several files keyed by absolute path, hashing stale ones in parallel."""
+        digests, stale = {}, {}
+        for filename in filenames:
+            path = os.path.abspath(filename)
+            try:
+                stat_info = os.stat(path)
+            except OSError:
+                continue
+            entry = self._entries.get(path)
+            if self._is_current(entry, stat_info):
+                digests[path] = entry[3]
+            else:
+                stale[path] = stat_info
+        digests.update(self._refresh(stale))
+        return digests
+
+    def scan(self, root: str = ".", include: Union[str, List[str], None] = None,
+             exclude: Union[str, List[str], None] = None,
+             max_depth: Optional[int] = None) -> FileChanges:
+        """
+        Walk root with walk_files and report what changed since the manifest
+        was last updated.
+
+        Unchanged files cost one (usually cached) stat each; only added and
+        modified files are read. A manifest entry under root counts as
+        removed when its file no longer exists, so files merely filtered out
+        by include/exclude/max_depth are left alone.
+        """
+        added, modified, unchanged = [], [], []
+        stale = {}
+        seen = set()
+        for entry in walk_files(root, include, exclude, max_depth):
+            path = os.path.abspath(entry.path)
+            try:
+                stat_info = entry.stat()
+            except OSError:
+                continue
+            seen.add(path)
+            cached = self._entries.get(path)
+            if self._is_current(cached, stat_info):
+                unchanged.append(path)
+            else:
+                stale[path] = stat_info
+
+        old_digests = {path: self._entries[path][3] for path in stale if path in self._entries}
+        for path, digest in self._refresh(stale).items():
+            if path not in old_digests:
+                added.append(path)
+            elif old_digests[path] != digest:
+                modified.append(path)
+            else:
+                # Touched (or recently modified) but same content
+                unchanged.append(path)
+
+        prefix = os.path.join(os.path.abspath(root), '')
+        removed = [path for path in self._entries
+                   if path.startswith(prefix) and path not in seen
+                   and not os.path.lexists(path)]
+        for path in removed:
+            del self._entries[path]
+        if removed:
+            self._dirty = True
+
+        return FileChanges(sorted(added), sorted(modified), sorted(removed), sorted(unchanged))
+
+
 def create_sample_files() -> None:
     """
     Create sample files to demonstrate file operations.
@@ -227,7 +1133,7 @@ def create_sample_files() -> None:
     print("Creating sample files...")
     for filename, content in sample_data.items():
         if filename.endswith('.json'):
-            write_json_file(filename, content)
+            write_json_file(filename, content, indent=2)
         else:
             create_file(filename, content if isinstance(
                 content, str) else str(content))
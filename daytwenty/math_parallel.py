@@ -0,0 +1,220 @@
+"""
+Parallel Math Utilities Module
+==============================
+
+Map/reduce execution layer for running math_utils functions over large
+inputs on several processes.
+
+Includes:
+- Chunking with a tuned default chunk size
+- parallel_map for per-element results (concatenated in input order)
+- parallel_reduce for combining per-chunk partial results
+- parallel_stats: mergeable RunningStats moments computed per chunk
+- Shared-memory transport for numeric arrays and buffers, so large
+  arrays are copied once into shared memory instead of being pickled
+  chunk by chunk
+
+Functions passed to the pool must be picklable (defined at module level),
+as usual for ProcessPoolExecutor.
+
+Example:
+    from math_utils import is_prime_many
+    from math_parallel import parallel_map, parallel_stats
+
+    flags = parallel_map(is_prime_many, range(10**8), batched=True)
+    stats = parallel_stats(readings)        # array.array('d') / NumPy array
+    stats.mean, stats.standard_deviation
+"""
+
+import array
+import functools
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from math_utils import RunningStats, np
+
+# Below this many values the work runs in-process: pool start-up and
+# transport would cost more than the computation.
+MIN_PARALLEL_SIZE = 50_000
+# Chunks per worker: more than one evens out load, too many adds overhead
+CHUNKS_PER_WORKER = 4
+MIN_CHUNK_SIZE = 10_000
+
+
+class SharedArray(NamedTuple):
+    """Picklable handle to a numeric buffer copied into shared memory."""
+    name: str
+    format: str
+    itemsize: int
+    length: int
+
+
+def chunk_bounds(length: int, workers: int,
+                 chunk_size: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Split range(length) into (lo, hi) chunks.
+
+    The default chunk size gives each worker about CHUNKS_PER_WORKER chunks,
+    but never fewer than MIN_CHUNK_SIZE values per chunk.
+    """
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK_SIZE, math.ceil(length / (workers * CHUNKS_PER_WORKER)))
+    return [(lo, min(lo + chunk_size, length)) for lo in range(0, length, chunk_size)]
+
+
+def _numeric_view(values: Any) -> Optional[memoryview]:
+    """Flat memoryview of a numeric array/buffer, or None for other inputs."""
+    if isinstance(values, (list, tuple, range, str, bytes, bytearray)):
+        return None
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return None
+    if not view.c_contiguous:
+        return None
+    return view.cast('B').cast(view.format) if view.ndim != 1 else view
+
+
+@contextmanager
+def shared_array(values: Any) -> Iterator[SharedArray]:
+    """
+    Copy a numeric array/buffer into a shared memory block once and yield
+    its handle; the block is released when the context exits.
+    """
+    view = _numeric_view(values)
+    if view is None:
+        raise TypeError("shared_array needs a contiguous numeric buffer.")
+    shm = shared_memory.SharedMemory(create=True, size=max(view.nbytes, 1))
+    try:
+        shm.buf[:view.nbytes] = view.cast('B')
+        yield SharedArray(shm.name, view.format, view.itemsize, len(view))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _run_on_shared(func: Callable, handle: SharedArray, bounds: Tuple[int, int]) -> Any:
+    """Worker side: attach to the shared block and run func on one chunk view."""
+    lo, hi = bounds
+    shm = shared_memory.SharedMemory(name=handle.name)
+    try:
+        chunk = shm.buf[lo * handle.itemsize:hi * handle.itemsize].cast(handle.format)
+        try:
+            # A result viewing the chunk would keep the segment exported
+            # (release() and close() raise BufferError): copy it out first
+            return _detach(func(chunk))
+        finally:
+            chunk.release()
+    finally:
+        shm.close()
+
+
+def _detach(result: Any) -> Any:
+    """Copy a result that may be a view of shared memory (NumPy view, memoryview)."""
+    if np is not None and isinstance(result, np.ndarray) and not result.flags.owndata:
+        return np.array(result, copy=True)
+    if isinstance(result, memoryview):
+        try:
+            return result.tolist()
+        finally:
+            result.release()
+    return result
+
+
+def _map_chunk(func: Callable, chunk: Sequence) -> List:
+    return [func(value) for value in chunk]
+
+
+def _chunk_stats(quantiles: bool, chunk: Sequence) -> RunningStats:
+    stats = RunningStats(quantiles=quantiles)
+    stats.update_chunk(chunk)
+    return stats
+
+
+@contextmanager
+def _executor(executor: Optional[Executor], workers: int) -> Iterator[Executor]:
+    if executor is not None:
+        yield executor
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield pool
+
+
+def _map_chunks(func: Callable, values: Any, workers: Optional[int],
+                chunk_size: Optional[int], executor: Optional[Executor]) -> List:
+    """Apply func to every chunk of values, returning results in chunk order."""
+    workers = workers or os.cpu_count() or 1
+    view = _numeric_view(values)
+    if view is None and not isinstance(values, (list, tuple, range)):
+        values = list(values)
+    length = len(view) if view is not None else len(values)
+    bounds = chunk_bounds(length, workers, chunk_size)
+
+    if (workers == 1 or length < MIN_PARALLEL_SIZE) and executor is None:
+        source = view if view is not None else values
+        return [func(source[lo:hi]) for lo, hi in bounds]
+
+    with _executor(executor, workers) as pool:
+        if view is not None:
+            with shared_array(view) as handle:
+                run = functools.partial(_run_on_shared, func, handle)
+                return list(pool.map(run, bounds))
+        return list(pool.map(func, (values[lo:hi] for lo, hi in bounds)))
+
+
+def parallel_map(func: Callable, values: Any, workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None, batched: bool = False,
+                 executor: Optional[Executor] = None) -> List:
+    """
+    Return [func(v) for v in values], computed on a process pool.
+
+    With batched=True, func takes a whole chunk and returns a list for it
+    (e.g. is_prime_many), which avoids a Python call per element in the
+    dispatch loop. Chunk results are concatenated in input order.
+    Numeric arrays/buffers are sent through shared memory; chunks of them
+    arrive at func as memoryviews.
+
+    Args:
+        workers (int): Worker processes (default: CPU count).
+        chunk_size (int): Values per task (default: see chunk_bounds).
+        executor (Executor): Reuse an existing pool instead of starting one.
+    """
+    chunk_func = func if batched else functools.partial(_map_chunk, func)
+    results = []
+    for part in _map_chunks(chunk_func, values, workers, chunk_size, executor):
+        results.extend(part)
+    return results
+
+
+def parallel_reduce(func: Callable, values: Any, reducer: Callable[[Any, Any], Any],
+                    workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                    executor: Optional[Executor] = None) -> Any:
+    """
+    Compute func(chunk) for every chunk on a process pool and fold the
+    partial results with reducer(a, b), in chunk order.
+
+    Returns None for empty input.
+    """
+    partials = _map_chunks(func, values, workers, chunk_size, executor)
+    return functools.reduce(reducer, partials) if partials else None
+
+
+def parallel_stats(values: Any, workers: Optional[int] = None,
+                   chunk_size: Optional[int] = None, quantiles: bool = True,
+                   executor: Optional[Executor] = None) -> RunningStats:
+    """
+    Count, mean, variance, min, max (and optionally a quantile sketch) of
+    values, computed per chunk in parallel and merged with RunningStats.merge.
+
+    Lists of numbers are packed into an array.array('d') first so they can
+    travel through shared memory instead of being pickled.
+    """
+    if _numeric_view(values) is None:
+        values = array.array('d', values)
+    stats = parallel_reduce(functools.partial(_chunk_stats, quantiles), values,
+                            RunningStats.merge, workers, chunk_size, executor)
+    return stats if stats is not None else RunningStats(quantiles=quantiles)
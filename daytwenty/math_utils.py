@@ -7,82 +7,844 @@ for quick calculations, statistical analysis, and geometry tasks.
 
 Includes:
 - Statistical computations (mean, median, standard deviation)
+- Streaming statistics (RunningStats) with mergeable quantile sketches
+- Exact median and quantiles by selection (expected O(n), no full sort)
+- Optional NumPy backend for arrays and buffers, pure Python otherwise
 - Number utilities (factorial, prime check, Fibonacci sequence)
+- Prime utilities (cached segmented sieve, Miller–Rabin, batch checks)
+- Factorials, binomials and multinomials (prime swing, modular factorials)
+- Fast Fibonacci numbers (fast doubling, modular, lazy generator)
 - Geometry helpers (circle area, circumference)
-- Temperature conversions and random stats generation
+- Quadratic solving (stable roots, batch solver with case masks)
+- Temperature conversions (cached affine converters, bulk conversion)
+  and random stats generation (seeded, splittable bulk random streams)
 """
 
+import array
+import functools
+import hashlib
 import math
+import operator
 import random
-from typing import List, Tuple, Union, Optional, Dict
+import sys
+from fractions import Fraction
+from itertools import compress, islice, repeat
+from typing import (Any, Dict, Iterable, Iterator, List, NamedTuple, Optional,
+                    Sequence, Tuple, Union)
+
+# Optional dependency: NumPy accelerates statistics on arrays when installed
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numbers: a list/tuple, array.array, NumPy array or other buffer of numbers
+Numbers = Union[Sequence[Union[int, float]], Any]
 
 # --- Mathematical Constants ---
 GOLDEN_RATIO = (1 + math.sqrt(5)) / 2
 EULERS_NUMBER = math.e
 
 
+# --- Backend Dispatch ---
+# NumPy arrays, array.array and other buffers run vectorized on the NumPy
+# backend (when installed) without being converted to lists; everything
+# else, or every input once set_stats_backend("python") is called, uses
+# the pure-Python code. Results of the two backends agree to within a
+# relative tolerance of STATS_RTOL (they sum in a different order).
+STATS_RTOL = 1e-9
+_stats_backend = "auto"
+
+
+def set_stats_backend(name: str) -> None:
+    """Select "auto" (NumPy for arrays/buffers when available) or "python"."""
+    global _stats_backend
+    if name not in ("auto", "python"):
+        raise ValueError("Backend must be 'auto' or 'python'.")
+    _stats_backend = name
+
+
+def _is_numpy_input(data: Any) -> bool:
+    """True when data can go to NumPy without a Python-level copy."""
+    if np is None or _stats_backend == "python":
+        return False
+    if isinstance(data, np.ndarray):
+        return True
+    if isinstance(data, (list, tuple, str, bytes)):
+        return False
+    try:
+        memoryview(data)
+    except TypeError:
+        return False
+    return True
+
+
+def _as_numpy(data: Any) -> Any:
+    """Zero-copy, flattened NumPy view of an array or buffer."""
+    values = data if isinstance(data, np.ndarray) else np.asarray(memoryview(data))
+    return values.ravel()
+
+
+def _as_sequence(data: Any) -> Any:
+    """Sequence view for the pure-Python backend (buffers via memoryview)."""
+    if isinstance(data, (Sequence, memoryview)) and not isinstance(data, (str, bytes)):
+        view = data
+    else:
+        try:
+            view = memoryview(data)
+        except TypeError:
+            return list(data)
+    if isinstance(view, memoryview) and view.ndim != 1:
+        fmt = view.format
+        if not view.c_contiguous:
+            # Only C-contiguous views can be cast; the statistics do not
+            # depend on the order of the values, so a copy in any order will do
+            view = memoryview(view.tobytes())
+        view = view.cast('B').cast(fmt)
+    return view
+
+
+def stats_backend(data: Any) -> str:
+    """Name of the backend ("numpy" or "python") that would handle data."""
+    return "numpy" if _is_numpy_input(data) else "python"
+
+
 # --- Basic Statistical Functions ---
-def calculate_average(numbers: List[Union[int, float]]) -> Optional[float]:
+def calculate_average(numbers: Numbers) -> Optional[float]:
     """
     Compute the arithmetic mean of a list of numbers.
     Returns None if the list is empty.
     """
-    return sum(numbers) / len(numbers) if numbers else None
+    if _is_numpy_input(numbers):
+        values = _as_numpy(numbers)
+        return float(values.mean()) if values.size else None
+    numbers = _as_sequence(numbers)
+    return sum(numbers) / len(numbers) if len(numbers) else None
 
 
-def calculate_median(numbers: List[Union[int, float]]) -> Optional[float]:
+def calculate_median(numbers: Numbers) -> Optional[float]:
     """
     Compute the median value of a list of numbers.
     Returns None if the list is empty.
     """
-    if not numbers:
-        return None
-
-    sorted_nums = sorted(numbers)
-    n = len(sorted_nums)
-    mid = n // 2
-    return (sorted_nums[mid - 1] + sorted_nums[mid]) / 2 if n % 2 == 0 else sorted_nums[mid]
+    return median(numbers)
 
 
-def calculate_standard_deviation(numbers: List[Union[int, float]]) -> Optional[float]:
+def calculate_standard_deviation(numbers: Numbers) -> Optional[float]:
     """
     Calculate the sample standard deviation for a list of numbers.
     Returns None if fewer than two values are provided.
     """
-    if not numbers or len(numbers) < 2:
+    if _is_numpy_input(numbers):
+        values = _as_numpy(numbers)
+        return float(values.std(ddof=1)) if values.size >= 2 else None
+    numbers = _as_sequence(numbers)
+    if len(numbers) < 2:
         return None
     mean = calculate_average(numbers)
     variance = sum((x - mean) ** 2 for x in numbers) / (len(numbers) - 1)
     return math.sqrt(variance)
 
 
+# --- Selection-Based Order Statistics ---
+_SELECT_CUTOFF = 600
+
+
+def _select_range(data: Sequence, first: int, last: int) -> List:
+    """
+    Return the values of ranks first..last (0-based, inclusive) in order.
+
+    Floyd–Rivest style: a random sample of about n^(2/3) values brackets
+    the wanted ranks with two pivots, one pass counts the values below the
+    low pivot and a second collects those between the pivots, and only
+    that small window is sorted.
+    Expected O(n); the input is never copied or reordered.
+    """
+    n = len(data)
+    if n <= _SELECT_CUTOFF:
+        return sorted(data)[first:last + 1]
+
+    sample_size = int(n ** (2 / 3))
+    sample = sorted(data[i] for i in random.sample(range(n), sample_size))
+    gap = int(2 * math.sqrt(sample_size))
+    low_index = first * sample_size // n - gap
+    high_index = last * sample_size // n + gap
+    low = sample[low_index] if low_index >= 0 else -math.inf
+    high = sample[high_index] if high_index < sample_size else math.inf
+
+    below = sum(map(operator.lt, data, repeat(low)))
+    window = [x for x in data if low <= x <= high]
+    if below <= first and last < below + len(window):
+        window.sort()
+        return window[first - below:last - below + 1]
+
+    # The sample missed the ranks (very unlikely); fall back to a full sort
+    return sorted(data)[first:last + 1]
+
+
+def _numpy_select(data: Any, ranks: List[int], overwrite_input: bool) -> List:
+    values = _as_numpy(data)
+    if overwrite_input:
+        values.partition(ranks)
+    else:
+        values = np.partition(values, ranks)
+    return [values[k].item() for k in ranks]
+
+
+def _prepare(data: Any) -> Any:
+    """Flattened NumPy view or 1-D sequence, as the selection code expects."""
+    return _as_numpy(data) if _is_numpy_input(data) else _as_sequence(data)
+
+
+def median(data: Any, overwrite_input: bool = False) -> Optional[float]:
+    """
+    Exact median by selection, without sorting a copy of the data.
+
+    Accepts lists, tuples, array.array, NumPy arrays or any iterable
+    (iterables are materialised once). With NumPy installed, arrays and
+    buffers use numpy.partition; overwrite_input=True partitions them in
+    place instead of copying. Python sequences are never reordered.
+    Returns None for empty input.
+    """
+    data = _prepare(data)
+    n = data.size if _is_numpy_input(data) else len(data)
+    if not n:
+        return None
+    mid = n // 2
+    ranks = [mid - 1, mid] if n % 2 == 0 else [mid]
+    if _is_numpy_input(data):
+        values = _numpy_select(data, ranks, overwrite_input)
+    else:
+        values = _select_range(data, ranks[0], ranks[-1])
+    return (values[0] + values[1]) / 2 if n % 2 == 0 else values[0]
+
+
+def quantile(data: Any, q: float, overwrite_input: bool = False) -> Optional[float]:
+    """
+    Exact q-quantile (0 <= q <= 1) with linear interpolation between ranks,
+    the same definition as NumPy's default. See median() for input handling.
+    """
+    result = quantiles(data, [q], overwrite_input)
+    return result[0] if result else None
+
+
+def quantiles(data: Any, qs: Iterable[float],
+              overwrite_input: bool = False) -> Optional[List[float]]:
+    """
+    Exact quantiles for several q values in one call.
+
+    Each quantile costs one selection pass; when many are requested the
+    data is sorted once instead. Returns None for empty input.
+    """
+    qs = list(qs)
+    if any(not 0 <= q <= 1 for q in qs):
+        raise ValueError("Quantiles must be between 0 and 1.")
+    data = _prepare(data)
+    n = data.size if _is_numpy_input(data) else len(data)
+    if not n:
+        return None
+
+    positions = [q * (n - 1) for q in qs]
+    pairs = [(int(p), min(int(p) + 1, n - 1)) for p in positions]
+
+    if _is_numpy_input(data):
+        ranks = sorted({k for pair in pairs for k in pair})
+        values = dict(zip(ranks, _numpy_select(data, ranks, overwrite_input)))
+    elif len(qs) > int(math.log2(n)):
+        ordered = sorted(data)
+        values = {k: ordered[k] for pair in pairs for k in pair}
+    else:
+        values = {}
+        for low, high in pairs:
+            if low not in values or high not in values:
+                window = _select_range(data, low, high)
+                values[low], values[high] = window[0], window[-1]
+
+    results = []
+    for position, (low, high) in zip(positions, pairs):
+        fraction = position - low
+        a, b = values[low], values[high]
+        results.append(a + (b - a) * fraction if fraction else a)
+    return results
+
+
+# --- Streaming Statistics ---
+_BLOCK_COMPACT_FACTOR = 8      # update_many chunks above factor * k are pre-compacted
+
+
+class QuantileSketch:
+    """
+    KLL sketch for approximate quantiles over a stream.
+
+    Memory stays around a few multiples of k regardless of stream length;
+    rank error is roughly 1.7/k (about 1% for k=200). Sketches built on
+    separate chunks can be merged. Until the first compaction the sketch
+    holds every value and quantiles are exact (linearly interpolated).
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = k
+        self.count = 0
+        self._compactors: List[List[float]] = [[]]
+        self._random = random.Random(seed)
+        self._held = 0
+        self._limit = self._capacity(0)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._compactors) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        self._held = sum(len(c) for c in self._compactors)
+        while self._held >= self._limit:
+            # Sweep every full level bottom-up so one call frees plenty of room
+            level = 0
+            while level < len(self._compactors):
+                items = self._compactors[level]
+                if len(items) >= self._capacity(level):
+                    if level + 1 == len(self._compactors):
+                        self._compactors.append([])
+                    items.sort()
+                    keep = [items.pop()] if len(items) % 2 else []
+                    offset = self._random.randint(0, 1)
+                    self._compactors[level + 1].extend(items[offset::2])
+                    self._compactors[level] = keep
+                level += 1
+            self._held = sum(len(c) for c in self._compactors)
+            self._limit = sum(self._capacity(h) for h in range(len(self._compactors)))
+
+    def update(self, value: float) -> None:
+        """Add one value."""
+        self._compactors[0].append(value)
+        self.count += 1
+        self._held += 1
+        if self._held >= self._limit:
+            self._compress()
+
+    def update_many(self, values: Iterable[float]) -> None:
+        """
+        Add a chunk of values.
+
+        Chunks much larger than k are sorted once and halved (keeping every
+        other value from a random offset, as a compaction would) until they
+        fit, then enter the sketch at the level matching their weight.
+        """
+        if not (isinstance(values, list) or _is_numpy_input(values)):
+            values = list(values)
+        if len(values) > _BLOCK_COMPACT_FACTOR * self.k:
+            self._add_block(values)
+            return
+        values = values if isinstance(values, list) else _as_numpy(values).tolist()
+        position = 0
+        while position < len(values):
+            room = max(1, self._limit - self._held)
+            chunk = values[position:position + room]
+            self._compactors[0].extend(chunk)
+            position += len(chunk)
+            self.count += len(chunk)
+            self._held += len(chunk)
+            if self._held >= self._limit:
+                self._compress()
+
+    def _add_block(self, values: Any) -> None:
+        block = np.sort(_as_numpy(values)) if _is_numpy_input(values) else sorted(values)
+        self.count += len(block)
+        level = 0
+        while len(block) > self.k:
+            block = block[self._random.randint(0, 1)::2]
+            level += 1
+        while len(self._compactors) <= level:
+            self._compactors.append([])
+        self._compactors[level].extend(block if isinstance(block, list) else block.tolist())
+        self._limit = sum(self._capacity(h) for h in range(len(self._compactors)))
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Fold another sketch into this one (in place) and return self."""
+        while len(self._compactors) < len(other._compactors):
+            self._compactors.append([])
+        for level, items in enumerate(other._compactors):
+            self._compactors[level].extend(items)
+        self.count += other.count
+        self._limit = sum(self._capacity(h) for h in range(len(self._compactors)))
+        self._compress()
+        return self
+
+    @property
+    def is_exact(self) -> bool:
+        """True while no values have been compacted away."""
+        return len(self._compactors) == 1 or not any(self._compactors[1:])
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the (approximate) q-quantile, 0 <= q <= 1."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1.")
+        if not self.count:
+            return None
+
+        if self.is_exact:
+            items = sorted(self._compactors[0])
+            position = q * (len(items) - 1)
+            low = int(position)
+            high = min(low + 1, len(items) - 1)
+            fraction = position - low
+            if not fraction:
+                return items[low]
+            return items[low] + (items[high] - items[low]) * fraction
+
+        weighted = sorted((value, 1 << level)
+                          for level, items in enumerate(self._compactors)
+                          for value in items)
+        total = sum(weight for _, weight in weighted)
+        target = q * total
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+
+class RunningStats:
+    """
+    Single-pass accumulator for count, mean, variance, min and max.
+
+    Values can be added one at a time (Welford's update) or in chunks;
+    chunk statistics and partial results from other workers are combined
+    with the parallel merge formula of Chan et al. An optional
+    QuantileSketch provides approximate streaming quantiles.
+
+    Example:
+        stats = RunningStats()
+        stats.consume(values_from_a_huge_file)
+        stats.mean, stats.standard_deviation, stats.quantile(0.95)
+    """
+
+    def __init__(self, quantiles: bool = True, sketch_k: int = 200,
+                 seed: Optional[int] = None):
+        self.count = 0
+        self.mean: Optional[float] = None
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.sketch = QuantileSketch(sketch_k, seed) if quantiles else None
+        self._scratch = None  # reused deviations buffer for NumPy chunks
+
+    def update(self, value: float) -> None:
+        """Add a single value (Welford's online update)."""
+        self.count += 1
+        if self.count == 1:
+            self.mean = float(value)
+            self.min = self.max = value
+        else:
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (value - self.mean)
+            if value < self.min:
+                self.min = value
+            elif value > self.max:
+                self.max = value
+        if self.sketch is not None:
+            self.sketch.update(value)
+
+    def update_chunk(self, chunk: Numbers) -> None:
+        """
+        Add an in-memory chunk of values using C-level sum/min/max.
+
+        NumPy arrays and buffers are reduced with vectorized NumPy calls:
+        the mean, the deviations from it (into a scratch buffer reused
+        across chunks), their dot product, min and max, i.e. five C-speed
+        passes over the chunk.
+        """
+        if _is_numpy_input(chunk):
+            values = _as_numpy(chunk)
+            n = values.size
+            if not n:
+                return
+            chunk_mean = float(values.mean())
+            if self._scratch is None or self._scratch.size < n:
+                self._scratch = np.empty(n, dtype=np.float64)
+            deviations = np.subtract(values, chunk_mean, out=self._scratch[:n])
+            chunk_m2 = float(np.dot(deviations, deviations))
+            self._combine(n, chunk_mean, chunk_m2, values.min().item(), values.max().item())
+        else:
+            n = len(chunk)
+            if not n:
+                return
+            chunk_mean = math.fsum(chunk) / n
+            chunk_m2 = math.fsum((x - chunk_mean) ** 2 for x in chunk)
+            self._combine(n, chunk_mean, chunk_m2, min(chunk), max(chunk))
+        if self.sketch is not None:
+            self.sketch.update_many(chunk)
+
+    def consume(self, values: Iterable[float], chunk_size: int = 65536) -> "RunningStats":
+        """Add every value of an iterable, reading it in bounded chunks."""
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return self
+            self.update_chunk(chunk)
+
+    def _combine(self, n: int, mean: float, m2: float,
+                 low: float, high: float) -> None:
+        if not self.count:
+            self.count, self.mean, self._m2 = n, mean, m2
+            self.min, self.max = low, high
+            return
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, low)
+        self.max = max(self.max, high)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Fold partial results from another accumulator into this one."""
+        if other.count:
+            self._combine(other.count, other.mean, other._m2, other.min, other.max)
+            if self.sketch is not None and other.sketch is not None:
+                self.sketch.merge(other.sketch)
+        return self
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Sample variance (None for fewer than two values)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else None
+
+    @property
+    def standard_deviation(self) -> Optional[float]:
+        """Sample standard deviation (None for fewer than two values)."""
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile from the sketch (exact for small streams)."""
+        if self.sketch is None:
+            raise ValueError("Quantiles were disabled for this accumulator.")
+        return self.sketch.quantile(q)
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """Summary in the same shape as generate_random_stats."""
+        return {
+            "count": self.count,
+            "average": self.mean,
+            "median": self.quantile(0.5) if self.sketch is not None else None,
+            "standard_deviation": self.standard_deviation,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
 # --- Number Utilities ---
+def is_prime(n: int) -> bool:
+    """
+    Determine whether an integer n is a prime number.
+
+    Uses the cached sieve when n is inside it, otherwise trial division by
+    a few small primes followed by Miller–Rabin, which is deterministic
+    for n < 3.3e24 (covering all 64-bit integers). Integral floats such as
+    7.0 are accepted; other non-integers raise TypeError.
+    """
+    n = _prime_candidate(n)
+    if n < 2:
+        return False
+    if n < 2 * len(_prime_flags):
+        return n == 2 or (n & 1 == 1 and _prime_flags[n >> 1] == 1)
+    for p in _MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+    return _miller_rabin(n)
+
+
+# --- Prime Utilities ---
+# Odd-only sieve cache: _prime_flags[i] is 1 when 2*i + 1 is prime
+_prime_flags = bytearray()
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+_SIEVE_SEGMENT = 1 << 18       # odd numbers per segment in primes_in_range
+_SIEVE_CACHE_MAX = 1 << 23     # largest n the cached sieve grows to (4 MB)
+_SIEVE_BATCH_MAX = 1 << 27     # largest n is_prime_many sieves up to, per call
+_SIEVE_COST_RATIO = 2000       # sieve when max(values) <= len(values) * ratio
+
+
+def _prime_candidate(n: Any) -> int:
+    """
+    n as an int for the primality tests: integral floats are converted,
+    other floats (never prime) become 0, anything else goes through
+    operator.index, which raises TypeError for non-integers.
+    """
+    if type(n) is int:
+        return n
+    if isinstance(n, float):
+        return int(n) if n.is_integer() else 0
+    return operator.index(n)
+
+
+def _miller_rabin(n: int) -> bool:
+    """Strong-probable-prime test to the first twelve prime bases (n odd, > 37)."""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _sieve(limit: int) -> bytearray:
+    """Odd-only sieve of Eratosthenes covering every n < limit."""
+    size = limit // 2
+    flags = bytearray([1]) * size
+    flags[0] = 0  # 1 is not prime
+    for i in range(1, (math.isqrt(limit - 1) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            flags[start::p] = bytes(len(range(start, size, p)))
+    return flags
+
+
+def _ensure_sieve(limit: int) -> None:
+    """Grow the cached sieve so it covers every n < limit (limit <= _SIEVE_CACHE_MAX + 1)."""
+    global _prime_flags
+    if limit <= 2 * len(_prime_flags):
+        return
+    _prime_flags = _sieve(max(limit, min(4 * len(_prime_flags), _SIEVE_CACHE_MAX + 1)))
+
+
+def primes_in_range(lo: int, hi: int) -> Iterable[int]:
+    """
+    Yield the primes p with lo <= p < hi, in increasing order.
+
+    Runs a segmented sieve of Eratosthenes over odd-only bytearray
+    segments, so memory stays bounded even for ranges near 1e10; the base
+    primes up to sqrt(hi) come from the cached sieve.
+    """
+    if hi <= 2 or lo >= hi:
+        return
+    if lo <= 2:
+        yield 2
+    start = max(lo, 3) | 1
+
+    if hi <= 2 * len(_prime_flags):
+        yield from compress(range(start, hi, 2), _prime_flags[start // 2:(hi + 1) // 2])
+        return
+
+    root = math.isqrt(hi - 1)
+    _ensure_sieve(root + 1)
+    base_primes = list(compress(range(1, root + 1, 2), _prime_flags[:(root + 1) // 2]))
+
+    for seg_lo in range(start, hi, 2 * _SIEVE_SEGMENT):
+        seg_hi = min(seg_lo + 2 * _SIEVE_SEGMENT, hi)
+        count = (seg_hi - seg_lo + 1) // 2
+        segment = bytearray([1]) * count
+        for p in base_primes:
+            if p * p >= seg_hi:
+                break
+            first = max(p * p, (seg_lo + p - 1) // p * p)
+            if first % 2 == 0:
+                first += p
+            index = (first - seg_lo) // 2
+            if index < count:
+                segment[index::p] = bytes(len(range(index, count, p)))
+        yield from compress(range(seg_lo, seg_hi, 2), segment)
+
+
+def is_prime_many(values: Iterable[int]) -> List[bool]:
+    """
+    Primality of many integers at once, in input order.
+
+    When sieving up to max(values) is cheaper than testing each value
+    (dense batches, max below _SIEVE_BATCH_MAX), the sieve is built once
+    and every value becomes a lookup; otherwise each value goes through
+    is_prime. Sieves up to _SIEVE_CACHE_MAX are cached for later calls,
+    larger ones are freed on return.
+    """
+    values = list(map(_prime_candidate, values))
+    if not values:
+        return []
+    highest = max(values)
+    if highest < 2 * len(_prime_flags):
+        flags = _prime_flags
+    elif highest <= _SIEVE_BATCH_MAX and highest <= len(values) * _SIEVE_COST_RATIO:
+        if highest <= _SIEVE_CACHE_MAX:
+            _ensure_sieve(highest + 1)
+            flags = _prime_flags
+        else:
+            flags = _sieve(highest + 1)
+    else:
+        return [is_prime(v) for v in values]
+    return [v == 2 or (v > 2 and v & 1 == 1 and flags[v >> 1] == 1)
+            for v in values]
+
+
+# --- Factorials and Binomials ---
+# factorial uses Luschny's prime-swing recursion n! = ((n // 2)!)^2 * swing(n),
+# and binomial/multinomial multiply out the prime factorisation given by
+# Legendre's formula; both multiply balanced halves (binary splitting) so
+# that the big-integer products stay similar in size.
+_SWING_BASE = 32               # below this, factorial multiplies directly
+_BINOMIAL_DIRECT_K = 64        # smaller k uses math.comb's multiplicative formula
+
+
+def _product(values: Sequence[int], lo: int, hi: int) -> int:
+    """Product of values[lo:hi] by binary splitting."""
+    if hi - lo <= 8:
+        return math.prod(values[lo:hi])
+    mid = (lo + hi) // 2
+    return _product(values, lo, mid) * _product(values, mid, hi)
+
+
+def _primes_upto(n: int) -> List[int]:
+    """All primes <= n, growing the cached sieve when n is within its cap."""
+    if n <= _SIEVE_CACHE_MAX:
+        _ensure_sieve(n + 1)
+    return list(primes_in_range(2, n + 1))
+
+
+def _swing(n: int, primes: List[int]) -> int:
+    """n! / ((n // 2)!)^2 from the primes <= n."""
+    root, third, half = math.isqrt(n), n // 3, n // 2
+    factors = []
+    for p in primes:
+        if p > n:
+            break
+        if p <= root:
+            q, e = n, 0
+            while q >= p:
+                q //= p
+                e += q & 1
+            if e:
+                factors.append(p ** e)
+        elif p <= third:
+            if (n // p) & 1:
+                factors.append(p)
+        elif p > half:
+            factors.append(p)
+    return _product(factors, 0, len(factors))
+
+
+def _legendre(n: int, p: int) -> int:
+    """Exponent of the prime p in n!."""
+    e = 0
+    while n >= p:
+        n //= p
+        e += n
+    return e
+
+
+@functools.lru_cache(maxsize=32)
 def factorial(n: int) -> int:
     """
     Compute the factorial of a non-negative integer n.
 
+    Uses the prime-swing algorithm; recent results are memoised.
+
     Raises:
         ValueError: If n is negative.
     """
     if n < 0:
         raise ValueError("Factorial is not defined for negative numbers.")
-    return math.prod(range(1, n + 1)) if n > 1 else 1
+    if n < _SWING_BASE:
+        return math.prod(range(2, n + 1))
+    primes = _primes_upto(n)
 
+    def swing_factorial(m: int) -> int:
+        if m < _SWING_BASE:
+            return math.prod(range(2, m + 1))
+        return swing_factorial(m // 2) ** 2 * _swing(m, primes)
 
-def is_prime(n: int) -> bool:
+    return swing_factorial(n)
+
+
+@functools.lru_cache(maxsize=32)
+def _factorial_quotient(n: int, counts: Tuple[int, ...]) -> int:
+    """n! / prod(k! for k in counts), where sum(counts) <= n."""
+    factors = []
+    for p in _primes_upto(n):
+        e = _legendre(n, p) - sum(_legendre(k, p) for k in counts if k >= p)
+        if e:
+            factors.append(p ** e if e > 1 else p)
+    return _product(factors, 0, len(factors))
+
+
+def binomial(n: int, k: int) -> int:
     """
-    Determine whether an integer n is a prime number.
+    Number of ways to choose k items from n (0 when k > n).
+
+    Raises:
+        ValueError: If n or k is negative.
     """
-    if n < 2:
-        return False
-    if n in (2, 3):
-        return True
-    if n % 2 == 0:
-        return False
-    for i in range(3, int(math.sqrt(n)) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
+    if n < 0 or k < 0:
+        raise ValueError("Binomial coefficients need non-negative n and k.")
+    if k > n:
+        return 0
+    k = min(k, n - k)
+    if k < _BINOMIAL_DIRECT_K:
+        return math.comb(n, k)
+    return _factorial_quotient(n, (k, n - k))
+
+
+def multinomial(counts: Iterable[int]) -> int:
+    """
+    Multinomial coefficient (k1 + k2 + ...)! / (k1! * k2! * ...).
+
+    Raises:
+        ValueError: If any count is negative.
+    """
+    counts = sorted(k for k in counts if k)
+    if counts and counts[0] < 0:
+        raise ValueError("Multinomial counts must be non-negative.")
+    n = sum(counts)
+    if len(counts) < 2:
+        return 1
+    if n - counts[-1] < _BINOMIAL_DIRECT_K:
+        # One dominant count: a product of binomials stays cheap
+        result, total = 1, 0
+        for k in counts:
+            total += k
+            result *= math.comb(total, k)
+        return result
+    return _factorial_quotient(n, tuple(counts))
+
+
+def factorial_mod(n: int, m: int) -> int:
+    """
+    Compute n! mod m without building n!.
+
+    n! is divisible by m once n >= m. For a prime m and n close to m,
+    Wilson's theorem ((m - 1)! = -1 mod m) shortens the product to the
+    terms between n and m.
+
+    Raises:
+        ValueError: If n is negative or m is not positive.
+    """
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers.")
+    if m <= 0:
+        raise ValueError("Modulus must be positive.")
+    if n >= m:
+        return 0
+    if m - 1 - n < n and is_prime(m):
+        rest = 1
+        for i in range(n + 1, m):
+            rest = rest * i % m
+        return -pow(rest, -1, m) % m
+    result = 1 % m
+    for i in range(2, n + 1):
+        result = result * i % m
+    return result
 
 
 def fibonacci_sequence(n: int) -> List[int]:
@@ -103,6 +865,60 @@ def fibonacci_sequence(n: int) -> List[int]:
     return seq
 
 
+@functools.lru_cache(maxsize=64)
+def fibonacci(n: int) -> int:
+    """
+    Return the n-th Fibonacci number (F(0) = 0, F(1) = 1).
+
+    Uses fast doubling, O(log n) big-integer multiplications, so very
+    large indices never build the sequence. Recent results are memoised.
+
+    Raises:
+        ValueError: If n is negative.
+    """
+    if n < 0:
+        raise ValueError("Fibonacci is not defined for negative indices.")
+    a, b = 0, 1  # F(k), F(k + 1) for k = 0
+    for bit in bin(n)[2:]:
+        # F(2k) = F(k) * (2F(k+1) - F(k)); F(2k+1) = F(k)^2 + F(k+1)^2
+        a, b = a * (2 * b - a), a * a + b * b
+        if bit == "1":
+            a, b = b, a + b
+    return a
+
+
+def fibonacci_mod(n: int, m: int) -> int:
+    """
+    Return F(n) mod m by fast doubling with every product reduced mod m.
+
+    Raises:
+        ValueError: If n is negative or m is not positive.
+    """
+    if n < 0:
+        raise ValueError("Fibonacci is not defined for negative indices.")
+    if m <= 0:
+        raise ValueError("Modulus must be positive.")
+    a, b = 0, 1 % m
+    for bit in bin(n)[2:]:
+        a, b = a * (2 * b - a) % m, (a * a + b * b) % m
+        if bit == "1":
+            a, b = b, (a + b) % m
+    return a % m
+
+
+def fibonacci_generator(start: int = 0) -> Iterator[int]:
+    """
+    Yield F(start), F(start + 1), ... indefinitely.
+
+    Only the two most recent terms are kept, so memory does not grow with
+    the number of terms consumed. The starting pair comes from fast doubling.
+    """
+    a, b = (fibonacci(start), fibonacci(start + 1)) if start else (0, 1)
+    while True:
+        yield a
+        a, b = b, a + b
+
+
 # --- Geometry Helpers ---
 def calculate_circle_area(radius: float) -> float:
     """Return the area of a circle with the given radius."""
@@ -115,60 +931,329 @@ def calculate_circle_circumference(radius: float) -> float:
 
 
 # --- Algebra and Conversions ---
+def _stable_roots(a: float, b: float, sqrt_d: float, c: float) -> Tuple[float, float]:
+    """
+    Real roots ((-b + sqrt_d) / 2a, (-b - sqrt_d) / 2a) without cancellation.
+
+    q = -(b + sign(b) * sqrt_d) / 2 adds two numbers of the same sign; the
+    roots are then q / a and c / q.
+    """
+    q = -0.5 * (b + math.copysign(sqrt_d, b))
+    if q == 0:
+        return 0.0, 0.0
+    if math.copysign(1.0, b) < 0:
+        return q / a, c / q
+    return c / q, q / a
+
+
 def solve_quadratic(a: float, b: float, c: float) -> Tuple[Optional[float], Optional[float]]:
     """
     Solve a quadratic equation ax² + bx + c = 0.
 
+    Roots are computed with the numerically stable formulation (see
+    _stable_roots), so they stay accurate when b² ≫ 4ac. With a = 0 the
+    equation is linear and its single root (if any) is returned first.
+
     Returns:
         Tuple of two real roots (or None if no real roots exist).
     """
+    if a == 0:
+        return (-c / b, None) if b != 0 else (None, None)
     discriminant = b ** 2 - 4 * a * c
     if discriminant < 0:
         return None, None
     elif discriminant == 0:
         return -b / (2 * a), None
     else:
-        sqrt_d = math.sqrt(discriminant)
-        return ((-b + sqrt_d) / (2 * a), (-b - sqrt_d) / (2 * a))
+        return _stable_roots(a, b, math.sqrt(discriminant), c)
+
+
+class QuadraticRoots(NamedTuple):
+    """
+    Result of solve_quadratic_many; each field has one entry per equation.
+
+    real: two real roots (root1 >= root2 when a > 0, equal for a double root).
+    complex: roots are root1 ± i·root2 (root1 real part, root2 imaginary part).
+    degenerate: a == 0; root1 is the linear root -c/b (NaN when b == 0)
+    and root2 is NaN.
+    """
+    root1: Any
+    root2: Any
+    real: Any
+    complex: Any
+    degenerate: Any
+
+
+def _broadcast_coefficients(*columns: Any) -> List[Sequence]:
+    """Python-backend broadcasting: scalars repeat, sequences must agree in length."""
+    sequences = [_as_sequence(col) for col in columns if not isinstance(col, (int, float))]
+    size = len(sequences[0]) if sequences else 1
+    if any(len(seq) != size for seq in sequences):
+        raise ValueError("Coefficient sequences must have the same length.")
+    return [[col] * size if isinstance(col, (int, float)) else _as_sequence(col)
+            for col in columns]
+
+
+def solve_quadratic_many(a: Any, b: Any, c: Any) -> QuadraticRoots:
+    """
+    Solve many quadratics a[i]x² + b[i]x + c[i] = 0 at once.
+
+    Coefficients may be scalars, lists, array.array/buffers or NumPy arrays.
+    With NumPy installed (and the "auto" backend) everything runs as
+    vectorized array operations and the result fields are float64/bool
+    arrays broadcast from the inputs; otherwise they are lists.
+    Roots use the same stable formulation as solve_quadratic.
+    """
+    if np is not None and _stats_backend == "auto":
+        a, b, c = np.broadcast_arrays(*(
+            _as_numpy(x) if _is_numpy_input(x) else np.asarray(x, dtype=np.float64)
+            for x in (a, b, c)))
+        a, b, c = (x.astype(np.float64) for x in (a, b, c))
+        disc = b * b - 4 * a * c
+        degenerate = a == 0
+        real = ~degenerate & (disc >= 0)
+        complex_ = ~degenerate & (disc < 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sqrt_d = np.sqrt(np.abs(disc))
+            q = -0.5 * (b + np.copysign(sqrt_d, b))
+            by_a, by_q = q / a, np.where(q == 0, 0.0, c / q)
+            negative_b = np.signbit(b)
+            root1 = np.where(negative_b, by_a, by_q)
+            root2 = np.where(negative_b, by_q, by_a)
+            root1 = np.where(complex_, -b / (2 * a), root1)
+            root2 = np.where(complex_, sqrt_d / np.abs(2 * a), root2)
+            linear = np.where(b != 0, -c / b, np.nan)
+        root1 = np.where(degenerate, linear, root1)
+        root2 = np.where(degenerate, np.nan, root2)
+        return QuadraticRoots(root1, root2, real, complex_, degenerate)
+
+    root1, root2, real, complex_, degenerate = [], [], [], [], []
+    for ai, bi, ci in zip(*_broadcast_coefficients(a, b, c)):
+        disc = bi * bi - 4 * ai * ci
+        if ai == 0:
+            r1, r2 = (-ci / bi if bi != 0 else math.nan), math.nan
+        elif disc < 0:
+            r1, r2 = -bi / (2 * ai), math.sqrt(-disc) / abs(2 * ai)
+        else:
+            r1, r2 = _stable_roots(ai, bi, math.sqrt(disc), ci)
+        root1.append(r1)
+        root2.append(r2)
+        degenerate.append(ai == 0)
+        real.append(ai != 0 and disc >= 0)
+        complex_.append(ai != 0 and disc < 0)
+    return QuadraticRoots(root1, root2, real, complex_, degenerate)
+
+
+# Each scale as an exact affine map to Kelvin: kelvin = value * scale + offset
+_KELVIN_AFFINE = {
+    "C": (Fraction(1), Fraction("273.15")),
+    "F": (Fraction(5, 9), Fraction("273.15") - Fraction(160, 9)),
+    "K": (Fraction(1), Fraction(0)),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _temperature_affine(from_unit: str, to_unit: str) -> Tuple[float, float]:
+    """(scale, offset) with to_value = from_value * scale + offset."""
+    if from_unit not in _KELVIN_AFFINE or to_unit not in _KELVIN_AFFINE:
+        raise ValueError(f"Unknown temperature unit: {from_unit!r} -> {to_unit!r}; "
+                         f"expected C, F or K.")
+    from_scale, from_offset = _KELVIN_AFFINE[from_unit]
+    to_scale, to_offset = _KELVIN_AFFINE[to_unit]
+    return float(from_scale / to_scale), float((from_offset - to_offset) / to_scale)
+
+
+@functools.lru_cache(maxsize=None)
+def get_converter(from_unit: str, to_unit: str):
+    """
+    Return a cached function converting one temperature from from_unit to to_unit.
+
+    The function is a single multiply-add with coefficients computed once
+    (exactly, via fractions) per unit pair.
+
+    Raises:
+        ValueError: If either unit is not C, F or K.
+    """
+    scale, offset = _temperature_affine(from_unit, to_unit)
+    if scale == 1.0:
+        def convert(value: float) -> float:
+            return value + offset
+    else:
+        def convert(value: float) -> float:
+            return value * scale + offset
+    convert.__name__ = f"{from_unit}_to_{to_unit}"
+    return convert
 
 
 def convert_temperature(value: float, from_unit: str, to_unit: str) -> Optional[float]:
     """
     Convert temperature between Celsius (C), Fahrenheit (F), and Kelvin (K).
+    Returns None for an unknown unit.
     """
-    valid_units = {"C", "F", "K"}
-    if from_unit not in valid_units or to_unit not in valid_units:
+    try:
+        return get_converter(from_unit, to_unit)(value)
+    except ValueError:
         return None
 
-    # Convert source to Kelvin
-    kelvin = (
-        value + 273.15 if from_unit == "C"
-        else (value - 32) * 5 / 9 + 273.15 if from_unit == "F"
-        else value
-    )
 
-    # Convert Kelvin to target
-    if to_unit == "C":
-        return kelvin - 273.15
-    elif to_unit == "F":
-        return (kelvin - 273.15) * 9 / 5 + 32
-    return kelvin
+def convert_temperature_many(values: Numbers, from_unit: str, to_unit: str) -> Any:
+    """
+    Convert many temperatures at once.
+
+    NumPy arrays and buffers (array.array, memoryview) are converted in one
+    vectorized multiply-add on the NumPy backend and returned as a float64
+    NumPy array. Any other input, or any input without NumPy, gives a list.
+
+    Raises:
+        ValueError: If either unit is not C, F or K.
+    """
+    scale, offset = _temperature_affine(from_unit, to_unit)
+    if _is_numpy_input(values):
+        result = _as_numpy(values).astype(np.float64)
+        if scale != 1.0:
+            result *= scale
+        result += offset
+        return result
+    return list(map(get_converter(from_unit, to_unit), _as_sequence(values)))
+
+
+# --- Random Streams ---
+# Maps byte 6 of a little-endian double to 0xF_ plus its random low nibble;
+# with byte 7 set to 0x3F, 8 random bytes become a double in [1, 2).
+_UNIT_MANTISSA_TABLE = bytes((x & 0x0F) | 0xF0 for x in range(256))
+
+
+class RandomStream:
+    """
+    Seeded, splittable source of random floats generated in bulk.
+
+    With NumPy (and the "auto" backend) a stream is a PCG64 generator
+    seeded from a SeedSequence; otherwise it is a random.Random seeded by
+    hashing the same seed and spawn key. The same seed always reproduces
+    the same values on the same backend (the two backends differ).
+
+    spawn(n) returns n statistically independent child streams for
+    parallel workers. Each child depends only on the parent's seed and
+    its spawn position, so results do not depend on scheduling:
+
+        streams = RandomStream(seed=42).spawn(workers)
+        partials = [s.sample_stats(n // workers) for s in streams]  # in workers
+        total = partials[0]
+        for part in partials[1:]:
+            total.merge(part)
+    """
+
+    def __init__(self, seed: Optional[int] = None, _spawn_key: Tuple[int, ...] = ()):
+        self.seed = random.SystemRandom().getrandbits(128) if seed is None else seed
+        self.spawn_key = _spawn_key
+        self._spawned = 0
+        digest = hashlib.blake2b(repr((self.seed, self.spawn_key)).encode(),
+                                 digest_size=16).digest()
+        self._int_seed = int.from_bytes(digest, "big")
+        if np is not None and _stats_backend == "auto":
+            sequence = np.random.SeedSequence(self.seed, spawn_key=self.spawn_key)
+            self._generator = np.random.Generator(np.random.PCG64(sequence))
+            self._random = None
+        else:
+            self._generator = None
+            self._random = random.Random(self._int_seed)
+
+    @property
+    def backend(self) -> str:
+        return "python" if self._generator is None else "numpy"
+
+    def spawn(self, n: int) -> List["RandomStream"]:
+        """Return n new independent child streams (never repeats earlier children)."""
+        children = [RandomStream(self.seed, self.spawn_key + (self._spawned + i,))
+                    for i in range(n)]
+        self._spawned += n
+        return children
+
+    def fill_uniform(self, out: Any, low: float = 0.0, high: float = 1.0) -> Any:
+        """
+        Fill a writable float64 buffer (array.array('d'), NumPy array,
+        memoryview) with uniform values in [low, high) and return it.
+        Non-contiguous NumPy arrays are filled in place through their strides.
+        """
+        low, scale = float(low), float(high - low)
+        if self._generator is not None:
+            target = np.asarray(out)
+            if target.flags.c_contiguous:
+                self._generator.random(out=target)
+            else:
+                target[...] = self._generator.random(target.shape)
+            if scale != 1.0:
+                target *= scale
+            if low:
+                target += low
+            return out
+
+        view = memoryview(out).cast('B').cast('d')
+        n = len(view)
+        if sys.byteorder == "little":
+            # 52 random mantissa bits per value from one randbytes call
+            raw = bytearray(self._random.randbytes(8 * n))
+            raw[6::8] = raw[6::8].translate(_UNIT_MANTISSA_TABLE)
+            raw[7::8] = b"\x3f" * n
+            units = memoryview(raw).cast('d')  # values in [1, 2)
+            shift = low - scale
+            view[:] = array.array('d', map(shift.__add__, map(scale.__mul__, units)))
+        else:
+            uniform = self._random.uniform
+            view[:] = array.array('d', map(uniform, repeat(low, n), repeat(high, n)))
+        return out
+
+    def uniform(self, size: int, low: float = 0.0, high: float = 1.0) -> Any:
+        """
+        New buffer of size uniform values in [low, high): a float64 NumPy
+        array on the NumPy backend, array.array('d') otherwise.
+        """
+        if self._generator is not None:
+            out = np.empty(size, dtype=np.float64)
+        else:
+            out = array.array('d', bytes(8 * size))
+        return self.fill_uniform(out, low, high)
+
+    def sample_stats(self, size: int, low: float = 0.0, high: float = 1.0,
+                     chunk_size: int = 1 << 20, quantiles: bool = True) -> "RunningStats":
+        """
+        Statistics of size uniform draws without materializing the sample.
+
+        Values are generated into one reused chunk buffer and folded into a
+        RunningStats chunk by chunk, so memory stays at chunk_size values
+        even for 1e8 samples.
+        """
+        stats = RunningStats(quantiles=quantiles, seed=self._int_seed)
+        buffer = self.uniform(min(size, chunk_size), low, high)
+        remaining = size
+        while remaining > 0:
+            n = min(remaining, len(buffer))
+            chunk = buffer if n == len(buffer) else buffer[:n]
+            stats.update_chunk(chunk)
+            remaining -= n
+            if remaining > 0:
+                self.fill_uniform(buffer, low, high)
+        return stats
 
 
 # --- Random and Statistical Demo Tools ---
-def generate_random_stats(sample_size: int = 10) -> Dict[str, Union[List[float], float]]:
+def generate_random_stats(sample_size: int = 10,
+                          seed: Optional[int] = None) -> Dict[str, Union[List[float], float]]:
     """
     Generate random sample data and return basic descriptive statistics.
+
+    The sample is drawn in bulk from a RandomStream (pass seed for a
+    reproducible sample) and the statistics come from a single RunningStats
+    pass, except the median, which is always exact (by selection).
     """
-    numbers = [random.uniform(1, 100) for _ in range(sample_size)]
-    return {
-        "numbers": numbers,
-        "average": calculate_average(numbers),
-        "median": calculate_median(numbers),
-        "standard_deviation": calculate_standard_deviation(numbers),
-        "min": min(numbers),
-        "max": max(numbers),
-    }
+    sample = RandomStream(seed).uniform(sample_size, 1, 100)
+    stats = RunningStats(quantiles=False)
+    stats.update_chunk(sample)
+    numbers = sample.tolist()
+    summary = stats.as_dict()
+    del summary["count"]
+    summary["median"] = calculate_median(sample)
+    return {"numbers": numbers, **summary}
 
 
 def display_math_constants() -> Dict[str, float]:
@@ -192,4 +1277,7 @@ if __name__ == "__main__":
     print(f"Is 17 prime? {'Yes' if is_prime(17) else 'No'}")
     print(f"25°C in Fahrenheit: {convert_temperature(25, 'C', 'F'):.2f}°F")
     print(f"Circle area (r=5): {calculate_circle_area(5):.2f}")
+    stream = RunningStats().consume(random.gauss(50, 10) for _ in range(100_000))
+    print(f"Streaming stats (100k samples): mean={stream.mean:.2f}, "
+          f"stdev={stream.standard_deviation:.2f}, p95≈{stream.quantile(0.95):.2f}")
     print(f"Constants: {display_math_constants()}")